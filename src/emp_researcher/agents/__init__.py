@@ -1,19 +1,43 @@
-"""Agents module."""
-
-from .coordinator import CoordinatorAgent, Step, TodoItem
-from .evaluator import EvaluatorAgent
-from .query_rewriter import QueryRewriterAgent
-from .reporter import ReporterAgent
-from .synthesizer import SynthesizerAgent
-from .web_searcher import WebSearcherAgent
-
-__all__ = [
-    "CoordinatorAgent",
-    "Step",
-    "TodoItem",
-    "EvaluatorAgent",
-    "QueryRewriterAgent",
-    "ReporterAgent",
-    "SynthesizerAgent",
-    "WebSearcherAgent",
-]
+"""Agents module.
+
+Agent modules are imported on first attribute access (PEP 562).
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .coordinator import CoordinatorAgent, Step, TodoItem
+    from .evaluator import EvaluatorAgent
+    from .query_rewriter import QueryRewriterAgent
+    from .reporter import ReporterAgent
+    from .synthesizer import SynthesizerAgent
+    from .web_searcher import WebSearcherAgent
+
+_LAZY_IMPORTS = {
+    "CoordinatorAgent": ".coordinator",
+    "Step": ".coordinator",
+    "TodoItem": ".coordinator",
+    "EvaluatorAgent": ".evaluator",
+    "QueryRewriterAgent": ".query_rewriter",
+    "ReporterAgent": ".reporter",
+    "SynthesizerAgent": ".synthesizer",
+    "WebSearcherAgent": ".web_searcher",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public agent on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,46 +1,59 @@
 """Coordinator Agent for orchestrating research tasks."""
 
 import asyncio
-import uuid
-from datetime import datetime
+import secrets
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
 from ..models import TaskStatus
 from ..services import LLMRouter
 
+TODOLIST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "todos": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "description": {"type": "string"},
+                    "priority": {"type": "integer"},
+                },
+                "required": ["description", "priority"],
+            },
+        },
+    },
+    "required": ["todos"],
+}
+
 
+@dataclass(slots=True)
 class Step:
     """Research workflow step."""
 
-    def __init__(
-        self,
-        name: str,
-        description: str,
-        agent: str,
-        status: str = "pending",
-    ):
-        """Initialize workflow step.
-
-        Args:
-            name: Step name
-            description: Step description
-            agent: Responsible agent
-            status: Step status (pending, running, completed, failed)
-        """
-        self.name = name
-        self.description = description
-        self.agent = agent
-        self.status = status
-        self.result: Any = None
-        self.error: str | None = None
-        self.started_at: datetime | None = None
-        self.completed_at: datetime | None = None
+    name: str
+    description: str
+    agent: str
+    status: str = "pending"
+    result: Any = field(default=None, init=False)
+    error: str | None = field(default=None, init=False)
+    started_at: float | None = field(default=None, init=False)
+    completed_at: float | None = field(default=None, init=False)
+
+    @property
+    def duration_s(self) -> float | None:
+        """Elapsed seconds between start and completion, if both are known."""
+        if self.started_at is None or self.completed_at is None:
+            return None
+        return self.completed_at - self.started_at
 
     def start(self) -> None:
         """Mark step as started."""
         self.status = "running"
-        self.started_at = datetime.now()
+        self.started_at = time.monotonic()
 
     def complete(self, result: Any) -> None:
         """Mark step as completed.
@@ -50,7 +63,7 @@ class Step:
         """
         self.status = "completed"
         self.result = result
-        self.completed_at = datetime.now()
+        self.completed_at = time.monotonic()
 
     def fail(self, error: str) -> None:
         """Mark step as failed.
@@ -60,28 +73,19 @@ class Step:
         """
         self.status = "failed"
         self.error = error
-        self.completed_at = datetime.now()
+        self.completed_at = time.monotonic()
 
 
+@dataclass(slots=True)
 class TodoItem:
     """Research todo item."""
 
-    def __init__(
-        self,
-        description: str,
-        priority: int = 0,
-    ):
-        """Initialize todo item.
-
-        Args:
-            description: Todo description
-            priority: Priority (higher = more important)
-        """
-        self.id = str(uuid.uuid4())
-        self.description = description
-        self.priority = priority
-        self.status = "pending"
-        self.created_at = datetime.now()
+    description: str
+    priority: int = 0
+    id: str = field(default_factory=lambda: secrets.token_hex(16), init=False)
+    status: str = field(default="pending", init=False)
+    error: str | None = field(default=None, init=False)
+    created_at: float = field(default_factory=time.time, init=False)
 
     def mark_in_progress(self) -> None:
         """Mark todo as in progress."""
@@ -104,18 +108,22 @@ class TodoItem:
 class CoordinatorAgent:
     """Coordinates multi-agent research workflow."""
 
-    def __init__(self, llm_router: LLMRouter):
+    def __init__(self, llm_router: LLMRouter, max_concurrency: int = 4):
         """Initialize coordinator agent.
 
         Args:
             llm_router: LLM routing service
+            max_concurrency: Maximum todos executed concurrently
         """
         self.llm_router = llm_router
+        self.max_concurrency = max_concurrency
         self.task_id: str | None = None
         self.query: str | None = None
         self.todolist: list[TodoItem] = []
         self.steps: list[Step] = []
         self.status = TaskStatus.PENDING
+        self._completed_count = 0
+        self._failed_count = 0
 
     async def create_task(
         self,
@@ -131,7 +139,7 @@ class CoordinatorAgent:
         Returns:
             Task ID
         """
-        self.task_id = str(uuid.uuid4())
+        self.task_id = secrets.token_hex(16)
         self.query = query
         self.status = TaskStatus.PENDING
 
@@ -150,40 +158,32 @@ class CoordinatorAgent:
             query: Research query
             depth: Research depth level
         """
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a research planner. Break down research queries into a list of specific todo items.",
-            },
-            {
-                "role": "user",
-                "content": f"Create a todolist for researching: {query}\n\nDepth: {depth}\n\nReturn a JSON list of todo items with 'description' and 'priority' (0-10).",
-            },
-        ]
-
-        response = await self.llm_router.route_chat(
-            messages=messages,
+        result = await self.llm_router.ask_json(
+            system="You are a research planner. Break down research queries into a list of specific todo items.",
+            user=f"Create a todolist for researching: {query}\n\nDepth: {depth}\n\nReturn a JSON object with key 'todos': a list of todo items with 'description' and 'priority' (0-10).",
             task_type="coordinator_planning",
+            schema=TODOLIST_SCHEMA,
         )
 
-        try:
-            import json
+        self._completed_count = 0
+        self._failed_count = 0
 
-            todos = json.loads(response.choices[0].message.content)
-            self.todolist = [
-                TodoItem(
-                    description=item.get("description", ""),
-                    priority=item.get("priority", 5),
-                )
-                for item in todos
-            ]
-        except Exception as e:
+        if not isinstance(result, dict):
             self.todolist = [
                 TodoItem(
                     description=f"Research: {query}",
                     priority=10,
                 )
             ]
+            return
+
+        self.todolist = [
+            TodoItem(
+                description=item.get("description", ""),
+                priority=item.get("priority", 5),
+            )
+            for item in result.get("todos", [])
+        ]
 
     async def execute_workflow(self) -> dict[str, Any]:
         """Execute research workflow.
@@ -192,55 +192,97 @@ class CoordinatorAgent:
             Workflow execution results
         """
         self.status = TaskStatus.RUNNING
+        self._completed_count = 0
+        self._failed_count = 0
+        total = len(self.todolist)
 
         results = {
             "task_id": self.task_id,
             "query": self.query,
             "steps_completed": 0,
-            "total_steps": len(self.todolist),
+            "total_steps": total,
             "sources_found": 0,
             "progress": 0.0,
         }
 
-        for i, todo in enumerate(self.todolist):
-            todo.mark_in_progress()
-
-            step = Step(
+        steps = [
+            Step(
                 name=f"Step {i + 1}",
                 description=todo.description,
                 agent="coordinator",
             )
+            for i, todo in enumerate(self.todolist)
+        ]
+        self.steps.extend(steps)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        await asyncio.gather(
+            *(
+                self._run_one(todo, step, semaphore, results)
+                for todo, step in zip(self.todolist, steps, strict=True)
+            ),
+            return_exceptions=True,
+        )
+
+        if self._failed_count == 0:
+            self.status = TaskStatus.COMPLETED
+        else:
+            self.status = TaskStatus.FAILED
+
+        return results
+
+    async def _run_one(
+        self,
+        todo: TodoItem,
+        step: Step,
+        semaphore: asyncio.Semaphore,
+        results: dict[str, Any],
+    ) -> None:
+        """Execute one todo under the concurrency limit and record its outcome.
+
+        Args:
+            todo: Todo item to execute
+            step: Workflow step tracking the todo
+            semaphore: Semaphore bounding concurrent LLM calls
+            results: Shared workflow results updated on completion
+        """
+        async with semaphore:
+            todo.mark_in_progress()
             step.start()
 
             try:
-                result = await self._execute_todo(todo)
-                step.complete(result)
+                response = await self.llm_router.route_chat(
+                    self._todo_messages(todo),
+                    task_type="coordinator_planning",
+                )
+                answer = response.choices[0].message.content or ""
+                step.complete(
+                    {
+                        "description": todo.description,
+                        "answer": answer,
+                        "answer_preview": answer[:200],
+                    }
+                )
                 todo.complete()
+                self._completed_count += 1
             except Exception as e:
                 step.fail(str(e))
                 todo.fail(str(e))
+                self._failed_count += 1
 
-            self.steps.append(step)
-            results["steps_completed"] = i + 1
-            results["progress"] = (i + 1) / len(self.todolist) * 100
-
-        if all(todo.status == "completed" for todo in self.todolist):
-            self.status = TaskStatus.COMPLETED
-        else:
-            self.status = TaskStatus.FAILED
-
-        return results
+        results["steps_completed"] += 1
+        results["progress"] = results["steps_completed"] / len(self.todolist) * 100
 
-    async def _execute_todo(self, todo: TodoItem) -> Any:
-        """Execute a single todo item.
+    def _todo_messages(self, todo: TodoItem) -> list[dict[str, Any]]:
+        """Build the chat messages for executing a todo item.
 
         Args:
             todo: Todo item to execute
 
         Returns:
-            Execution result
+            Chat messages
         """
-        messages = [
+        return [
             {
                 "role": "system",
                 "content": "You are a research assistant. Answer questions comprehensively.",
@@ -251,30 +293,21 @@ class CoordinatorAgent:
             },
         ]
 
-        response = await self.llm_router.route_chat(
-            messages=messages,
-            task_type="coordinator_planning",
-        )
-
-        return {
-            "description": todo.description,
-            "answer": response.choices[0].message.content,
-        }
-
     def get_status(self) -> dict[str, Any]:
         """Get current task status.
 
         Returns:
             Status dictionary
         """
-        completed = sum(1 for todo in self.todolist if todo.status == "completed")
+        completed = self._completed_count
         total = len(self.todolist)
+        current = next((todo for todo in self.todolist if todo.status == "in_progress"), None)
 
         return {
             "task_id": self.task_id,
             "status": self.status,
             "progress": (completed / total * 100) if total > 0 else 0,
-            "current_step": self.todolist[completed].description if completed < total else None,
+            "current_step": current.description if current is not None else None,
             "total_steps": total,
             "completed_steps": completed,
         }
@@ -285,19 +318,8 @@ class CoordinatorAgent:
         Returns:
             Report dictionary
         """
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a report writer. Synthesize research into a structured report.",
-            },
-            {
-                "role": "user",
-                "content": f"Based on the following research results, generate a comprehensive report:\n\n{self._format_results()}\n\nInclude sections: Summary, Key Findings, Sources.",
-            },
-        ]
-
         response = await self.llm_router.route_chat(
-            messages=messages,
+            messages=self._report_messages(),
             task_type="final_report_generation",
         )
 
@@ -308,16 +330,46 @@ class CoordinatorAgent:
             "status": self.status,
         }
 
+    async def stream_report(self) -> AsyncIterator[str]:
+        """Stream the final research report as it is generated.
+
+        Yields:
+            Report content fragments
+        """
+        async for text in self.llm_router.route_chat_stream(
+            messages=self._report_messages(),
+            task_type="final_report_generation",
+        ):
+            yield text
+
+    def _report_messages(self) -> list[dict[str, Any]]:
+        """Build the chat messages for final report generation.
+
+        Returns:
+            Chat messages
+        """
+        return [
+            {
+                "role": "system",
+                "content": "You are a report writer. Synthesize research into a structured report.",
+            },
+            {
+                "role": "user",
+                "content": f"Based on the following research results, generate a comprehensive report:\n\n{self._format_results()}\n\nInclude sections: Summary, Key Findings, Sources.",
+            },
+        ]
+
     def _format_results(self) -> str:
         """Format execution results for LLM.
 
         Returns:
             Formatted results string
         """
-        lines = []
-        for step in self.steps:
-            lines.append(f"- {step.description}")
-            if step.result:
-                lines.append(f"  Result: {step.result.get('answer', '')[:200]}...")
-
-        return "\n".join(lines)
+        return "\n".join(
+            (
+                f"- {step.description}\n  Result: {step.result.get('answer_preview', '')}..."
+                if step.result
+                else f"- {step.description}"
+            )
+            for step in self.steps
+        )
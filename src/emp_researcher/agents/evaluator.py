@@ -5,6 +5,27 @@ from typing import Any
 
 from ..services import LLMRouter
 
+CONSISTENCY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "contradictions": {"type": "array", "items": {"type": "string"}},
+        "gaps": {"type": "array", "items": {"type": "string"}},
+        "divergent_claims": {"type": "array", "items": {"type": "string"}},
+        "consistency_score": {"type": "number"},
+    },
+    "required": ["contradictions", "gaps", "divergent_claims", "consistency_score"],
+}
+
+REFLECTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "action": {"type": "string", "enum": ["search", "refine", "proceed"]},
+        "next_queries": {"type": "array", "items": {"type": "string"}},
+        "reason": {"type": "string"},
+    },
+    "required": ["action", "next_queries", "reason"],
+}
+
 
 class EvaluatorAgent:
     """Agent for evaluating research quality and triggering reflection."""
@@ -38,15 +59,27 @@ class EvaluatorAgent:
                 "score": 0.0,
             }
 
+        relevance_sum = 0.0
+        trust_sum = 0.0
+        languages = set()
+        source_types = set()
+
+        for source in sources:
+            relevance_sum += source.get("relevance_score", 0)
+            trust_sum += source.get("trust_score", 0)
+            languages.add(source.get("language", "unknown"))
+            source_types.add(source.get("source_type", "unknown"))
+
+        total = len(sources)
         metrics = {
-            "total_sources": len(sources),
-            "avg_relevance": sum(s.get("relevance_score", 0) for s in sources) / len(sources),
-            "avg_trust": sum(s.get("trust_score", 0) for s in sources) / len(sources),
-            "languages": list(set(s.get("language", "unknown") for s in sources)),
-            "source_types": list(set(s.get("source_type", "unknown") for s in sources)),
+            "total_sources": total,
+            "avg_relevance": relevance_sum / total,
+            "avg_trust": trust_sum / total,
+            "languages": list(languages),
+            "source_types": list(source_types),
         }
 
-        coverage_score = min(len(sources) / 10, 1.0)
+        coverage_score = min(total / 10, 1.0)
 
         overall_score = (
             metrics["avg_relevance"] * 0.4 + metrics["avg_trust"] * 0.3 + coverage_score * 0.3
@@ -71,14 +104,9 @@ class EvaluatorAgent:
         Returns:
             Consistency analysis
         """
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a fact-checking specialist. Identify inconsistencies and conflicts in information from multiple sources.",
-            },
-            {
-                "role": "user",
-                "content": f"""Check consistency across these {len(sources)} sources:
+        result = await self.llm_router.ask_json(
+            system="You are a fact-checking specialist. Identify inconsistencies and conflicts in information from multiple sources.",
+            user=f"""Check consistency across these {len(sources)} sources:
 
 {chr(10).join([f"{i + 1}. {s.get('title', '')[:100]}..." for i, s in enumerate(sources)])}
 
@@ -88,33 +116,20 @@ Identify:
 3. Divergent claims: Different versions of the same fact
 
 Return JSON with keys: contradictions (list), gaps (list), divergent_claims (list), consistency_score (float 0-1).""",
-            },
-        ]
-
-        response = await self.llm_router.route_chat(
-            messages=messages,
             task_type="coordinator_planning",
+            schema=CONSISTENCY_SCHEMA,
+            default={},
         )
+        if not isinstance(result, dict):
+            result = {}
 
-        try:
-            import json
-
-            result = json.loads(response.choices[0].message.content)
-            return {
-                "status": "checked",
-                "contradictions": result.get("contradictions", []),
-                "gaps": result.get("gaps", []),
-                "divergent_claims": result.get("divergent_claims", []),
-                "consistency_score": result.get("consistency_score", 0.8),
-            }
-        except Exception:
-            return {
-                "status": "checked",
-                "contradictions": [],
-                "gaps": [],
-                "divergent_claims": [],
-                "consistency_score": 0.8,
-            }
+        return {
+            "status": "checked",
+            "contradictions": result.get("contradictions", []),
+            "gaps": result.get("gaps", []),
+            "divergent_claims": result.get("divergent_claims", []),
+            "consistency_score": result.get("consistency_score", 0.8),
+        }
 
     async def should_expand_search(
         self,
@@ -153,14 +168,9 @@ Return JSON with keys: contradictions (list), gaps (list), divergent_claims (lis
         Returns:
             Reflection with recommendations
         """
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a research coordinator. Reflect on current progress and recommend next actions.",
-            },
-            {
-                "role": "user",
-                "content": f"""Current progress:
+        result = await self.llm_router.ask_json(
+            system="You are a research coordinator. Reflect on current progress and recommend next actions.",
+            user=f"""Current progress:
 - Query: {current_state.get("query", "")}
 - Sources found: {evaluation.get("metrics", {}).get("total_sources", 0)}
 - Overall score: {evaluation.get("overall_score", 0):.2f}
@@ -172,26 +182,15 @@ Recommend next steps:
 3. Should we proceed to synthesis? (sufficient information)
 
 Return JSON with keys: action (search/refine/proceed), next_queries (list), reason (string).""",
-            },
-        ]
-
-        response = await self.llm_router.route_chat(
-            messages=messages,
             task_type="coordinator_planning",
+            schema=REFLECTION_SCHEMA,
+            default={"reason": "Information appears sufficient"},
         )
+        if not isinstance(result, dict):
+            result = {"reason": "Information appears sufficient"}
 
-        try:
-            import json
-
-            result = json.loads(response.choices[0].message.content)
-            return {
-                "action": result.get("action", "proceed"),
-                "next_queries": result.get("next_queries", []),
-                "reason": result.get("reason", "Information sufficient"),
-            }
-        except Exception:
-            return {
-                "action": "proceed",
-                "next_queries": [],
-                "reason": "Information appears sufficient",
-            }
+        return {
+            "action": result.get("action", "proceed"),
+            "next_queries": result.get("next_queries", []),
+            "reason": result.get("reason", "Information sufficient"),
+        }
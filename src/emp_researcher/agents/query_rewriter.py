@@ -4,17 +4,31 @@ from typing import Any
 
 from ..services import LLMRouter
 
+REWRITE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "intent": {"type": "string"},
+        "sub_queries": {"type": "array", "items": {"type": "string"}},
+        "keywords": {"type": "array", "items": {"type": "string"}},
+        "strategy": {"type": "object"},
+    },
+    "required": ["intent", "sub_queries", "keywords", "strategy"],
+}
+
 
 class QueryRewriterAgent:
     """Agent for query rewriting and intent understanding."""
 
-    def __init__(self, llm_router: LLMRouter):
+    def __init__(self, llm_router: LLMRouter, translation_cache_size: int = 1024):
         """Initialize query rewriter agent.
 
         Args:
             llm_router: LLM routing service
+            translation_cache_size: Maximum number of memoized translations
         """
         self.llm_router = llm_router
+        self.translation_cache_size = translation_cache_size
+        self._translation_cache: dict[tuple[str, str], str] = {}
 
     async def rewrite_query(
         self,
@@ -32,14 +46,9 @@ class QueryRewriterAgent:
         Returns:
             Dictionary with rewritten queries and keywords
         """
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a query rewriting specialist. Analyze the user's research query and generate optimized search queries.",
-            },
-            {
-                "role": "user",
-                "content": f"""Original query: {query}
+        result = await self.llm_router.ask_json(
+            system="You are a query rewriting specialist. Analyze the user's research query and generate optimized search queries.",
+            user=f"""Original query: {query}
 Language: {language or "auto"}
 Research depth: {depth}
 
@@ -50,26 +59,11 @@ Please analyze and provide:
 4. Search strategy: Suggested search engines and filters
 
 Return JSON with keys: intent, sub_queries (list), keywords (list), strategy (dict).""",
-            },
-        ]
-
-        response = await self.llm_router.route_chat(
-            messages=messages,
             task_type="query_rewrite",
+            schema=REWRITE_SCHEMA,
         )
 
-        try:
-            import json
-
-            result = json.loads(response.choices[0].message.content)
-            return {
-                "original_query": query,
-                "intent": result.get("intent", ""),
-                "sub_queries": result.get("sub_queries", []),
-                "keywords": result.get("keywords", []),
-                "strategy": result.get("strategy", {}),
-            }
-        except Exception:
+        if not isinstance(result, dict):
             return {
                 "original_query": query,
                 "intent": "General research",
@@ -78,6 +72,14 @@ Return JSON with keys: intent, sub_queries (list), keywords (list), strategy (di
                 "strategy": {},
             }
 
+        return {
+            "original_query": query,
+            "intent": result.get("intent", ""),
+            "sub_queries": result.get("sub_queries", []),
+            "keywords": result.get("keywords", []),
+            "strategy": result.get("strategy", {}),
+        }
+
     async def translate_query(
         self,
         query: str,
@@ -92,6 +94,10 @@ Return JSON with keys: intent, sub_queries (list), keywords (list), strategy (di
         Returns:
             Translated query
         """
+        key = (query, target_lang)
+        if key in self._translation_cache:
+            return self._translation_cache[key]
+
         messages = [
             {
                 "role": "system",
@@ -108,7 +114,13 @@ Return JSON with keys: intent, sub_queries (list), keywords (list), strategy (di
             task_type="bilingual_translation",
         )
 
-        return response.choices[0].message.content
+        translated = response.choices[0].message.content
+
+        if len(self._translation_cache) >= self.translation_cache_size:
+            self._translation_cache.pop(next(iter(self._translation_cache)))
+        self._translation_cache[key] = translated
+
+        return translated
 
     async def generate_search_plan(
         self,
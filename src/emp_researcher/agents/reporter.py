@@ -1,8 +1,12 @@
 """Reporter Agent for report generation."""
 
+import asyncio
 from datetime import datetime
 from typing import Any
 
+import markdown
+import orjson
+
 from ..services import LLMRouter
 
 
@@ -37,30 +41,18 @@ class ReporterAgent:
         Returns:
             Complete report with content and metadata
         """
-        synthesized_sections = []
-
-        for i, section in enumerate(sections):
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a technical report writer. Write comprehensive research sections.",
-                },
-                {
-                    "role": "user",
-                    "content": f"""Section: {section['title']}
-Description: {section.get('description', '')}
-
-All sources ({len(sources)} total):
-{chr(10).join([f'{i+1}. [{s.get("source_type", "unknown")}] {s.get("title", "")[:50]}...' for i, s in enumerate(sources)])}
-
-Write a detailed section (400-600 words).""",
-                },
-            ]
-
-            response = await self.llm_router.route_chat(
-                messages=messages,
+        responses, summary = await asyncio.gather(
+            self.llm_router.route_chat_batch(
+                [self._section_messages(section, sources) for section in sections],
                 task_type="final_report_generation",
-            )
+            ),
+            self._generate_summary(query, sections, sources),
+        )
+
+        synthesized_sections = []
+        for i, (section, response) in enumerate(zip(sections, responses, strict=True)):
+            if isinstance(response, Exception):
+                raise response
 
             synthesized_sections.append(
                 {
@@ -70,12 +62,8 @@ Write a detailed section (400-600 words).""",
                 }
             )
 
-        summary = await self._generate_summary(query, synthesized_sections, sources)
-
-        formatted_sources = self._format_sources(sources)
-
         report_content = await self._format_report(
-            query, summary, synthesized_sections, formatted_sources, output_format
+            query, summary, synthesized_sections, sources, output_format
         )
 
         return {
@@ -88,10 +76,41 @@ Write a detailed section (400-600 words).""",
                 "sections_count": len(sections),
                 "sources_count": len(sources),
                 "generated_at": datetime.now().isoformat(),
-                "languages": list(set(s.get("language", "unknown") for s in sources)),
+                "languages": list({s.get("language", "unknown") for s in sources}),
             },
         }
 
+    def _section_messages(
+        self,
+        section: dict[str, Any],
+        sources: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Build the chat messages for writing a report section.
+
+        Args:
+            section: Section definition with title and description
+            sources: List of information sources
+
+        Returns:
+            Chat messages
+        """
+        return [
+            {
+                "role": "system",
+                "content": "You are a technical report writer. Write comprehensive research sections.",
+            },
+            {
+                "role": "user",
+                "content": f"""Section: {section['title']}
+Description: {section.get('description', '')}
+
+All sources ({len(sources)} total):
+{chr(10).join([f'{i+1}. [{s.get("source_type", "unknown")}] {s.get("title", "")[:50]}...' for i, s in enumerate(sources)])}
+
+Write a detailed section (400-600 words).""",
+            },
+        ]
+
     async def _generate_summary(
         self,
         query: str,
@@ -102,7 +121,7 @@ Write a detailed section (400-600 words).""",
 
         Args:
             query: Research query
-            sections: Synthesized sections
+            sections: Report sections (only titles are used)
             sources: Information sources
 
         Returns:
@@ -147,33 +166,35 @@ Create a 200-300 word executive summary with:
         Returns:
             Formatted sources string
         """
-        lines = ["## References\n"]
-        for i, source in enumerate(sources, 1):
-            lines.append(
-                f"{i}. **{source.get('title', 'Untitled')}**\n"
-                f"   - URL: {source.get('url', '')}\n"
-                f"   - Source: {source.get('engine', source.get('source_type', 'unknown'))}\n"
-                f"   - Language: {source.get('language', 'unknown')}\n"
-                f"   - Relevance: {source.get('relevance_score', 0):.2f}\n"
-            )
+        entries = (
+            f"{i}. **{source.get('title', 'Untitled')}**\n"
+            f"   - URL: {source.get('url', '')}\n"
+            f"   - Source: {source.get('engine', source.get('source_type', 'unknown'))}\n"
+            f"   - Language: {source.get('language', 'unknown')}\n"
+            f"   - Relevance: {source.get('relevance_score', 0):.2f}\n"
+            for i, source in enumerate(sources, 1)
+        )
 
-        return "\n".join(lines)
+        return "\n".join(("## References\n", *entries))
 
     async def _format_report(
         self,
         query: str,
         summary: str,
         sections: list[dict[str, Any]],
-        sources: str,
+        sources: list[dict[str, Any]],
         output_format: str,
     ) -> str:
         """Format complete report.
 
+        Markdown, HTML and JSON are rendered locally; other formats are
+        converted from markdown by the LLM.
+
         Args:
             query: Research query
             summary: Executive summary
             sections: Synthesized sections
-            sources: Formatted sources
+            sources: Information sources
             output_format: Output format
 
         Returns:
@@ -181,8 +202,24 @@ Create a 200-300 word executive summary with:
         """
         sorted_sections = sorted(sections, key=lambda x: x.get("order", 0))
 
+        if output_format == "json":
+            return orjson.dumps(
+                {
+                    "query": query,
+                    "summary": summary,
+                    "sections": sorted_sections,
+                    "sources": sources,
+                }
+            ).decode()
+
+        body = "".join(f"## {s['title']}\n\n{s['content']}\n\n" for s in sorted_sections)
+        report = f"# {query}\n\n{summary}\n\n{body}{self._format_sources(sources)}"
+
         if output_format == "markdown":
-            return f"# {query}\n\n{summary}\n\n{''.join([f'## {s[\"title\"]}\n\n{s[\"content\"]}\n\n' for s in sorted_sections])}{sources}"
+            return report
+
+        if output_format == "html":
+            return markdown.markdown(report, extensions=["tables", "fenced_code"])
 
         messages = [
             {
@@ -191,11 +228,7 @@ Create a 200-300 word executive summary with:
             },
             {
                 "role": "user",
-                "content": f"""Convert this markdown report to {output_format}:
-# {query}
-{summary}
-{''.join([f'## {s[\"title\"]}\\n{s[\"content\"]}\\n' for s in sorted_sections])}
-{sources}""",
+                "content": f"Convert this markdown report to {output_format}:\n{report}",
             },
         ]
 
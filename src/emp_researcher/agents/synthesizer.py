@@ -1,9 +1,51 @@
 """Synthesizer Agent for information aggregation."""
 
+from operator import itemgetter
 from typing import Any
 
 from ..services import LLMRouter
 
+THEMES_CLUSTERS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "themes": {"type": "array", "items": {"type": "string"}},
+        "clusters": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "theme": {"type": "string"},
+                    "findings": {"type": "array", "items": {"type": "integer"}},
+                },
+                "required": ["theme", "findings"],
+            },
+        },
+    },
+    "required": ["themes", "clusters"],
+}
+
+_THEMES_AND_CLUSTERS_SYSTEM_PROMPT = (
+    "You are a research analyst. Identify 3-5 key themes from research findings "
+    "and cluster the findings into them."
+)
+_COMPARISON_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a comparative analyst. Create comparison tables.",
+}
+
+
+def _render_findings(findings: list[dict[str, Any]], limit: int) -> str:
+    """Render findings as a numbered list of truncated contents.
+
+    Args:
+        findings: List of research findings
+        limit: Maximum characters of content per finding
+
+    Returns:
+        Newline-separated numbered findings
+    """
+    return "\n".join(f"{i}. {f.get('content', '')[:limit]}..." for i, f in enumerate(findings, 1))
+
 
 class SynthesizerAgent:
     """Agent for aggregating and synthesizing information."""
@@ -33,9 +75,7 @@ class SynthesizerAgent:
         if not findings:
             return {"status": "empty", "message": "No findings to synthesize"}
 
-        themes = await self._identify_themes(findings, query)
-
-        clustered = await self._cluster_findings(findings, themes)
+        themes, clustered = await self._identify_and_cluster(findings, query)
 
         synthesized = {
             "query": query,
@@ -47,94 +87,45 @@ class SynthesizerAgent:
 
         return synthesized
 
-    async def _identify_themes(
+    async def _identify_and_cluster(
         self,
         findings: list[dict[str, Any]],
         query: str,
-    ) -> list[str]:
-        """Identify key themes from findings.
+    ) -> tuple[list[str], list[dict[str, Any]]]:
+        """Identify key themes and cluster findings in a single LLM call.
 
         Args:
             findings: List of research findings
             query: Research query
 
         Returns:
-            List of theme names
+            Tuple of theme names and theme clusters
         """
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a research analyst. Identify 3-5 key themes from research findings.",
-            },
-            {
-                "role": "user",
-                "content": f"""Research query: {query}
+        result = await self.llm_router.ask_json(
+            system=_THEMES_AND_CLUSTERS_SYSTEM_PROMPT,
+            user=f"""Research query: {query}
 
 Findings ({len(findings)}):
-{chr(10).join([f"{i + 1}. {f.get('content', '')[:100]}..." for i, f in enumerate(findings)])}
-
-Identify 3-5 key themes that emerge from these findings.
-Return JSON array of theme names.""",
-            },
-        ]
+{_render_findings(findings, 150)}
 
-        response = await self.llm_router.route_chat(
-            messages=messages,
+Identify 3-5 key themes that emerge from these findings, then assign each finding to the most relevant theme.
+Return JSON with keys: themes (list of theme names), clusters (list of objects with keys: theme, findings (list of indices)).""",
             task_type="coordinator_planning",
+            schema=THEMES_CLUSTERS_SCHEMA,
+            default={},
         )
 
-        try:
-            import json
-
-            result = json.loads(response.choices[0].message.content)
-            return result if isinstance(result, list) else ["General Research"]
-        except Exception:
-            return ["General Research"]
-
-    async def _cluster_findings(
-        self,
-        findings: list[dict[str, Any]],
-        themes: list[str],
-    ) -> list[dict[str, Any]]:
-        """Cluster findings by themes.
-
-        Args:
-            findings: List of research findings
-            themes: List of identified themes
-
-        Returns:
-            List of theme clusters
-        """
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a data analyst. Cluster findings into themes.",
-            },
-            {
-                "role": "user",
-                "content": f"""Themes: {", ".join(themes)}
+        if not isinstance(result, dict):
+            return ["General Research"], []
 
-Findings to cluster ({len(findings)}):
-{chr(10).join([f"{i + 1}. {f.get('content', '')[:150]}..." for i, f in enumerate(findings)])}
+        themes = result.get("themes")
+        clusters = result.get("clusters")
 
-For each finding, assign to most relevant theme.
-Return JSON array of objects with keys: theme, findings (list of indices).""",
-            },
-        ]
-
-        response = await self.llm_router.route_chat(
-            messages=messages,
-            task_type="coordinator_planning",
+        return (
+            themes if isinstance(themes, list) and themes else ["General Research"],
+            clusters if isinstance(clusters, list) else [],
         )
 
-        try:
-            import json
-
-            result = json.loads(response.choices[0].message.content)
-            return result if isinstance(result, list) else []
-        except Exception:
-            return []
-
     def _calculate_confidence(self, clusters: list[dict[str, Any]]) -> float:
         """Calculate overall confidence score.
 
@@ -144,14 +135,16 @@ Return JSON array of objects with keys: theme, findings (list of indices).""",
         Returns:
             Confidence score 0-1
         """
-        if not clusters:
+        num_clusters = len(clusters)
+        if not num_clusters:
             return 0.0
 
-        total_findings = sum(len(c.get("findings", [])) for c in clusters)
-        avg_findings_per_theme = total_findings / len(clusters)
+        total_findings = 0
+        for cluster in clusters:
+            total_findings += len(cluster.get("findings", ()))
 
-        confidence = min(avg_findings_per_theme / 5, 1.0)
-        return round(confidence, 2)
+        confidence = total_findings / (5 * num_clusters)
+        return round(confidence if confidence < 1.0 else 1.0, 2)
 
     async def create_timeline(
         self,
@@ -165,19 +158,20 @@ Return JSON array of objects with keys: theme, findings (list of indices).""",
         Returns:
             Timeline of events/milestones
         """
-        timeline = []
+        timeline = [
+            {
+                "date": finding["date"],
+                "event": finding.get("content", "")[:200],
+                "source": finding.get("source", "unknown"),
+            }
+            for finding in findings
+            if finding.get("date")
+        ]
 
-        for finding in findings:
-            if finding.get("date"):
-                timeline.append(
-                    {
-                        "date": finding["date"],
-                        "event": finding.get("content", "")[:200],
-                        "source": finding.get("source", "unknown"),
-                    }
-                )
+        if len(timeline) > 1:
+            timeline.sort(key=itemgetter("date"))
 
-        return sorted(timeline, key=lambda x: x["date"])
+        return timeline
 
     async def create_comparison_table(
         self,
@@ -194,16 +188,13 @@ Return JSON array of objects with keys: theme, findings (list of indices).""",
             Comparison table structure
         """
         messages = [
-            {
-                "role": "system",
-                "content": "You are a comparative analyst. Create comparison tables.",
-            },
+            _COMPARISON_SYSTEM_MESSAGE,
             {
                 "role": "user",
                 "content": f"""Dimensions: {", ".join(dimensions)}
 
 Findings to compare ({len(findings)}):
-{chr(10).join([f"{i + 1}. {f.get('content', '')[:150]}..." for i, f in enumerate(findings)])}
+{_render_findings(findings, 150)}
 
 Create a comparison table in markdown format with:
 - Rows for each finding
@@ -1,10 +1,35 @@
 """Web Searcher Agent for web information retrieval."""
 
 import asyncio
+import re
+from collections import OrderedDict
+from itertools import chain
 from typing import Any
 
+import httpx
+
 from ..services import LLMRouter, SearXNGClient
 
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+_URL_RE = re.compile(r"https?://[^\s/?#]+", re.IGNORECASE)
+_CONTROL_CHARS_TABLE = str.maketrans("", "", "\r\x00\x0b\x0c")
+_SINGLE_LINE_TABLE = {**_CONTROL_CHARS_TABLE, ord("\n"): " "}
+
+TRANSLATIONS_SCHEMA = {
+    "type": "object",
+    "properties": {"translations": {"type": "array", "items": {"type": "string"}}},
+    "required": ["translations"],
+}
+
+_MAX_CONTENT_CHARS = 2000
+_MAX_CONTENT_BYTES = _MAX_CONTENT_CHARS * 4
+_TEXT_CONTENT_TYPES = ("text/", "application/xhtml", "application/xml", "application/json")
+
+
+def _has_cjk(text: str) -> bool:
+    """Check whether text contains CJK unified ideographs."""
+    return _CJK_RE.search(text) is not None
+
 
 class WebSearcherAgent:
     """Agent for web search operations."""
@@ -13,15 +38,33 @@ class WebSearcherAgent:
         self,
         llm_router: LLMRouter,
         searxng_client: SearXNGClient,
+        max_concurrency: int = 8,
+        fetch_concurrency: int = 16,
+        fetch_cache_size: int = 512,
+        translation_cache_size: int = 1024,
+        http_client: httpx.AsyncClient | None = None,
     ):
         """Initialize web searcher agent.
 
         Args:
             llm_router: LLM routing service
             searxng_client: SearXNG client
+            max_concurrency: Maximum concurrent SearXNG requests
+            fetch_concurrency: Maximum concurrent page fetches
+            fetch_cache_size: Maximum number of fetched pages kept in memory
+            translation_cache_size: Maximum number of memoized translations
+            http_client: Shared HTTP client for page fetches (optional)
         """
         self.llm_router = llm_router
         self.searxng_client = searxng_client
+        self._search_semaphore = asyncio.Semaphore(max_concurrency)
+        self._fetch_semaphore = asyncio.Semaphore(fetch_concurrency)
+        self._http = http_client
+        self._owns_http = http_client is None
+        self._fetch_cache_size = fetch_cache_size
+        self._fetched: OrderedDict[str, str] = OrderedDict()
+        self.translation_cache_size = translation_cache_size
+        self._translation_cache: dict[tuple[str, str], str] = {}
 
     async def search_web(
         self,
@@ -41,25 +84,38 @@ class WebSearcherAgent:
         Returns:
             Combined search results
         """
-        all_results = []
+        tasks = []
 
         for query in queries:
-            if any("\u4e00-\u9fff" in c for c in query):
-                results = await self.searxng_client.search(
-                    query,
-                    engines=engines_zh,
-                    language="zh",
-                )
+            if _has_cjk(query):
+                tasks.append(self._search_one(query, engines=engines_zh, language="zh"))
             else:
-                results = await self.searxng_client.search(
-                    query,
-                    engines=engines_en,
-                    language="en",
-                )
+                tasks.append(self._search_one(query, engines=engines_en, language="en"))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        return list(chain.from_iterable(r for r in results if not isinstance(r, Exception)))
 
-            all_results.extend(results)
+    async def _search_one(
+        self,
+        query: str,
+        engines: list[str] | None = None,
+        language: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run a single SearXNG search under the concurrency limit.
+
+        Args:
+            query: Search query
+            engines: Specific engines (optional)
+            language: Language filter (optional, client default if omitted)
+
+        Returns:
+            Search results
+        """
+        kwargs = {"language": language} if language else {}
 
-        return all_results
+        async with self._search_semaphore:
+            return await self.searxng_client.search(query, engines=engines, **kwargs)
 
     async def search_bilingual_parallel(
         self,
@@ -75,16 +131,39 @@ class WebSearcherAgent:
         Returns:
             Dictionary with zh and en results
         """
-        translated_query = await self._translate_for_bilingual(query)
+        return await self.search_bilingual_many([query], max_results)
+
+    async def search_bilingual_many(
+        self,
+        queries: list[str],
+        max_results: int = 30,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Perform parallel bilingual search for several queries.
+
+        All queries are translated with a single batched LLM call.
 
-        queries_zh = [query] if any("\u4e00-\u9fff" in c for c in query) else [translated_query]
-        queries_en = [query] if not any("\u4e00-\u9fff" in c for c in query) else [translated_query]
+        Args:
+            queries: Original queries
+            max_results: Maximum results per language
 
-        results_zh = await self._search_with_engines(
-            queries_zh, engines_zh=["baidu", "so", "google"]
+        Returns:
+            Dictionary with zh and en results
+        """
+        is_chinese = [_has_cjk(query) for query in queries]
+        translated = await self.translate_many(
+            [(query, "en" if zh else "zh") for query, zh in zip(queries, is_chinese, strict=True)]
         )
-        results_en = await self._search_with_engines(
-            queries_en, engines_en=["google", "bing", "duckduckgo"]
+
+        queries_zh = [
+            q if zh else t for q, t, zh in zip(queries, translated, is_chinese, strict=True)
+        ]
+        queries_en = [
+            t if zh else q for q, t, zh in zip(queries, translated, is_chinese, strict=True)
+        ]
+
+        results_zh, results_en = await asyncio.gather(
+            self._search_with_engines(queries_zh, engines=["baidu", "so", "google"]),
+            self._search_with_engines(queries_en, engines=["google", "bing", "duckduckgo"]),
         )
 
         return {
@@ -102,12 +181,72 @@ class WebSearcherAgent:
         Returns:
             Translated query
         """
-        is_chinese = any("\u4e00-\u9fff" in c for c in query)
+        target_lang = "en" if _has_cjk(query) else "zh"
+        translated = await self.translate_many([(query, target_lang)])
+        return translated[0]
+
+    async def translate_many(self, items: list[tuple[str, str]]) -> list[str]:
+        """Translate several texts with one LLM call.
+
+        Translations are memoized per (text, target_lang); only texts not
+        seen before are sent to the model.
+
+        Args:
+            items: List of (text, target_lang) pairs, target_lang being zh/en
+
+        Returns:
+            Translated texts in input order
+        """
+        pending = [key for key in dict.fromkeys(items) if key not in self._translation_cache]
 
-        if is_chinese:
-            return await self._translate(query, "en")
+        if len(pending) == 1:
+            translations = [await self._translate(*pending[0])]
+        elif pending:
+            translations = await self._translate_batch(pending)
         else:
-            return await self._translate(query, "zh")
+            translations = []
+
+        for key, translated in zip(pending, translations, strict=True):
+            if len(self._translation_cache) >= self.translation_cache_size:
+                self._translation_cache.pop(next(iter(self._translation_cache)))
+            self._translation_cache[key] = translated
+
+        return [self._translation_cache.get(key, key[0]) for key in items]
+
+    async def _translate_batch(self, items: list[tuple[str, str]]) -> list[str]:
+        """Translate several texts in a single structured LLM call.
+
+        Falls back to one concurrent call per text if the model does not
+        return exactly one translation per input.
+
+        Args:
+            items: List of (text, target_lang) pairs
+
+        Returns:
+            Translated texts in input order
+        """
+        lines = "\n".join(
+            f"{i}. [{lang}] {text.translate(_SINGLE_LINE_TABLE)}"
+            for i, (text, lang) in enumerate(items, 1)
+        )
+
+        result = await self.llm_router.ask_json(
+            system="You are a professional translator for research purposes.",
+            user=f"""Translate each numbered line to its target language.
+
+{lines}
+
+Return a JSON object with key 'translations': a list of translated strings, in the same order.""",
+            task_type="bilingual_translation",
+            schema=TRANSLATIONS_SCHEMA,
+            default={},
+        )
+
+        translations = result.get("translations") if isinstance(result, dict) else None
+        if isinstance(translations, list) and len(translations) == len(items):
+            return [str(t) for t in translations]
+
+        return list(await asyncio.gather(*(self._translate(text, lang) for text, lang in items)))
 
     async def _translate(
         self,
@@ -130,7 +269,7 @@ class WebSearcherAgent:
             },
             {
                 "role": "user",
-                "content": f"Translate to {target_lang}: {text}",
+                "content": f"Translate to {target_lang}: {text.translate(_CONTROL_CHARS_TABLE)}",
             },
         ]
 
@@ -155,16 +294,12 @@ class WebSearcherAgent:
         Returns:
             Search results
         """
-        results = []
-
-        for query in queries:
-            search_result = await self.searxng_client.search(
-                query,
-                engines=engines,
-            )
-            results.extend(search_result)
+        results = await asyncio.gather(
+            *(self._search_one(query, engines=engines) for query in queries),
+            return_exceptions=True,
+        )
 
-        return results
+        return list(chain.from_iterable(r for r in results if not isinstance(r, Exception)))
 
     async def extract_and_rerank(
         self,
@@ -174,6 +309,9 @@ class WebSearcherAgent:
     ) -> list[dict[str, Any]]:
         """Extract content from URLs and rerank by relevance.
 
+        Duplicate and non-HTTP(S) URLs are dropped before fetching, and pages
+        already fetched by this agent are served from memory.
+
         Args:
             urls: List of URLs to process
             query: Search query for reranking
@@ -182,15 +320,29 @@ class WebSearcherAgent:
         Returns:
             Reranked documents
         """
-        extracted = []
+        targets = [url for url in dict.fromkeys(urls) if _URL_RE.match(url)][:50]
+        missing = [url for url in targets if url not in self._fetched]
+
+        contents = await asyncio.gather(
+            *(self._fetch_content(url) for url in missing),
+            return_exceptions=True,
+        )
+
+        for url, content in zip(missing, contents, strict=True):
+            if content and not isinstance(content, Exception):
+                self._fetched[url] = content
+                if len(self._fetched) > self._fetch_cache_size:
+                    self._fetched.popitem(last=False)
 
-        for url in urls[:50]:
-            content = await self._fetch_content(url)
+        extracted = []
+        for url in targets:
+            content = self._fetched.get(url)
             if content:
+                self._fetched.move_to_end(url)
                 extracted.append(
                     {
                         "url": url,
-                        "content": content[:2000],
+                        "content": content,
                         "extracted_at": "now",
                     }
                 )
@@ -210,17 +362,51 @@ class WebSearcherAgent:
         Returns:
             Extracted content or None
         """
-        import httpx
-
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(url, follow_redirects=True)
-                if response.status_code == 200:
-                    return response.text[:5000]
-                return None
+            async with self._fetch_semaphore:
+                async with self._get_http().stream("GET", url, follow_redirects=True) as response:
+                    if response.status_code != 200:
+                        return None
+
+                    content_type = response.headers.get("content-type", "text/html").lower()
+                    if not content_type.startswith(_TEXT_CONTENT_TYPES):
+                        return None
+
+                    chunks = []
+                    total = 0
+                    async for chunk in response.aiter_bytes(8192):
+                        chunks.append(chunk)
+                        total += len(chunk)
+                        if total >= _MAX_CONTENT_BYTES:
+                            break
+
+            body = b"".join(chunks)
+            text = body.decode(response.charset_encoding or "utf-8", errors="replace")
+            return text[:_MAX_CONTENT_CHARS].translate(_CONTROL_CHARS_TABLE)
         except Exception:
             return None
 
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client used for page fetches.
+
+        Returns:
+            Injected HTTP client, or an agent-owned one created on first use
+        """
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=30,
+                http2=True,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the page-fetch HTTP client if the agent created it."""
+        if self._owns_http and self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     async def _rerank_documents(
         self,
         query: str,
@@ -235,7 +421,8 @@ class WebSearcherAgent:
             top_k: Number of top results
 
         Returns:
-            Reranked documents
+            Copies of the top documents with a relevance_score, in the
+            provider's relevance order
         """
         docs_text = [d.get("content", "") for d in documents]
 
@@ -245,14 +432,13 @@ class WebSearcherAgent:
             top_k=top_k,
         )
 
-        results = []
-        for doc_idx, score in reranked:
-            if doc_idx < len(documents):
-                doc = documents[doc_idx]
-                doc["relevance_score"] = score
-                results.append(doc)
+        num_documents = len(documents)
 
-        return sorted(results, key=lambda x: x["relevance_score"], reverse=True)[:top_k]
+        return [
+            {**documents[doc_idx], "relevance_score": score}
+            for doc_idx, score in reranked[:top_k]
+            if doc_idx < num_documents
+        ]
 
     async def health_check(self) -> dict[str, Any]:
         """Check web searcher health.
@@ -1,13 +1,27 @@
 """FastAPI application entry point."""
 
 import asyncio
-from contextlib import asynccontextmanager
+import gzip
+import os
+import time
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Any
 
-from fastapi import FastAPI, HTTPException
+import httpx
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from prometheus_client import Counter, Histogram, generate_latest
-from prometheus_client.fastapi import metrics
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
 
 from ..agents import CoordinatorAgent
 from ..models import (
@@ -19,17 +33,140 @@ from ..models import (
     TaskStatusResponse,
 )
 from ..services import LLMRouter
-from ..utils import ConfigManager, get_config, instrument_fastapi, setup_logging, setup_telemetry
-
+from ..services.document_parser import shutdown_pdf_pool
+from ..utils import (
+    get_config,
+    instrument_fastapi,
+    setup_logging,
+    setup_telemetry,
+    uvicorn_runtime_options,
+)
 
 metrics_counter = Counter(
     "api_requests_total", "Total API requests", ["method", "endpoint", "status"]
 )
-metrics_histogram = Histogram("api_request_duration_seconds", "API request duration")
+metrics_histogram = Histogram(
+    "api_request_duration_seconds", "API request duration", ["method", "endpoint"]
+)
+
+_TASK_CREATED = metrics_counter.labels(method="POST", endpoint="/tasks", status="created")
+_STATUS_SUCCESS = metrics_counter.labels(
+    method="GET", endpoint="/tasks/{id}/status", status="success"
+)
+_REPORT_SUCCESS = metrics_counter.labels(
+    method="GET", endpoint="/tasks/{id}/report", status="success"
+)
+_REPORT_STREAM_SUCCESS = metrics_counter.labels(
+    method="GET", endpoint="/tasks/{id}/report/stream", status="success"
+)
+
+_duration_handles: dict[tuple[str, str], Any] = {}
+
+
+def _duration_handle(method: str, endpoint: str) -> Any:
+    """Get the request duration histogram child for a route.
+
+    Args:
+        method: HTTP method
+        endpoint: Route path template
+
+    Returns:
+        Labelled histogram
+    """
+    key = (method, endpoint)
+    handle = _duration_handles.get(key)
+    if handle is None:
+        handle = _duration_handles[key] = metrics_histogram.labels(method=method, endpoint=endpoint)
+    return handle
+
+
+class _RequestDurationMiddleware:
+    """Pure ASGI middleware observing request latency per matched route template.
+
+    Latency is measured until the response starts, so streaming responses
+    are not held open by the middleware and long event streams do not skew
+    the histogram.
+    """
+
+    def __init__(self, app: Any):
+        """Initialize middleware.
+
+        Args:
+            app: Downstream ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        observed = False
+
+        def observe() -> None:
+            nonlocal observed
+            observed = True
+            route = scope.get("route")
+            _duration_handle(
+                scope["method"], route.path if route is not None else "unmatched"
+            ).observe(time.perf_counter() - started)
 
-_global_config: ConfigManager | None = None
-_global_llm_router: LLMRouter | None = None
-_global_coordinator: CoordinatorAgent | None = None
+        async def send_wrapper(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start" and not observed:
+                observe()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if not observed:
+                observe()
+
+
+@dataclass(slots=True)
+class TaskHandle:
+    """Registry entry for a research task running in the background."""
+
+    coordinator: CoordinatorAgent
+    task: asyncio.Task | None = None
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    updated_at: str = field(init=False)
+    finished_at: float | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        self.updated_at = self.created_at
+
+    def touch(self) -> None:
+        """Record that the task changed state."""
+        self.updated_at = datetime.now(timezone.utc).isoformat()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background workflow is still executing."""
+        return self.task is not None and not self.task.done()
+
+
+async def _reap_tasks(app: FastAPI, ttl: float, interval: float) -> None:
+    """Periodically evict finished tasks older than the TTL.
+
+    Args:
+        app: FastAPI application holding the task registry
+        ttl: Seconds a finished task is kept after completion
+        interval: Seconds between sweeps
+    """
+    while True:
+        await asyncio.sleep(interval)
+
+        cutoff = time.monotonic() - ttl
+        async with app.state.tasks_lock:
+            expired = [
+                task_id
+                for task_id, handle in app.state.tasks.items()
+                if handle.finished_at is not None and handle.finished_at < cutoff
+            ]
+            for task_id in expired:
+                del app.state.tasks[task_id]
 
 
 @asynccontextmanager
@@ -39,10 +176,7 @@ async def lifespan(app: FastAPI):
     Args:
         app: FastAPI application instance
     """
-    global _global_config, _global_llm_router
-
     config = get_config()
-    _global_config = config
 
     app_config = config.config.get("app", {})
 
@@ -50,13 +184,49 @@ async def lifespan(app: FastAPI):
     setup_telemetry(config.config.get("observability", {}))
     instrument_fastapi(app)
 
-    llm_config = config.get_llm_config()
-    _global_llm_router = LLMRouter(llm_config)
-    _global_coordinator = CoordinatorAgent(_global_llm_router)
-
-    yield
-
-    await _global_llm_router.health_check_all()
+    async with AsyncExitStack() as stack:
+        http_client = await stack.enter_async_context(
+            httpx.AsyncClient(
+                timeout=httpx.Timeout(60),
+                limits=httpx.Limits(
+                    max_connections=128,
+                    max_keepalive_connections=64,
+                    keepalive_expiry=300,
+                ),
+                http2=True,
+            )
+        )
+        stack.push_async_callback(shutdown_pdf_pool)
+
+        llm_config = config.get_llm_config()
+        llm_router = LLMRouter(llm_config, http_client=http_client)
+        stack.push_async_callback(llm_router.aclose)
+
+        app.state.config = config
+        app.state.http = http_client
+        app.state.llm_router = llm_router
+        app.state.tasks = {}
+        app.state.tasks_lock = asyncio.Lock()
+
+        tasks_config = config.config.get("tasks", {})
+        app.state.task_slots = asyncio.Semaphore(tasks_config.get("max_parallel_tasks", 10))
+        reaper = asyncio.create_task(
+            _reap_tasks(
+                app,
+                ttl=tasks_config.get("finished_ttl_seconds", 3600),
+                interval=tasks_config.get("reap_interval_seconds", 60),
+            )
+        )
+
+        try:
+            yield
+        finally:
+            reaper.cancel()
+            running = [h.task for h in app.state.tasks.values() if h.running]
+            for task in running:
+                task.cancel()
+            with suppress(asyncio.CancelledError):
+                await asyncio.gather(reaper, *running, return_exceptions=True)
 
 
 def create_app() -> FastAPI:
@@ -73,6 +243,7 @@ def create_app() -> FastAPI:
         version=app_config.get("version", "0.1.0"),
         description="Enterprise Deep Research Agent System",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
     )
@@ -86,7 +257,9 @@ def create_app() -> FastAPI:
         allow_headers=cors_config.get("allow_headers", ["*"]),
     )
 
-    metrics(app)
+    app.add_middleware(_RequestDurationMiddleware)
+
+    app.add_api_route("/metrics", metrics_endpoint, include_in_schema=False)
 
     app.include_router(health_router, prefix="/health", tags=["Health"])
     app.include_router(tasks_router, prefix="/api/v1/tasks", tags=["Tasks"])
@@ -94,10 +267,47 @@ def create_app() -> FastAPI:
     return app
 
 
-@app.get("/metrics", include_in_schema=False)
-async def metrics_endpoint():
-    """Prometheus metrics endpoint."""
-    return generate_latest()
+def _metrics_registry() -> CollectorRegistry:
+    """Get the registry to expose, aggregating worker processes if configured.
+
+    Returns:
+        Collector registry
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def _render_metrics(compress: bool) -> bytes:
+    """Render the metrics exposition, optionally gzip-compressed.
+
+    Args:
+        compress: Whether to gzip the payload
+
+    Returns:
+        Exposition payload
+    """
+    payload = generate_latest(_metrics_registry())
+    return gzip.compress(payload, compresslevel=1) if compress else payload
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus metrics endpoint.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Metrics in Prometheus text format, gzipped when the client accepts it
+    """
+    compress = "gzip" in request.headers.get("accept-encoding", "")
+    payload = await asyncio.to_thread(_render_metrics, compress)
+
+    headers = {"Content-Encoding": "gzip", "Vary": "Accept-Encoding"} if compress else None
+    return Response(payload, media_type=CONTENT_TYPE_LATEST, headers=headers)
 
 
 from fastapi import APIRouter
@@ -105,24 +315,82 @@ from fastapi import APIRouter
 health_router = APIRouter()
 tasks_router = APIRouter()
 
-_global_tasks: dict[str, CoordinatorAgent] = {}
+
+async def _run_workflow(handle: TaskHandle, slots: asyncio.Semaphore) -> dict[str, Any]:
+    """Execute a task's workflow and stamp the handle when it finishes.
+
+    Args:
+        handle: Registry entry of the task
+        slots: Semaphore bounding concurrently executing workflows
+
+    Returns:
+        Workflow results
+    """
+    try:
+        async with slots:
+            handle.touch()
+            return await handle.coordinator.execute_workflow()
+    finally:
+        handle.finished_at = time.monotonic()
+        handle.touch()
+
+
+def _get_handle(request: Request, task_id: str) -> TaskHandle:
+    """Look up a task in the registry.
+
+    Args:
+        request: Incoming request
+        task_id: Task identifier
+
+    Returns:
+        Task handle
+
+    Raises:
+        HTTPException: If the task does not exist
+    """
+    handle = request.app.state.tasks.get(task_id)
+    if handle is None:
+        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+    return handle
+
+
+def _get_finished_handle(request: Request, task_id: str) -> TaskHandle:
+    """Look up a task whose workflow has finished.
+
+    Args:
+        request: Incoming request
+        task_id: Task identifier
+
+    Returns:
+        Task handle
+
+    Raises:
+        HTTPException: If the task does not exist or is still running
+    """
+    handle = _get_handle(request, task_id)
+    if handle.running:
+        raise HTTPException(status_code=409, detail=f"Task {task_id} is still running")
+    return handle
 
 
 @health_router.get("", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check(request: Request) -> HealthResponse:
     """Health check endpoint.
 
+    Args:
+        request: Incoming request
+
     Returns:
         Health status of all components
     """
-    global _global_llm_router
+    llm_router = getattr(request.app.state, "llm_router", None)
 
-    if _global_llm_router:
-        provider_health = await _global_llm_router.health_check_all()
+    if llm_router:
+        provider_health = await llm_router.health_check_all()
     else:
         provider_health = {}
 
-    return HealthResponse(
+    return HealthResponse.model_construct(
         status="healthy" if all(provider_health.values()) else "degraded",
         version="0.1.0",
         components={
@@ -134,80 +402,117 @@ async def health_check() -> HealthResponse:
 
 
 @tasks_router.post("", response_model=TaskResponse, status_code=201)
-async def create_task(task: ResearchTask) -> TaskResponse:
-    """Create a new research task.
+async def create_task(task: ResearchTask, request: Request) -> TaskResponse:
+    """Create a new research task and start it in the background.
 
     Args:
         task: Research task details
+        request: Incoming request
 
     Returns:
         Task creation response with task ID
     """
-    global _global_coordinator
+    coordinator = CoordinatorAgent(request.app.state.llm_router)
 
-    task_id = await _global_coordinator.create_task(
+    task_id = await coordinator.create_task(
         task.query,
         task.depth,
     )
 
-    metrics_counter.labels(method="POST", endpoint="/tasks", status="created").inc()
+    handle = TaskHandle(coordinator=coordinator)
+    async with request.app.state.tasks_lock:
+        request.app.state.tasks[task_id] = handle
+    handle.task = asyncio.create_task(_run_workflow(handle, request.app.state.task_slots))
 
-    return TaskResponse(
+    _TASK_CREATED.inc()
+
+    return TaskResponse.model_construct(
         task_id=task_id,
         status=TaskStatus.PENDING,
         query=task.query,
-        created_at="",
+        created_at=handle.created_at,
     )
 
 
 @tasks_router.get("/{task_id}/status", response_model=TaskStatusResponse)
-async def get_task_status(task_id: str) -> TaskStatusResponse:
+async def get_task_status(task_id: str, request: Request) -> TaskStatusResponse:
     """Get task status.
 
     Args:
         task_id: Task identifier
+        request: Incoming request
 
     Returns:
         Current task status
     """
-    global _global_coordinator
+    handle = _get_handle(request, task_id)
+    status = handle.coordinator.get_status()
 
-    status = _global_coordinator.get_status()
+    error_message = None
+    if handle.task is not None and handle.task.done() and not handle.task.cancelled():
+        error = handle.task.exception()
+        if error is not None:
+            error_message = str(error)
 
-    metrics_counter.labels(method="GET", endpoint="/tasks/{id}/status", status="success").inc()
+    _STATUS_SUCCESS.inc()
 
-    return TaskStatusResponse(
+    return TaskStatusResponse.model_construct(
         task_id=task_id,
-        status=status["status"],
+        status=TaskStatus.FAILED if error_message else status["status"],
         progress=status["progress"],
         current_step=status.get("current_step"),
         total_steps=status["total_steps"],
         completed_steps=status["completed_steps"],
         sources_found=status.get("sources_found", 0),
-        created_at="",
-        updated_at="",
+        error_message=error_message,
+        created_at=handle.created_at,
+        updated_at=handle.updated_at,
     )
 
 
 @tasks_router.get("/{task_id}/report")
-async def get_report(task_id: str):
+async def get_report(task_id: str, request: Request):
     """Get research report.
 
     Args:
         task_id: Task identifier
+        request: Incoming request
 
     Returns:
         Research report
     """
-    global _global_coordinator
+    handle = _get_finished_handle(request, task_id)
 
-    report = await _global_coordinator.generate_report()
+    report = await handle.coordinator.generate_report()
 
-    metrics_counter.labels(method="GET", endpoint="/tasks/{id}/report", status="success").inc()
+    _REPORT_SUCCESS.inc()
 
     return report
 
 
+@tasks_router.get("/{task_id}/report/stream")
+async def stream_report(task_id: str, request: Request) -> StreamingResponse:
+    """Stream research report as server-sent events.
+
+    Args:
+        task_id: Task identifier
+        request: Incoming request
+
+    Returns:
+        Event stream of report content fragments
+    """
+    handle = _get_finished_handle(request, task_id)
+
+    async def event_stream():
+        async for text in handle.coordinator.stream_report():
+            yield "".join(f"data: {line}\n" for line in text.split("\n")) + "\n"
+        yield "event: done\ndata: \n\n"
+
+    _REPORT_STREAM_SUCCESS.inc()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 app = create_app()
 
 if __name__ == "__main__":
@@ -221,4 +526,5 @@ if __name__ == "__main__":
         host=app_config.get("host", "0.0.0.0"),
         port=app_config.get("port", 8000),
         reload=app_config.get("env", "development") == "development",
+        **uvicorn_runtime_options(app_config),
     )
@@ -2,8 +2,7 @@
 
 import click
 
-from ..utils import get_config
-from .api import create_app
+from .utils import get_config, uvicorn_runtime_options
 
 
 @click.group()
@@ -26,6 +25,8 @@ def start(host: str, port: int, reload: bool) -> None:
     """
     import uvicorn
 
+    from .api import create_app
+
     app = create_app()
 
     click.echo(f"Starting emp-researcher on {host}:{port}")
@@ -34,6 +35,7 @@ def start(host: str, port: int, reload: bool) -> None:
         host=host,
         port=port,
         reload=reload,
+        **uvicorn_runtime_options(get_config().config.get("app", {})),
     )
 
 
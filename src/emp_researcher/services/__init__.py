@@ -1,31 +1,55 @@
-"""Services module."""
-
-from .document_parser import DocumentChunk, DocumentParser
-from .llm import LLMProvider, LLMRouter, ModelType, OllamaProvider, OpenAICompatibleProvider
-from .search_client import SearXNGClient
-from .vector_store import VectorStore
-from .document_parser import DocumentChunk, DocumentParser
-from .rerank_service import RerankerService
-from .bilingual_search import BilingualSearchService
-from .observability import ObservabilityService
-from .graphrag_engine import GraphRAGEngine
-from .multimodal_processor import MultimodalProcessor
-from .firecrawl_client import FirecrawlClient
-
-__all__ = [
-    "LLMProvider",
-    "LLMRouter",
-    "ModelType",
-    "OllamaProvider",
-    "OpenAICompatibleProvider",
-    "DocumentParser",
-    "DocumentChunk",
-    "SearXNGClient",
-    "VectorStore",
-    "RerankerService",
-    "BilingualSearchService",
-    "ObservabilityService",
-    "GraphRAGEngine",
-    "MultimodalProcessor",
-    "FirecrawlClient",
-]
+"""Services module.
+
+Submodules are imported on first attribute access (PEP 562) so that
+importing one service does not pull in the dependencies of all others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .bilingual_search import BilingualSearchService
+    from .document_parser import DocumentChunk, DocumentParser
+    from .firecrawl_client import FirecrawlClient
+    from .graphrag_engine import GraphRAGEngine
+    from .llm import LLMProvider, LLMRouter, ModelType, OllamaProvider, OpenAICompatibleProvider
+    from .multimodal_processor import MultimodalProcessor
+    from .observability import ObservabilityService
+    from .rerank_service import RerankerService
+    from .search_client import SearXNGClient
+    from .vector_store import VectorStore
+
+_LAZY_IMPORTS = {
+    "LLMProvider": ".llm",
+    "LLMRouter": ".llm",
+    "ModelType": ".llm",
+    "OllamaProvider": ".llm",
+    "OpenAICompatibleProvider": ".llm",
+    "DocumentParser": ".document_parser",
+    "DocumentChunk": ".document_parser",
+    "SearXNGClient": ".search_client",
+    "VectorStore": ".vector_store",
+    "RerankerService": ".rerank_service",
+    "BilingualSearchService": ".bilingual_search",
+    "ObservabilityService": ".observability",
+    "GraphRAGEngine": ".graphrag_engine",
+    "MultimodalProcessor": ".multimodal_processor",
+    "FirecrawlClient": ".firecrawl_client",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public service on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,9 +1,58 @@
 """Bilingual search service for parallel zh/en queries."""
 
 import asyncio
+import heapq
+import re
+from operator import itemgetter
 from typing import Any
-
-from ..services import LLMRouter, QueryRewriterAgent, SearXNGClient
+from urllib.parse import urlsplit
+
+import numpy as np
+import orjson
+
+from ..agents import QueryRewriterAgent
+from .llm import LLMRouter
+from .search_client import SearXNGClient
+
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]+")
+QUERY_PLAN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "zh_query": {"type": "string"},
+        "en_query": {"type": "string"},
+        "zh_alts": {"type": "array", "items": {"type": "string"}},
+        "en_alts": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["zh_query", "en_query", "zh_alts", "en_alts"],
+}
+
+_VECTORIZE_THRESHOLD = 200
+_PRIORITY_DOMAINS = frozenset(
+    {"arxiv.org", "github.com", "acm.org", "sohu.com", "csdn.net", "zhihu.com"}
+)
+_PRIORITY_TLDS = frozenset({"cn"})
+
+
+def _is_priority_url(url: str) -> bool:
+    """Check whether a URL's host is, or is under, a priority domain.
+
+    Args:
+        url: Result URL
+
+    Returns:
+        True if priority source
+    """
+    try:
+        host = urlsplit(url).hostname
+    except ValueError:
+        return False
+    if not host:
+        return False
+
+    labels = host.split(".")
+    if labels[-1] in _PRIORITY_TLDS:
+        return True
+    return any(".".join(labels[i:]) in _PRIORITY_DOMAINS for i in range(len(labels) - 1))
 
 
 class BilingualSearchService:
@@ -16,6 +65,8 @@ class BilingualSearchService:
         searxng_client: SearXNGClient,
         language_balance: float = 0.5,
         max_results_per_lang: int = 30,
+        search_timeout: float = 30.0,
+        fusion_method: str = "weighted",
     ):
         """Initialize bilingual search service.
 
@@ -25,12 +76,16 @@ class BilingualSearchService:
             searxng_client: SearXNG client
             language_balance: Language balance weight (0-1)
             max_results_per_lang: Max results per language
+            search_timeout: Seconds before a single-language search is abandoned
+            fusion_method: Result fusion strategy ("weighted" or "combmnz")
         """
         self.llm_router = llm_router
         self.query_rewriter = query_rewriter
         self.searxng_client = searxng_client
         self.language_balance = language_balance
         self.max_results_per_lang = max_results_per_lang
+        self.search_timeout = search_timeout
+        self.fusion_method = fusion_method
 
     async def search_bilingual(
         self,
@@ -48,22 +103,33 @@ class BilingualSearchService:
         """
         detected_lang = self._detect_language(query)
 
-        zh_query = await self._prepare_zh_query(query, detected_lang)
-        en_query = await self._prepare_en_query(query, detected_lang)
+        plan = await self._prepare_all_queries(query, detected_lang)
+
+        if plan is not None:
+            zh_query, en_query = plan["zh_query"], plan["en_query"]
+            zh_alts, en_alts = plan["zh_alts"], plan["en_alts"]
+        else:
+            zh_query, en_query = await asyncio.gather(
+                self._prepare_zh_query(query, detected_lang),
+                self._prepare_en_query(query, detected_lang),
+            )
+            zh_alts = en_alts = None
 
         all_results = []
 
         for iteration in range(max_iterations):
-            zh_results = await self._search_zh(zh_query, iteration)
-            en_results = await self._search_en(en_query, iteration)
+            zh_results, en_results = await asyncio.gather(
+                self._search_zh(zh_query, iteration),
+                self._search_en(en_query, iteration),
+            )
 
             zh_relevance = [r.get("relevance_score", 0) for r in zh_results]
             en_relevance = [r.get("relevance_score", 0) for r in en_results]
 
             if max(zh_relevance, default=0) < 0.3 and max(en_relevance, default=0) > 0.7:
-                iteration_results = await self._expand_en_search(en_query, iteration)
+                iteration_results = await self._expand_en_search(en_query, iteration, en_alts)
             elif max(en_relevance, default=0) < 0.3 and max(zh_relevance, default=0) > 0.7:
-                iteration_results = await self._expand_zh_search(zh_query, iteration)
+                iteration_results = await self._expand_zh_search(zh_query, iteration, zh_alts)
             else:
                 iteration_results = await self._merge_results(zh_results[:10], en_results[:10])
 
@@ -91,13 +157,60 @@ class BilingualSearchService:
         Returns:
             Language code (zh/en/mixed)
         """
-        zh_chars = any("\u4e00-\u9fff" in c for c in text)
+        zh_chars = sum(map(len, _CJK_RE.findall(text)))
 
         if zh_chars:
             return "zh" if zh_chars / len(text) > 0.3 else "mixed"
         else:
             return "en"
 
+    async def _prepare_all_queries(
+        self,
+        original_query: str,
+        detected_lang: str,
+    ) -> dict[str, Any] | None:
+        """Prepare zh/en search queries and alternatives with one LLM call.
+
+        Args:
+            original_query: Original query
+            detected_lang: Detected language
+
+        Returns:
+            Dict with zh_query, en_query, zh_alts and en_alts, or None if the
+            response could not be used
+        """
+        result = await self.llm_router.ask_json(
+            system="You are a bilingual search query optimizer. Return JSON with keys zh_query, en_query, zh_alts (3), en_alts (3) — optimized search queries.",
+            user=f"Optimize this query for Chinese and English search, and give 3 alternative queries per language: {original_query}",
+            task_type="query_rewrite",
+            schema=QUERY_PLAN_SCHEMA,
+        )
+
+        if not isinstance(result, dict):
+            return None
+
+        zh_query = original_query if detected_lang == "zh" else result.get("zh_query")
+        en_query = original_query if detected_lang == "en" else result.get("en_query")
+        zh_alts = result.get("zh_alts")
+        en_alts = result.get("en_alts")
+
+        if not (
+            isinstance(zh_query, str)
+            and zh_query
+            and isinstance(en_query, str)
+            and en_query
+            and isinstance(zh_alts, list)
+            and isinstance(en_alts, list)
+        ):
+            return None
+
+        return {
+            "zh_query": zh_query,
+            "en_query": en_query,
+            "zh_alts": zh_alts or [zh_query],
+            "en_alts": en_alts or [en_query],
+        }
+
     async def _prepare_zh_query(
         self,
         original_query: str,
@@ -130,13 +243,8 @@ class BilingualSearchService:
             task_type="query_rewrite",
         )
 
-        try:
-            import json
-
-            result = json.loads(response.choices[0].message.content)
-            return result.get("sub_queries", [original_query])[0]
-        except Exception:
-            return original_query
+        sub_queries = self._parse_sub_queries(response, original_query)
+        return sub_queries[0] if sub_queries else original_query
 
     async def _prepare_en_query(
         self,
@@ -170,13 +278,32 @@ class BilingualSearchService:
             task_type="query_rewrite",
         )
 
+        sub_queries = self._parse_sub_queries(response, original_query)
+        return sub_queries[0] if sub_queries else original_query
+
+    def _parse_sub_queries(self, response: Any, fallback: str) -> list[str] | None:
+        """Extract the sub_queries list from a query rewrite response.
+
+        Args:
+            response: Chat completion response
+            fallback: Query used when the response has no sub_queries
+
+        Returns:
+            Non-empty list of queries, or None if the response is not a JSON object
+        """
         try:
-            import json
+            result = orjson.loads(response.choices[0].message.content)
+        except orjson.JSONDecodeError:
+            return None
 
-            result = json.loads(response.choices[0].message.content)
-            return result.get("sub_queries", [original_query])[0]
-        except Exception:
-            return original_query
+        if not isinstance(result, dict):
+            return None
+
+        sub_queries = result.get("sub_queries")
+        if not isinstance(sub_queries, list) or not sub_queries:
+            return [fallback]
+
+        return sub_queries
 
     async def _search_zh(
         self,
@@ -194,10 +321,13 @@ class BilingualSearchService:
         """
         try:
             engines_zh = ["baidu", "so", "google"]
-            results = await self.searxng_client.search(
-                query,
-                engines=engines_zh,
-                language="zh",
+            results = await asyncio.wait_for(
+                self.searxng_client.search(
+                    query,
+                    engines=engines_zh,
+                    language="zh",
+                ),
+                timeout=self.search_timeout,
             )
 
             for result in results:
@@ -225,10 +355,13 @@ class BilingualSearchService:
         """
         try:
             engines_en = ["google", "bing", "duckduckgo"]
-            results = await self.searxng_client.search(
-                query,
-                engines=engines_en,
-                language="en",
+            results = await asyncio.wait_for(
+                self.searxng_client.search(
+                    query,
+                    engines=engines_en,
+                    language="en",
+                ),
+                timeout=self.search_timeout,
             )
 
             for result in results:
@@ -244,85 +377,83 @@ class BilingualSearchService:
         self,
         query: str,
         iteration: int,
+        alt_queries: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Expand Chinese search with alternative queries.
 
         Args:
             query: Search query
             iteration: Search iteration number
+            alt_queries: Precomputed alternative queries (optional); generated
+                with the LLM when omitted
 
         Returns:
             List of search results
         """
-        messages = [
-            {"role": "system", "content": "You are a search expansion specialist for Chinese."},
-            {
-                "role": "user",
-                "content": f"Generate 3 alternative Chinese search queries for: {query}",
-            },
-        ]
-
-        response = await self.llm_router.route_chat(
-            messages=messages,
-            task_type="query_rewrite",
-        )
-
-        try:
-            import json
+        if alt_queries is None:
+            messages = [
+                {"role": "system", "content": "You are a search expansion specialist for Chinese."},
+                {
+                    "role": "user",
+                    "content": f"Generate 3 alternative Chinese search queries for: {query}",
+                },
+            ]
+
+            response = await self.llm_router.route_chat(
+                messages=messages,
+                task_type="query_rewrite",
+            )
 
-            result = json.loads(response.choices[0].message.content)
-            alt_queries = result.get("sub_queries", [query])
+            alt_queries = self._parse_sub_queries(response, query)
+            if alt_queries is None:
+                return []
 
-            all_results = []
-            for alt_query in alt_queries[:3]:
-                results = await self._search_zh(alt_query, iteration)
-                all_results.extend(results)
+        results = await asyncio.gather(
+            *(self._search_zh(alt_query, iteration) for alt_query in alt_queries[:3])
+        )
 
-            return all_results
-        except Exception:
-            return []
+        return [result for batch in results for result in batch]
 
     async def _expand_en_search(
         self,
         query: str,
         iteration: int,
+        alt_queries: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Expand English search with alternative queries.
 
         Args:
             query: Search query
             iteration: Search iteration number
+            alt_queries: Precomputed alternative queries (optional); generated
+                with the LLM when omitted
 
         Returns:
             List of search results
         """
-        messages = [
-            {"role": "system", "content": "You are a search expansion specialist for English."},
-            {
-                "role": "user",
-                "content": f"Generate 3 alternative English search queries for: {query}",
-            },
-        ]
-
-        response = await self.llm_router.route_chat(
-            messages=messages,
-            task_type="query_rewrite",
-        )
-
-        try:
-            import json
+        if alt_queries is None:
+            messages = [
+                {"role": "system", "content": "You are a search expansion specialist for English."},
+                {
+                    "role": "user",
+                    "content": f"Generate 3 alternative English search queries for: {query}",
+                },
+            ]
+
+            response = await self.llm_router.route_chat(
+                messages=messages,
+                task_type="query_rewrite",
+            )
 
-            result = json.loads(response.choices[0].message.content)
-            alt_queries = result.get("sub_queries", [query])
+            alt_queries = self._parse_sub_queries(response, query)
+            if alt_queries is None:
+                return []
 
-            all_results = []
-            for alt_query in alt_queries[:3]:
-                results = await self._search_en(alt_query, iteration)
-                all_results.extend(results)
+        results = await asyncio.gather(
+            *(self._search_en(alt_query, iteration) for alt_query in alt_queries[:3])
+        )
 
-            return all_results
-        except Exception:
-            return []
+        return [result for batch in results for result in batch]
 
     async def _merge_results(
         self,
@@ -331,6 +462,9 @@ class BilingualSearchService:
     ) -> list[dict[str, Any]]:
         """Merge zh and en results with language balance.
 
+        Results are annotated in place; _search_zh and _search_en return
+        freshly decoded dicts that are not shared with any other caller.
+
         Args:
             zh_results: Chinese search results
             en_results: English search results
@@ -341,23 +475,15 @@ class BilingualSearchService:
         zh_weight = self.language_balance
         en_weight = 1.0 - self.language_balance
 
-        merged = []
-
         for zh_result in zh_results:
-            adjusted_score = zh_result.get("relevance_score", 0.5) * zh_weight
-            result = zh_result.copy()
-            result["adjusted_score"] = adjusted_score
-            result["source_type"] = "web_zh"
-            merged.append(result)
+            zh_result["adjusted_score"] = zh_result.get("relevance_score", 0.5) * zh_weight
+            zh_result["source_type"] = "web_zh"
 
         for en_result in en_results:
-            adjusted_score = en_result.get("relevance_score", 0.5) * en_weight
-            result = en_result.copy()
-            result["adjusted_score"] = adjusted_score
-            result["source_type"] = "web_en"
-            merged.append(result)
+            en_result["adjusted_score"] = en_result.get("relevance_score", 0.5) * en_weight
+            en_result["source_type"] = "web_en"
 
-        return merged
+        return zh_results + en_results
 
     async def _fuse_results(
         self,
@@ -369,34 +495,106 @@ class BilingualSearchService:
             all_results: All search results
 
         Returns:
-            Deduplicated and fused results
+            Deduplicated and fused results, keeping the first entry seen per URL
         """
-        seen_urls = set()
-        fused = []
+        if self.fusion_method == "combmnz":
+            return self._fuse_combmnz(all_results)
 
+        first_seen: dict[str, dict[str, Any]] = {}
         for result in all_results:
-            url = result.get("url", "")
+            first_seen.setdefault(result.get("url", ""), result)
 
-            if url in seen_urls:
-                continue
+        unique = list(first_seen.values())
+        priority_boosts = [1.2 if _is_priority_url(url) else 1.0 for url in first_seen]
+        final_scores = self._final_scores(unique, priority_boosts)
 
-            if self._is_priority_source(result):
-                result["priority_boost"] = 1.2
-            else:
-                result["priority_boost"] = 1.0
+        for result, priority_boost, final_score in zip(
+            unique, priority_boosts, final_scores, strict=True
+        ):
+            result["priority_boost"] = priority_boost
+            result["final_score"] = final_score
+
+        return heapq.nlargest(self.max_results_per_lang * 2, unique, key=itemgetter("final_score"))
 
-            result["final_score"] = (
+    def _fuse_combmnz(
+        self,
+        all_results: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Fuse results with CombMNZ over per-iteration, per-language result lists.
+
+        Scores are min-max normalized within each source list (falling back
+        to rank position when a list carries no score spread), summed per
+        URL and multiplied by the number of lists the URL appeared in.
+
+        Args:
+            all_results: All search results
+
+        Returns:
+            Deduplicated and fused results
+        """
+        source_lists: dict[tuple[Any, Any], list[dict[str, Any]]] = {}
+        for result in all_results:
+            key = (result.get("query_type"), result.get("iteration"))
+            source_lists.setdefault(key, []).append(result)
+
+        comb_sum: dict[str, float] = {}
+        hits: dict[str, int] = {}
+        first_seen: dict[str, dict[str, Any]] = {}
+
+        for results in source_lists.values():
+            scores = [r.get("relevance_score", 0.5) for r in results]
+            low, high = min(scores), max(scores)
+            count = len(results)
+
+            for rank, (result, score) in enumerate(zip(results, scores, strict=True)):
+                url = result.get("url", "")
+                normalized = (score - low) / (high - low) if high > low else (count - rank) / count
+                comb_sum[url] = comb_sum.get(url, 0.0) + normalized
+                hits[url] = hits.get(url, 0) + 1
+                first_seen.setdefault(url, result)
+
+        for url, result in first_seen.items():
+            priority_boost = 1.2 if self._is_priority_source(result) else 1.0
+            result["priority_boost"] = priority_boost
+            result["final_score"] = comb_sum[url] * hits[url] * priority_boost
+
+        return heapq.nlargest(
+            self.max_results_per_lang * 2, first_seen.values(), key=itemgetter("final_score")
+        )
+
+    def _final_scores(
+        self,
+        results: list[dict[str, Any]],
+        priority_boosts: list[float],
+    ) -> list[float]:
+        """Compute fusion scores, vectorized with NumPy for large result sets.
+
+        Args:
+            results: Search results
+            priority_boosts: Priority boost per result
+
+        Returns:
+            Final score per result
+        """
+        count = len(results)
+
+        if count <= _VECTORIZE_THRESHOLD:
+            return [
                 result.get("relevance_score", 0.5) * 0.4
-                + result.get("priority_boost", 1.0) * 0.3
+                + priority_boost * 0.3
                 + result.get("adjusted_score", 0.5) * 0.3
-            )
+                for result, priority_boost in zip(results, priority_boosts, strict=True)
+            ]
 
-            seen_urls.add(url)
-            fused.append(result)
+        relevance = np.fromiter(
+            (r.get("relevance_score", 0.5) for r in results), dtype=np.float64, count=count
+        )
+        adjusted = np.fromiter(
+            (r.get("adjusted_score", 0.5) for r in results), dtype=np.float64, count=count
+        )
+        boosts = np.asarray(priority_boosts, dtype=np.float64)
 
-        return sorted(fused, key=lambda x: x["final_score"], reverse=True)[
-            : self.max_results_per_lang * 2
-        ]
+        return (relevance * 0.4 + boosts * 0.3 + adjusted * 0.3).tolist()
 
     def _is_priority_source(self, result: dict[str, Any]) -> bool:
         """Check if result is from priority source.
@@ -407,19 +605,7 @@ class BilingualSearchService:
         Returns:
             True if priority source
         """
-        url = result.get("url", "")
-
-        priority_domains = [
-            "arxiv.org",
-            "github.com",
-            "acm.org",
-            "cn",
-            "sohu.com",
-            "csdn.net",
-            "zhihu.com",
-        ]
-
-        return any(domain in url for domain in priority_domains)
+        return _is_priority_url(result.get("url", ""))
 
     async def health_check(self) -> dict[str, Any]:
         """Check bilingual search health.
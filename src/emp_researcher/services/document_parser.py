@@ -1,31 +1,79 @@
 """Document parser service."""
 
 import asyncio
+import multiprocessing
+import os
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from pypdf import PdfReader
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
 
+# Workers are spawned rather than forked: the API process already runs
+# threads (log listener, to_thread workers, HTTP pools) that fork would copy
+# in an arbitrary lock state.
+_PDF_POOL_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+_pdf_pool: ProcessPoolExecutor | None = None
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the process pool used for PDF text extraction."""
+    global _pdf_pool
+
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=_PDF_POOL_MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pdf_pool
+
+
+async def shutdown_pdf_pool() -> None:
+    """Shut down the PDF extraction pool if it was started."""
+    global _pdf_pool
+
+    pool, _pdf_pool = _pdf_pool, None
+    if pool is not None:
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+
+def _extract_pdf_text(path: str) -> str:
+    """Extract text from a PDF, preferring PDFium when it is installed.
+
+    Runs in a worker process, so it must stay a module-level function.
+
+    Args:
+        path: Path to PDF file
+
+    Returns:
+        Extracted text, pages separated by newlines
+    """
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(path)
+        try:
+            return "\n".join(page.get_textpage().get_text_range() for page in pdf)
+        finally:
+            pdf.close()
+
+    reader = PdfReader(path)
+    return "\n".join(page.extract_text() for page in reader.pages)
+
+
+@dataclass(slots=True)
 class DocumentChunk:
     """Represents a chunk of document text."""
 
-    def __init__(
-        self,
-        content: str,
-        metadata: dict[str, Any],
-        chunk_id: str,
-    ):
-        """Initialize document chunk.
-
-        Args:
-            content: Chunk text content
-            metadata: Chunk metadata (source, page, etc.)
-            chunk_id: Unique chunk identifier
-        """
-        self.content = content
-        self.metadata = metadata
-        self.chunk_id = chunk_id
+    content: str
+    metadata: dict[str, Any]
+    chunk_id: str
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary.
@@ -83,7 +131,7 @@ class DocumentParser:
         return self._chunk_content(content, str(file_path))
 
     async def _parse_pdf(self, file_path: Path) -> str:
-        """Parse PDF file.
+        """Parse PDF file in a worker process.
 
         Args:
             file_path: Path to PDF file
@@ -91,13 +139,8 @@ class DocumentParser:
         Returns:
             Extracted text
         """
-        reader = PdfReader(str(file_path))
-        text_parts = []
-
-        for page in reader.pages:
-            text_parts.append(page.extract_text())
-
-        return "\n".join(text_parts)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_pdf_pool(), _extract_pdf_text, str(file_path))
 
     async def _parse_text(self, file_path: Path) -> str:
         """Parse plain text or markdown file.
@@ -108,14 +151,14 @@ class DocumentParser:
         Returns:
             File content
         """
-        return file_path.read_text(encoding="utf-8")
+        return await asyncio.to_thread(file_path.read_text, encoding="utf-8")
 
     def _chunk_content(
         self,
         content: str,
         source_path: str,
     ) -> list[DocumentChunk]:
-        """Split content into chunks.
+        """Split content into overlapping fixed-size word windows.
 
         Args:
             content: Full document text
@@ -126,40 +169,68 @@ class DocumentParser:
         """
         chunks = []
         words = content.split()
-        current_chunk = []
-        chunk_id = 0
-
-        for word in words:
-            current_chunk.append(word)
+        num_words = len(words)
+        step = max(self.chunk_size - self.chunk_overlap, 1)
 
-            if len(current_chunk) >= self.chunk_size:
-                chunk_text = " ".join(current_chunk)
-                chunk = DocumentChunk(
-                    content=chunk_text,
+        for chunk_id, start in enumerate(range(0, num_words, step)):
+            chunks.append(
+                DocumentChunk(
+                    content=" ".join(words[start : start + self.chunk_size]),
                     metadata={
                         "source_path": source_path,
                         "chunk_index": chunk_id,
                     },
                     chunk_id=f"{source_path}_{chunk_id}",
                 )
-                chunks.append(chunk)
-                current_chunk = current_chunk[-self.chunk_overlap :]
-                chunk_id += 1
-
-        if current_chunk:
-            chunk_text = " ".join(current_chunk)
-            chunk = DocumentChunk(
-                content=chunk_text,
-                metadata={
-                    "source_path": source_path,
-                    "chunk_index": chunk_id,
-                },
-                chunk_id=f"{source_path}_{chunk_id}",
             )
-            chunks.append(chunk)
+
+            if start + self.chunk_size >= num_words:
+                break
 
         return chunks
 
+    @staticmethod
+    def to_columns(
+        chunks: list[DocumentChunk],
+    ) -> tuple[list[str], list[dict[str, Any]], list[str]]:
+        """Split chunks into parallel content, metadata and ID lists.
+
+        Useful for batch embedding, where contents are passed as one list.
+
+        Args:
+            chunks: Document chunks
+
+        Returns:
+            Tuple of (contents, metadatas, chunk_ids)
+        """
+        return (
+            [chunk.content for chunk in chunks],
+            [chunk.metadata for chunk in chunks],
+            [chunk.chunk_id for chunk in chunks],
+        )
+
+    async def iter_parse(
+        self,
+        file_paths: list[str | Path],
+    ) -> AsyncIterator[tuple[str, list[DocumentChunk] | Exception]]:
+        """Parse multiple documents, yielding each one as soon as it is done.
+
+        Args:
+            file_paths: List of file paths
+
+        Yields:
+            Tuples of (file path, chunks or the exception raised parsing it)
+        """
+
+        async def parse_one(path: str | Path) -> tuple[str, list[DocumentChunk] | Exception]:
+            try:
+                return str(path), await self.parse_file(path)
+            except Exception as e:
+                return str(path), e
+
+        for next_done in asyncio.as_completed([parse_one(path) for path in file_paths]):
+            yield await next_done
+
     async def parse_multiple(
         self,
         file_paths: list[str | Path],
@@ -170,16 +241,13 @@ class DocumentParser:
             file_paths: List of file paths
 
         Returns:
-            Dictionary mapping file paths to chunks
+            Dictionary mapping file paths to chunks, in input order
         """
-        tasks = [self.parse_file(path) for path in file_paths]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        chunks_by_file = {}
-        for path, result in zip(file_paths, results):
+        parsed = {}
+        async for path, result in self.iter_parse(file_paths):
             if isinstance(result, Exception):
                 print(f"Error parsing {path}: {result}")
                 continue
-            chunks_by_file[str(path)] = result
+            parsed[path] = result
 
-        return chunks_by_file
+        return {str(path): parsed[str(path)] for path in file_paths if str(path) in parsed}
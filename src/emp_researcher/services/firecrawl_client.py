@@ -1,10 +1,65 @@
 """Firecrawl deep web crawler integration."""
 
 import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
 from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+import httpx
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from .llm import LLMRouter
 
+_RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Check whether a failed scrape is worth retrying."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _RETRYABLE_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
+
+def _is_resubmittable(error: BaseException) -> bool:
+    """Check whether a failed crawl/map job submission is safe to retry.
+
+    Only failures where the server answered with a retryable status, or the
+    connection was never established, are retried. Other transport errors
+    such as read timeouts may have started a job already.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _RETRYABLE_STATUS_CODES
+    return isinstance(error, httpx.ConnectError)
+
+
+def _backoff(predicate: Callable[[BaseException], bool]) -> Callable:
+    """Build a tenacity retry decorator with exponential backoff.
+
+    Args:
+        predicate: Decides whether a raised exception is retried
+
+    Returns:
+        Retry decorator
+    """
+    return retry(
+        retry=retry_if_exception(predicate),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(min=1, max=10),
+        reraise=True,
+    )
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize a URL for cache lookups (lowercase scheme/host, no fragment)."""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ""))
+
 
 class FirecrawlClient:
     """Client for Firecrawl deep web crawling."""
@@ -16,6 +71,9 @@ class FirecrawlClient:
         api_key: str | None = None,
         max_concurrency: int = 4,
         timeout: int = 120,
+        http_client: httpx.AsyncClient | None = None,
+        cache_ttl: float = 3600,
+        cache_size: int = 2048,
     ):
         """Initialize Firecrawl client.
 
@@ -25,12 +83,22 @@ class FirecrawlClient:
             api_key: API key
             max_concurrency: Maximum concurrent requests
             timeout: Request timeout
+            http_client: Shared HTTP client (optional); when omitted the client
+                creates and owns its own pool on first use
+            cache_ttl: Seconds a successful scrape is reused
+            cache_size: Maximum number of cached scrapes
         """
         self.llm_router = llm_router
         self.base_url = base_url
         self.api_key = api_key
         self.max_concurrency = max_concurrency
         self.timeout = timeout
+        self._client = http_client
+        self._owns_client = http_client is None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._scrape_cache: dict[tuple[str, bool, bool], tuple[float, dict[str, Any]]] = {}
 
     async def scrape_url(
         self,
@@ -40,6 +108,9 @@ class FirecrawlClient:
     ) -> dict[str, Any]:
         """Scrape a single URL.
 
+        Successful results are cached per normalized URL and extraction
+        options for cache_ttl seconds.
+
         Args:
             url: URL to scrape
             extract_images: Extract images
@@ -51,9 +122,10 @@ class FirecrawlClient:
         if not self.api_key:
             return {"error": "API key not configured"}
 
-        import httpx
-
-        headers = {"Authorization": f"Bearer {self.api_key}"}
+        key = (_normalize_url(url), extract_images, extract_tables)
+        cached = self._scrape_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
 
         payload = {
             "url": url,
@@ -62,18 +134,18 @@ class FirecrawlClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/v1/scrape",
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                return response.json()
+            result = await self._scrape(payload)
 
         except Exception as e:
             return {"error": str(e)}
 
+        self._scrape_cache.pop(key, None)
+        if len(self._scrape_cache) >= self.cache_size:
+            self._scrape_cache.pop(next(iter(self._scrape_cache)))
+        self._scrape_cache[key] = (time.monotonic() + self.cache_ttl, result)
+
+        return result
+
     async def batch_scrape(
         self,
         urls: list[str],
@@ -82,6 +154,9 @@ class FirecrawlClient:
     ) -> list[dict[str, Any]]:
         """Scrape multiple URLs in batch.
 
+        Duplicate URLs are scraped once, and at most max_concurrency scrapes
+        are in flight at once.
+
         Args:
             urls: List of URLs to scrape
             extract_images: Extract images
@@ -90,18 +165,44 @@ class FirecrawlClient:
         Returns:
             List of scraped results
         """
-        tasks = [
-            self.scrape_url(
-                url=url,
-                extract_images=extract_images,
-                extract_tables=extract_tables,
-            )
-            for url in urls
-        ]
+        by_url = {
+            url: result
+            async for url, result in self.iter_scrape(urls, extract_images, extract_tables)
+        }
+        return [by_url[url] for url in urls]
+
+    async def iter_scrape(
+        self,
+        urls: list[str],
+        extract_images: bool = False,
+        extract_tables: bool = False,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Scrape multiple URLs, yielding each result as soon as it is done.
+
+        Duplicate URLs are scraped once, and at most max_concurrency scrapes
+        are in flight at once.
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        Args:
+            urls: List of URLs to scrape
+            extract_images: Extract images
+            extract_tables: Extract tables
+
+        Yields:
+            Tuples of (url, scraped result or error dict)
+        """
+
+        async def scrape_one(url: str) -> tuple[str, dict[str, Any]]:
+            try:
+                return url, await self.scrape_url(
+                    url=url,
+                    extract_images=extract_images,
+                    extract_tables=extract_tables,
+                )
+            except Exception as e:
+                return url, {"error": str(e)}
 
-        return [r if not isinstance(r, Exception) else {"error": str(r)} for r in results]
+        for next_done in asyncio.as_completed([scrape_one(url) for url in dict.fromkeys(urls)]):
+            yield await next_done
 
     async def crawl_site(
         self,
@@ -122,10 +223,6 @@ class FirecrawlClient:
         if not self.api_key:
             return {"error": "API key not configured"}
 
-        import httpx
-
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-
         payload = {
             "url": start_url,
             "limit": limit,
@@ -133,14 +230,7 @@ class FirecrawlClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=300) as client:
-                response = await client.post(
-                    f"{self.base_url}/v1/crawl",
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                return response.json()
+            return await self._submit_job("/v1/crawl", payload)
 
         except Exception as e:
             return {"error": str(e)}
@@ -162,10 +252,6 @@ class FirecrawlClient:
         if not self.api_key:
             return {"error": "API key not configured"}
 
-        import httpx
-
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-
         payload = {
             "url": url,
             "limit": limit,
@@ -173,14 +259,7 @@ class FirecrawlClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=300) as client:
-                response = await client.post(
-                    f"{self.base_url}/v1/map",
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                return response.json()
+            return await self._submit_job("/v1/map", payload)
 
         except Exception as e:
             return {"error": str(e)}
@@ -191,16 +270,93 @@ class FirecrawlClient:
         Returns:
             Health status
         """
-        import httpx
-
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(f"{self.base_url}/v1/status")
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client().get(f"{self.base_url}/v1/status", timeout=10)
+            response.raise_for_status()
+            return response.json()
 
         except Exception:
             return {
                 "firecrawl": {"status": "error", "message": "Health check failed"},
                 "overall": "degraded",
             }
+
+    @_backoff(_is_retryable)
+    async def _scrape(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Scrape a page, backing off on rate limits and outages.
+
+        A concurrency slot is held per attempt, not across backoff sleeps.
+
+        Args:
+            payload: Scrape request body
+
+        Returns:
+            Decoded JSON response
+        """
+        async with self._semaphore:
+            return await self._post("/v1/scrape", payload, timeout=self.timeout)
+
+    @_backoff(_is_resubmittable)
+    async def _submit_job(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Submit a crawl or map job, retrying only failures that cannot have started it.
+
+        Args:
+            path: API path
+            payload: JSON request body
+
+        Returns:
+            Decoded JSON response
+        """
+        return await self._post(path, payload, timeout=300)
+
+    async def _post(
+        self,
+        path: str,
+        payload: dict[str, Any],
+        timeout: float,
+    ) -> dict[str, Any]:
+        """POST to the Firecrawl API.
+
+        Args:
+            path: API path
+            payload: JSON request body
+            timeout: Request timeout
+
+        Returns:
+            Decoded JSON response
+        """
+        response = await self._get_client().post(
+            f"{self.base_url}{path}",
+            headers=self._auth_headers(),
+            json=payload,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client.
+
+        Returns:
+            Injected HTTP client, or a client-owned one created on first use
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency * 2,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+        return self._client
+
+    def _auth_headers(self) -> dict[str, str]:
+        """Build the Firecrawl authorization header."""
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -1,10 +1,149 @@
 """GraphRAG engine with Neo4j integration."""
 
 import asyncio
-import uuid
+import json
+import re
+import secrets
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
-from ..services import LLMRouter
+import numpy as np
+import orjson
+
+from .llm import LLMRouter
+
+try:
+    from neo4j import AsyncGraphDatabase
+except ImportError:
+    AsyncGraphDatabase = None
+
+_EXTRACT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an entity extraction specialist. Extract entities, relationships, and attributes from the text.",
+}
+_EXTRACT_USER_TEMPLATE = "Extract entities from this text:\n{text}\n\nReturn JSON with keys: entities (list), relations (list of dicts with source, target, type), attributes (dict of entity to attributes)."
+
+_COMMUNITIES_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a graph analyst. Group entities into meaningful communities (3-10 communities).",
+}
+_COMMUNITIES_USER_TEMPLATE = """Analyze a knowledge graph with ~{entity_count} entities.
+
+Group them into communities by:
+1. Semantic relatedness (entities that appear together)
+2. Domain/topic grouping
+3. Hierarchical relationships
+
+Return JSON with keys: communities (list of objects with id, title, entity_count)."""
+
+_SUMMARY_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a summarization specialist. Create concise summaries of graph communities.",
+}
+_SUMMARY_USER_TEMPLATE = """Summarize this community of entities:
+{entity_names}
+
+Provide a 100-200 word summary covering:
+1. Main theme/topic
+2. Key entities
+3. Important relationships"""
+
+_GLOBAL_SEARCH_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a GraphRAG global search specialist.",
+}
+_GLOBAL_SEARCH_USER_TEMPLATE = """Perform global search across communities for: {query}
+
+1. Identify most relevant communities
+2. Search within those communities
+3. Return top {top_k} results
+
+Return JSON with keys: relevant_communities (list), search_results (list)."""
+
+_LOCAL_SEARCH_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a GraphRAG local search specialist.",
+}
+_LOCAL_SEARCH_USER_TEMPLATE = """Perform local search for: {query}
+
+Community: {community}
+
+Return top {top_k} relevant entities with context.
+
+Return JSON with keys: entities (list of objects with name, description, relevance_score)."""
+
+_ENTITY_INDEX_CYPHER = "CREATE INDEX entity_id IF NOT EXISTS FOR (n:Entity) ON (n.id)"
+_UPSERT_ENTITIES_CYPHER = """
+UNWIND $rows AS row
+MERGE (n:Entity {id: row.id})
+SET n.name = row.name, n.document_id = row.document_id, n.type = row.type
+"""
+_UPSERT_RELATIONS_CYPHER = """
+UNWIND $rows AS row
+MATCH (s:Entity {id: row.source_id})
+MATCH (t:Entity {id: row.target_id})
+MERGE (s)-[r:RELATED_TO {type: row.type}]->(t)
+SET r.document_id = row.document_id
+"""
+_GET_NODES_CYPHER = """
+UNWIND $ids AS id
+MATCH (n:Entity {id: id})
+RETURN n
+"""
+_GET_EDGES_CYPHER = """
+UNWIND $pairs AS p
+MATCH (s:Entity {id: p.src})-[r]->(t:Entity {id: p.tgt})
+RETURN p.src AS source, p.tgt AS target, r
+"""
+_NODE_DEGREES_CYPHER = """
+UNWIND $ids AS id
+MATCH (n:Entity {id: id})
+RETURN id, COUNT { (n)--() } AS degree
+"""
+
+
+_ENTITIES_ARRAY_RE = re.compile(r'"entities"\s*:\s*\[')
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _scan_array(text: str, pos: int) -> tuple[list[Any], int, bool]:
+    """Decode the complete items of a partially received JSON array.
+
+    Args:
+        text: Buffer holding the array text received so far
+        pos: Offset just past the opening bracket or the last decoded item
+
+    Returns:
+        Tuple of (decoded items, offset to resume from, whether the array closed)
+    """
+    items = []
+    length = len(text)
+
+    while True:
+        while pos < length and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= length:
+            return items, pos, False
+        if text[pos] == "]":
+            return items, pos + 1, True
+
+        try:
+            item, end = _JSON_DECODER.raw_decode(text, pos)
+        except ValueError:
+            return items, pos, False
+
+        if end >= length and not isinstance(item, (str, dict, list)):
+            return items, pos, False
+
+        items.append(item)
+        pos = end
+
+
+def _random_ids(prefix: str, count: int) -> list[str]:
+    """Generate count random 8-hex-digit ids from a single urandom read."""
+    token = secrets.token_hex(4 * count)
+    return [f"{prefix}{token[i : i + 8]}" for i in range(0, 8 * count, 8)]
 
 
 class GraphRAGEngine:
@@ -17,6 +156,9 @@ class GraphRAGEngine:
         neo4j_user: str = "neo4j",
         neo4j_password: str = "",
         database: str = "neo4j",
+        semantic_cache_size: int = 256,
+        semantic_cache_threshold: float | None = None,
+        query_cache_ttl: float = 300.0,
     ):
         """Initialize GraphRAG engine.
 
@@ -26,6 +168,11 @@ class GraphRAGEngine:
             neo4j_user: Neo4j username
             neo4j_password: Neo4j password
             database: Database name
+            semantic_cache_size: Maximum cached search results (0 disables caching)
+            semantic_cache_threshold: Cosine similarity above which a cached
+                result for a paraphrased query is reused (optional; None
+                disables the semantic tier, which costs an embedding per miss)
+            query_cache_ttl: Seconds a cached search result stays valid
         """
         self.llm_router = llm_router
         self.neo4j_uri = neo4j_uri
@@ -33,6 +180,10 @@ class GraphRAGEngine:
         self.neo4j_password = neo4j_password
         self.database = database
         self.driver = None
+        self.semantic_cache_size = semantic_cache_size
+        self.semantic_cache_threshold = semantic_cache_threshold
+        self.query_cache_ttl = query_cache_ttl
+        self._query_cache: dict[tuple[Any, ...], tuple[float, np.ndarray | None, list[Any]]] = {}
 
     async def connect(self) -> None:
         """Connect to Neo4j database.
@@ -40,16 +191,18 @@ class GraphRAGEngine:
         Raises:
             ConnectionError: If connection fails
         """
-        try:
-            from neo4j import AsyncGraphDatabase
-
-            self.driver = AsyncGraphDatabase(
-                self.neo4j_uri,
-                auth=(self.neo4j_user, self.neo4j_password),
-            )
-            await self.driver.verify_connectivity()
-        except ImportError:
+        if AsyncGraphDatabase is None:
             self.driver = None
+            return
+
+        self.driver = AsyncGraphDatabase.driver(
+            self.neo4j_uri,
+            auth=(self.neo4j_user, self.neo4j_password),
+        )
+        await self.driver.verify_connectivity()
+
+        async with self.driver.session(database=self.database) as session:
+            await session.run(_ENTITY_INDEX_CYPHER)
 
     async def disconnect(self) -> None:
         """Disconnect from Neo4j."""
@@ -60,66 +213,289 @@ class GraphRAGEngine:
         self,
         text: str,
         document_id: str,
+        stream: bool = False,
     ) -> list[dict[str, Any]]:
         """Extract entities and relationships from text.
 
         Args:
             text: Text to extract from
             document_id: Document identifier
+            stream: Stream the LLM response, decoding entities while the rest
+                is generated; streamed requests bypass the router response
+                cache. Nothing is written until the full response parses.
 
         Returns:
             List of extracted entities and relationships
         """
+        extraction = await self._extract(text, document_id, stream)
+        if extraction is None:
+            return []
+
+        entities, relations, entity_rows, relation_rows = extraction
+        await self.upsert_entities(entity_rows, relation_rows)
+
+        return entities + relations
+
+    async def extract_entities_batch(
+        self,
+        documents: list[tuple[str, str]],
+        max_concurrency: int = 8,
+    ) -> list[list[dict[str, Any]]]:
+        """Extract entities from several documents and write them together.
+
+        LLM calls run concurrently, and all entities and relations are
+        written in one Neo4j transaction once every document is done.
+
+        Args:
+            documents: (text, document_id) pairs
+            max_concurrency: Maximum extraction calls in flight
+
+        Returns:
+            Extracted entities and relationships per document, in input order;
+            documents that failed yield an empty list
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def extract_one(text: str, document_id: str) -> tuple[list[Any], ...] | None:
+            async with semaphore:
+                try:
+                    return await self._extract(text, document_id)
+                except Exception:
+                    return None
+
+        extractions = await asyncio.gather(
+            *(extract_one(text, document_id) for text, document_id in documents)
+        )
+        done = [extraction for extraction in extractions if extraction is not None]
+
+        await self.upsert_entities(
+            [row for extraction in done for row in extraction[2]],
+            [row for extraction in done for row in extraction[3]],
+        )
+
+        return [
+            extraction[0] + extraction[1] if extraction is not None else []
+            for extraction in extractions
+        ]
+
+    async def _extract(
+        self,
+        text: str,
+        document_id: str,
+        stream: bool = False,
+    ) -> tuple[list[dict[str, Any]], ...] | None:
+        """Run entity extraction for one document without the final write.
+
+        Args:
+            text: Text to extract from
+            document_id: Document identifier
+            stream: Stream the response, decoding entities as they complete
+
+        Returns:
+            Tuple of (entities, relations, entity rows to write, relation rows
+            to write), or None if the response was not valid JSON
+        """
         messages = [
-            {
-                "role": "system",
-                "content": "You are an entity extraction specialist. Extract entities, relationships, and attributes from the text.",
-            },
-            {
-                "role": "user",
-                "content": f"Extract entities from this text:\n{text}\n\nReturn JSON with keys: entities (list), relations (list of dicts with source, target, type), attributes (dict of entity to attributes).",
-            },
+            _EXTRACT_SYSTEM_MESSAGE,
+            {"role": "user", "content": _EXTRACT_USER_TEMPLATE.format(text=text)},
         ]
 
-        response = await self.llm_router.route_chat(
-            messages=messages,
-            task_type="graph_community_summarization",
-        )
+        if stream:
+            content, streamed = await self._stream_extraction(messages, document_id)
+        else:
+            response = await self.llm_router.route_chat(
+                messages=messages,
+                task_type="graph_community_summarization",
+            )
+            content, streamed = response.choices[0].message.content, []
 
         try:
-            import json
-
-            result = json.loads(response.choices[0].message.content)
-
-            entities = []
-            relations = []
-
-            for entity in result.get("entities", []):
-                entity_id = f"ent_{uuid.uuid4().hex[:8]}"
-                entities.append(
-                    {
-                        "id": entity_id,
-                        "name": entity,
-                        "document_id": document_id,
-                        "type": "entity",
-                    }
+            result = orjson.loads(content)
+
+            names = result.get("entities", [])
+            entities = streamed[: len(names)] + [
+                {
+                    "id": entity_id,
+                    "name": name,
+                    "document_id": document_id,
+                    "type": "entity",
+                }
+                for entity_id, name in zip(
+                    _random_ids("ent_", len(names) - len(streamed)),
+                    names[len(streamed) :],
+                    strict=True,
                 )
+            ]
+            relations = [
+                {
+                    "source": relation.get("source"),
+                    "target": relation.get("target"),
+                    "type": relation.get("type", "RELATED_TO"),
+                    "document_id": document_id,
+                }
+                for relation in result.get("relations", ())
+            ]
+            ids_by_name = {
+                entity["name"]: entity["id"]
+                for entity in reversed(entities)
+                if isinstance(entity["name"], str)
+            }
 
-            for relation in result.get("relations", []):
-                relations.append(
-                    {
-                        "source": relation.get("source"),
-                        "target": relation.get("target"),
-                        "type": relation.get("type", "RELATED_TO"),
-                        "document_id": document_id,
-                    }
-                )
+        except Exception:
+            return None
+
+        relation_rows = [
+            {
+                "source_id": ids_by_name[relation["source"]],
+                "target_id": ids_by_name[relation["target"]],
+                "type": relation["type"],
+                "document_id": document_id,
+            }
+            for relation in relations
+            if isinstance(relation["source"], str)
+            and isinstance(relation["target"], str)
+            and relation["source"] in ids_by_name
+            and relation["target"] in ids_by_name
+        ]
+        entity_rows = [entity for entity in entities if isinstance(entity["name"], str)]
 
-            return entities + relations
+        return entities, relations, entity_rows, relation_rows
 
-        except Exception:
+    async def _stream_extraction(
+        self,
+        messages: list[dict[str, Any]],
+        document_id: str,
+    ) -> tuple[str, list[dict[str, Any]]]:
+        """Stream an extraction response, decoding entities as they complete.
+
+        Items of the "entities" array are decoded as soon as they are fully
+        received, so parsing overlaps with generation. Rows are only
+        returned, never written here: a response that turns out truncated or
+        malformed must not leave partial entities in the graph.
+
+        Args:
+            messages: Extraction prompt
+            document_id: Document identifier
+
+        Returns:
+            Tuple of (full response text, entity rows in response order)
+        """
+        buffer = ""
+        pos: int | None = None
+        closed = False
+        streamed: list[dict[str, Any]] = []
+
+        async for fragment in self.llm_router.route_chat_stream(
+            messages,
+            task_type="graph_community_summarization",
+        ):
+            buffer += fragment
+            if closed:
+                continue
+
+            if pos is None:
+                match = _ENTITIES_ARRAY_RE.search(buffer)
+                if match is None:
+                    continue
+                pos = match.end()
+
+            names, pos, closed = _scan_array(buffer, pos)
+            streamed.extend(
+                {"id": entity_id, "name": name, "document_id": document_id, "type": "entity"}
+                for entity_id, name in zip(_random_ids("ent_", len(names)), names, strict=True)
+            )
+
+        return buffer, streamed
+
+    async def upsert_entities(
+        self,
+        entities: list[dict[str, Any]],
+        relations: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """Write entities and relations in a single transaction.
+
+        Each list is sent as one UNWIND statement, so a document costs one
+        round trip per list rather than one per row.
+
+        Args:
+            entities: Entity rows with id, name, document_id and type
+            relations: Relation rows with source_id, target_id, type and document_id
+        """
+        if not self.driver or not (entities or relations):
+            return
+
+        async def write(tx: Any) -> None:
+            if entities:
+                await tx.run(_UPSERT_ENTITIES_CYPHER, rows=entities)
+            if relations:
+                await tx.run(_UPSERT_RELATIONS_CYPHER, rows=relations)
+
+        async with self.driver.session(database=self.database) as session:
+            await session.execute_write(write)
+
+        self._query_cache.clear()
+
+    async def upsert_relations(self, relations: list[dict[str, Any]]) -> None:
+        """Write relations between existing entities in a single transaction.
+
+        Args:
+            relations: Relation rows with source_id, target_id, type and document_id
+        """
+        await self.upsert_entities([], relations)
+
+    async def get_nodes(self, ids: list[str]) -> list[dict[str, Any]]:
+        """Fetch entity nodes by id with one query.
+
+        Args:
+            ids: Entity identifiers
+
+        Returns:
+            Node properties for the ids that exist
+        """
+        if not self.driver or not ids:
             return []
 
+        async with self.driver.session(database=self.database) as session:
+            result = await session.run(_GET_NODES_CYPHER, ids=ids)
+            return [dict(record["n"]) async for record in result]
+
+    async def get_edges(self, pairs: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """Fetch edges between entity pairs with one query.
+
+        Args:
+            pairs: (source id, target id) pairs
+
+        Returns:
+            Edge properties with source and target ids
+        """
+        if not self.driver or not pairs:
+            return []
+
+        rows = [{"src": src, "tgt": tgt} for src, tgt in pairs]
+
+        async with self.driver.session(database=self.database) as session:
+            result = await session.run(_GET_EDGES_CYPHER, pairs=rows)
+            return [
+                {"source": record["source"], "target": record["target"], **dict(record["r"])}
+                async for record in result
+            ]
+
+    async def node_degrees(self, ids: list[str]) -> dict[str, int]:
+        """Count relationships per entity with one query.
+
+        Args:
+            ids: Entity identifiers
+
+        Returns:
+            Mapping of entity id to degree for the ids that exist
+        """
+        if not self.driver or not ids:
+            return {}
+
+        async with self.driver.session(database=self.database) as session:
+            result = await session.run(_NODE_DEGREES_CYPHER, ids=ids)
+            return {record["id"]: record["degree"] async for record in result}
+
     async def detect_communities(
         self,
         entity_count: int = 100,
@@ -135,23 +511,11 @@ class GraphRAGEngine:
         if not self.driver:
             return []
 
-        from neo4j import AsyncGraphDatabase
-
         messages = [
-            {
-                "role": "system",
-                "content": "You are a graph analyst. Group entities into meaningful communities (3-10 communities).",
-            },
+            _COMMUNITIES_SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": f"""Analyze a knowledge graph with ~{entity_count} entities.
-
-Group them into communities by:
-1. Semantic relatedness (entities that appear together)
-2. Domain/topic grouping
-3. Hierarchical relationships
-
-Return JSON with keys: communities (list of objects with id, title, entity_count).""",
+                "content": _COMMUNITIES_USER_TEMPLATE.format(entity_count=entity_count),
             },
         ]
 
@@ -161,22 +525,20 @@ Return JSON with keys: communities (list of objects with id, title, entity_count
         )
 
         try:
-            import json
-
-            result = json.loads(response.choices[0].message.content)
-
-            communities = []
-            for i, community in enumerate(result.get("communities", [])):
-                community_id = f"comm_{uuid.uuid4().hex[:8]}"
-                communities.append(
-                    {
-                        "id": community_id,
-                        "title": community.get("title", f"Community {i + 1}"),
-                        "entity_count": len(community.get("entities", [])),
-                    }
+            result = orjson.loads(response.choices[0].message.content)
+
+            raw_communities = result.get("communities", [])
+
+            return [
+                {
+                    "id": community_id,
+                    "title": community.get("title", f"Community {i + 1}"),
+                    "entity_count": len(community.get("entities", [])),
+                }
+                for i, (community_id, community) in enumerate(
+                    zip(_random_ids("comm_", len(raw_communities)), raw_communities, strict=True)
                 )
-
-            return communities
+            ]
 
         except Exception:
             return []
@@ -198,19 +560,10 @@ Return JSON with keys: communities (list of objects with id, title, entity_count
         entity_names = [e["name"] for e in entities[:10]]
 
         messages = [
-            {
-                "role": "system",
-                "content": "You are a summarization specialist. Create concise summaries of graph communities.",
-            },
+            _SUMMARY_SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": f"""Summarize this community of entities:
-{", ".join(entity_names)}
-
-Provide a 100-200 word summary covering:
-1. Main theme/topic
-2. Key entities
-3. Important relationships""",
+                "content": _SUMMARY_USER_TEMPLATE.format(entity_names=", ".join(entity_names)),
             },
         ]
 
@@ -228,6 +581,8 @@ Provide a 100-200 word summary covering:
     ) -> list[dict[str, Any]]:
         """Perform global search using community-level information.
 
+        Repeated and paraphrased queries are served from the query cache.
+
         Args:
             query: Search query
             top_k: Number of top results
@@ -238,22 +593,17 @@ Provide a 100-200 word summary covering:
         if not self.driver:
             return []
 
-        from neo4j import AsyncGraphDatabase
+        return await self._cached_search(
+            ("global", top_k), query, lambda q: self._run_global_search(q, top_k)
+        )
 
+    async def _run_global_search(self, query: str, top_k: int) -> list[dict[str, Any]]:
+        """Ask the LLM for global search results."""
         messages = [
-            {
-                "role": "system",
-                "content": "You are a GraphRAG global search specialist.",
-            },
+            _GLOBAL_SEARCH_SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": f"""Perform global search across communities for: {query}
-
-1. Identify most relevant communities
-2. Search within those communities
-3. Return top {top_k} results
-
-Return JSON with keys: relevant_communities (list), search_results (list).""",
+                "content": _GLOBAL_SEARCH_USER_TEMPLATE.format(query=query, top_k=top_k),
             },
         ]
 
@@ -263,9 +613,7 @@ Return JSON with keys: relevant_communities (list), search_results (list).""",
         )
 
         try:
-            import json
-
-            result = json.loads(response.choices[0].message.content)
+            result = orjson.loads(response.choices[0].message.content)
             return result.get("search_results", [])
         except Exception:
             return []
@@ -278,6 +626,8 @@ Return JSON with keys: relevant_communities (list), search_results (list).""",
     ) -> list[dict[str, Any]]:
         """Perform local search within a community.
 
+        Repeated and paraphrased queries are served from the query cache.
+
         Args:
             query: Search query
             community_id: Community identifier
@@ -289,22 +639,26 @@ Return JSON with keys: relevant_communities (list), search_results (list).""",
         if not self.driver:
             return []
 
-        from neo4j import AsyncGraphDatabase
+        return await self._cached_search(
+            ("local", community_id, top_k),
+            query,
+            lambda q: self._run_local_search(q, community_id, top_k),
+        )
 
+    async def _run_local_search(
+        self,
+        query: str,
+        community_id: str | None,
+        top_k: int,
+    ) -> list[dict[str, Any]]:
+        """Ask the LLM for local search results."""
         messages = [
-            {
-                "role": "system",
-                "content": "You are a GraphRAG local search specialist.",
-            },
+            _LOCAL_SEARCH_SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": f"""Perform local search for: {query}
-
-Community: {community_id or "general"}
-
-Return top {top_k} relevant entities with context.
-
-Return JSON with keys: entities (list of objects with name, description, relevance_score).""",
+                "content": _LOCAL_SEARCH_USER_TEMPLATE.format(
+                    query=query, community=community_id or "general", top_k=top_k
+                ),
             },
         ]
 
@@ -314,13 +668,95 @@ Return JSON with keys: entities (list of objects with name, description, relevan
         )
 
         try:
-            import json
-
-            result = json.loads(response.choices[0].message.content)
+            result = orjson.loads(response.choices[0].message.content)
             return result.get("entities", [])
         except Exception:
             return []
 
+    async def _cached_search(
+        self,
+        scope: tuple[Any, ...],
+        query: str,
+        search: Callable[[str], Awaitable[list[Any]]],
+    ) -> list[Any]:
+        """Serve a graph search from the query cache before calling the LLM.
+
+        Tier 1 matches the whitespace-normalized query exactly. Tier 2, when
+        semantic_cache_threshold is set, embeds the query and reuses the
+        closest cached result in the same scope when its cosine similarity
+        reaches the threshold. Tier 3 runs the search; non-empty results are
+        cached for query_cache_ttl seconds with LRU eviction.
+
+        Args:
+            scope: Search kind and parameters that results must share
+            query: Search query
+            search: Runs the uncached search for a normalized query
+
+        Returns:
+            Search results
+        """
+        canonical = " ".join(query.split())
+
+        if self.semantic_cache_size <= 0:
+            return await search(canonical)
+
+        now = time.monotonic()
+        key = (scope, canonical)
+        entry = self._query_cache.pop(key, None)
+        if entry is not None and entry[0] > now:
+            self._query_cache[key] = entry
+            return entry[2]
+
+        vector = None
+        if self.semantic_cache_threshold is not None:
+            vector = await self._embed_query(canonical)
+
+        if vector is not None:
+            candidates = [
+                (cached_key, cached[1])
+                for cached_key, cached in self._query_cache.items()
+                if cached_key[0] == scope and cached[1] is not None and cached[0] > now
+            ]
+            if candidates:
+                scores = np.stack([cached_vec for _, cached_vec in candidates]) @ vector
+                best = int(np.argmax(scores))
+                if scores[best] >= self.semantic_cache_threshold:
+                    best_key = candidates[best][0]
+                    entry = self._query_cache.pop(best_key)
+                    self._query_cache[best_key] = entry
+                    return entry[2]
+
+        results = await search(canonical)
+
+        if results:
+            if len(self._query_cache) >= self.semantic_cache_size:
+                self._query_cache.pop(next(iter(self._query_cache)))
+            self._query_cache[key] = (time.monotonic() + self.query_cache_ttl, vector, results)
+
+        return results
+
+    async def _embed_query(self, query: str) -> np.ndarray | None:
+        """Embed a query as a unit float32 vector.
+
+        Args:
+            query: Normalized query
+
+        Returns:
+            Normalized embedding, or None if embedding failed
+        """
+        try:
+            response = await self.llm_router.route_embed([query])
+            if isinstance(response, dict):
+                values = response["embeddings"][0]
+            else:
+                values = response.data[0].embedding
+        except Exception:
+            return None
+
+        vector = np.asarray(values, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
     async def health_check(self) -> dict[str, Any]:
         """Check GraphRAG health.
 
@@ -0,0 +1,58 @@
+"""Numba-compiled top-k selection for embedding rerank.
+
+Importing this module requires the optional ``numba`` extra.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def topk(scores: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Select the k highest scores with an array-backed min-heap.
+
+    Args:
+        scores: 1-D array of scores
+        k: Number of results to keep (1 <= k <= len(scores))
+
+    Returns:
+        Tuple of (indices, scores) sorted by descending score
+    """
+    heap_scores = np.empty(k, dtype=scores.dtype)
+    heap_idx = np.empty(k, dtype=np.int64)
+    size = 0
+
+    for i in range(scores.shape[0]):
+        score = scores[i]
+
+        if size < k:
+            pos = size
+            size += 1
+            while pos > 0:
+                parent = (pos - 1) >> 1
+                if heap_scores[parent] <= score:
+                    break
+                heap_scores[pos] = heap_scores[parent]
+                heap_idx[pos] = heap_idx[parent]
+                pos = parent
+        elif score > heap_scores[0]:
+            pos = 0
+            while True:
+                child = 2 * pos + 1
+                if child >= k:
+                    break
+                if child + 1 < k and heap_scores[child + 1] < heap_scores[child]:
+                    child += 1
+                if heap_scores[child] >= score:
+                    break
+                heap_scores[pos] = heap_scores[child]
+                heap_idx[pos] = heap_idx[child]
+                pos = child
+        else:
+            continue
+
+        heap_scores[pos] = score
+        heap_idx[pos] = i
+
+    order = np.argsort(-heap_scores[:size], kind="mergesort")
+    return heap_idx[:size][order], heap_scores[:size][order]
@@ -1,15 +1,27 @@
 """LLM Provider abstraction layer."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any
 
+import numpy as np
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from openai.types.create_embedding import CreateEmbeddingResponse
 
+try:
+    from ._topk_numba import topk as numba_topk
+except ImportError:
+    numba_topk = None
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    embed_batch_size: int = 64
+    embed_concurrency: int = 4
+    rerank_backend: str = "numpy"
+
     @abstractmethod
     async def chat(
         self,
@@ -31,6 +43,30 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def chat_batch(
+        self,
+        batch: list[list[dict[str, Any]]],
+        model: str,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """Send several independent chat requests.
+
+        Providers with a native batch endpoint can override this; the
+        default submits the requests concurrently.
+
+        Args:
+            batch: List of chat message lists
+            model: Model name to use
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Responses in input order; failed requests yield their exception
+        """
+        return await asyncio.gather(
+            *(self.chat(messages, model=model, **kwargs) for messages in batch),
+            return_exceptions=True,
+        )
+
     @abstractmethod
     async def embed(
         self,
@@ -73,6 +109,126 @@ class LLMProvider(ABC):
         """
         pass
 
+    def slice_embeddings(self, response: Any, start: int, stop: int) -> Any:
+        """Cut a batched embedding response down to a contiguous range of inputs.
+
+        Args:
+            response: Response from embed()
+            start: Index of the first input to keep
+            stop: Index one past the last input to keep
+
+        Returns:
+            Embedding response covering inputs[start:stop]
+        """
+        data = [
+            item.model_copy(update={"index": index})
+            for index, item in enumerate(response.data[start:stop])
+        ]
+        return response.model_copy(update={"data": data})
+
+    async def _embed_query_and_docs(
+        self,
+        query: str,
+        docs: list[str],
+        model: str,
+        vectors: Callable[[Any], list[Any]],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Embed a query and its documents concurrently.
+
+        Documents are split into shards of embed_batch_size, and at most
+        embed_concurrency embed() calls are in flight at once. Each shard
+        is packed into a float32 array as soon as it arrives, so the
+        provider's per-float Python lists are released shard by shard.
+
+        Args:
+            query: Query string
+            docs: Document strings
+            model: Embedding model name
+            vectors: Extracts the list of vectors from an embed() response
+
+        Returns:
+            Tuple of (query vector, document matrix in input order)
+        """
+        semaphore = asyncio.Semaphore(self.embed_concurrency)
+        size = self.embed_batch_size
+
+        async def embed_shard(texts: list[str]) -> np.ndarray:
+            async with semaphore:
+                response = await self.embed(texts, model=model)
+            return np.asarray(vectors(response), dtype=np.float32)
+
+        query_vecs, *doc_shards = await asyncio.gather(
+            embed_shard([query]),
+            *(embed_shard(docs[i : i + size]) for i in range(0, len(docs), size)),
+        )
+
+        if not doc_shards:
+            return query_vecs[0], np.empty((0, query_vecs.shape[1]), dtype=np.float32)
+
+        return query_vecs[0], np.concatenate(doc_shards)
+
+    def _rank_by_cosine(
+        self,
+        query_vec: Any,
+        doc_vecs: Any,
+        top_k: int,
+    ) -> list[tuple[int, float]]:
+        """Rank documents by cosine similarity to the query.
+
+        Vectors are L2-normalized as float32, scored with one matrix-vector
+        product, and only the top_k candidates are sorted. Selection uses
+        the Numba heap when rerank_backend is "numba" and numba is installed.
+
+        Args:
+            query_vec: Query embedding
+            doc_vecs: Document embeddings, one row per document
+            top_k: Number of top results to return
+
+        Returns:
+            List of (doc_index, score) tuples sorted by relevance
+        """
+        docs = np.asarray(doc_vecs, dtype=np.float32)
+        query = np.asarray(query_vec, dtype=np.float32)
+        count = len(docs)
+        top_k = min(top_k, count)
+
+        if top_k <= 0:
+            return []
+
+        docs /= np.linalg.norm(docs, axis=1, keepdims=True) + 1e-12
+        query /= np.linalg.norm(query) + 1e-12
+        scores = docs @ query
+
+        if self.rerank_backend == "numba" and numba_topk is not None:
+            idx, top_scores = numba_topk(scores, top_k)
+            return list(zip(idx.tolist(), top_scores.tolist(), strict=True))
+
+        if top_k < count:
+            idx = np.argpartition(-scores, top_k - 1)[:top_k]
+            idx = idx[np.argsort(-scores[idx], kind="stable")]
+        else:
+            idx = np.argsort(-scores, kind="stable")
+
+        return list(zip(idx.tolist(), scores[idx].tolist(), strict=True))
+
+    def structured_output_params(self, schema: dict[str, Any]) -> dict[str, Any]:
+        """Build chat parameters that constrain the response to JSON.
+
+        Args:
+            schema: JSON schema the response should follow
+
+        Returns:
+            Extra keyword arguments for chat()
+        """
+        return {"response_format": {"type": "json_object"}}
+
+    async def aclose(self) -> None:
+        """Release resources held by the provider.
+
+        Providers that create their own HTTP client override this.
+        """
+        return None
+
     @abstractmethod
     async def health_check(self) -> bool:
         """Check if provider is healthy and accessible.
@@ -1,25 +1,53 @@
 """Ollama LLM provider implementation."""
 
+from collections.abc import AsyncIterator
+from operator import itemgetter
 from typing import Any
 
 import httpx
+import orjson
 
 from .base import LLMProvider
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class OllamaProvider(LLMProvider):
     """Ollama provider for local LLM inference."""
 
-    def __init__(self, base_url: str = "http://localhost:11434", timeout: int = 120):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        timeout: int = 120,
+        http_client: httpx.AsyncClient | None = None,
+        embed_batch_size: int = 64,
+        embed_concurrency: int = 4,
+        rerank_backend: str = "numpy",
+    ):
         """Initialize Ollama provider.
 
         Args:
             base_url: Ollama API base URL
             timeout: Request timeout in seconds
+            http_client: Shared HTTP client (optional, a private one is created if omitted)
+            embed_batch_size: Documents per embedding request when reranking
+            embed_concurrency: Maximum embedding requests in flight when reranking
+            rerank_backend: Top-k selection backend ("numpy" or "numba")
         """
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.client = http_client or httpx.AsyncClient(
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        self._owns_client = http_client is None
         self.timeout = timeout
+        self._chat_url = f"{self.base_url}/api/chat"
+        self._embed_url = f"{self.base_url}/api/embed"
+        self._tags_url = f"{self.base_url}/api/tags"
+        self.embed_batch_size = embed_batch_size
+        self.embed_concurrency = embed_concurrency
+        self.rerank_backend = rerank_backend
 
     async def chat(
         self,
@@ -36,12 +64,31 @@ class OllamaProvider(LLMProvider):
             **kwargs,
         }
 
+        if stream:
+            return self._stream_chat(payload)
+
         response = await self.client.post(
-            f"{self.base_url}/api/chat",
-            json=payload,
+            self._chat_url,
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS,
+            timeout=self.timeout,
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+
+    async def _stream_chat(self, payload: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        """Yield parsed NDJSON chunks from a streaming chat request."""
+        async with self.client.stream(
+            "POST",
+            self._chat_url,
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS,
+            timeout=self.timeout,
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line:
+                    yield orjson.loads(line)
 
     async def embed(
         self,
@@ -60,11 +107,13 @@ class OllamaProvider(LLMProvider):
         }
 
         response = await self.client.post(
-            f"{self.base_url}/api/embed",
-            json=payload,
+            self._embed_url,
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS,
+            timeout=self.timeout,
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def rerank(
         self,
@@ -74,29 +123,34 @@ class OllamaProvider(LLMProvider):
         top_k: int | None = None,
         **kwargs: Any,
     ) -> list[tuple[int, float]]:
-        """Rerank documents using embeddings."""
-        import numpy as np
-
+        """Rerank documents by cosine similarity of their embeddings."""
         if top_k is None:
             top_k = len(docs)
 
-        query_result = await self.embed([query], model=model)
-        doc_result = await self.embed(docs, model=model)
+        query_vec, doc_vecs = await self._embed_query_and_docs(
+            query, docs, model, itemgetter("embeddings")
+        )
 
-        query_vec = np.array(query_result["embeddings"][0])
-        doc_vecs = np.array(doc_result["embeddings"])
+        return self._rank_by_cosine(query_vec, doc_vecs, top_k)
 
-        similarities = np.dot(doc_vecs, query_vec).tolist()
-        indexed_scores = [(i, score) for i, score in enumerate(similarities)]
-        indexed_scores.sort(key=lambda x: x[1], reverse=True)
+    def slice_embeddings(self, response: Any, start: int, stop: int) -> Any:
+        """Cut a batched Ollama embedding response down to a range of inputs."""
+        return {**response, "embeddings": response["embeddings"][start:stop]}
 
-        return indexed_scores[:top_k]
+    def structured_output_params(self, schema: dict[str, Any]) -> dict[str, Any]:
+        """Constrain output with Ollama's native JSON schema support."""
+        return {"format": schema}
 
     async def health_check(self) -> bool:
         """Check if Ollama is healthy."""
         try:
-            response = await self.client.get(f"{self.base_url}/api/tags")
+            response = await self.client.get(self._tags_url)
             response.raise_for_status()
             return True
         except Exception:
             return False
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this provider created it."""
+        if self._owns_client:
+            await self.client.aclose()
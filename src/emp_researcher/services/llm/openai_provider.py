@@ -1,9 +1,11 @@
 """OpenAI-compatible LLM provider implementation."""
 
 import os
+from operator import itemgetter
 from typing import Any
 
 import httpx
+import orjson
 from openai import AsyncOpenAI
 
 from .base import LLMProvider
@@ -17,6 +19,11 @@ class OpenAICompatibleProvider(LLMProvider):
         base_url: str,
         api_key: str | None = None,
         timeout: int = 60,
+        http_client: httpx.AsyncClient | None = None,
+        embed_batch_size: int = 64,
+        embed_concurrency: int = 4,
+        rerank_backend: str = "numpy",
+        rerank_endpoint: str | None = None,
     ):
         """Initialize OpenAI-compatible provider.
 
@@ -24,18 +31,38 @@ class OpenAICompatibleProvider(LLMProvider):
             base_url: API base URL
             api_key: API key (optional, reads from env if not provided)
             timeout: Request timeout in seconds
+            http_client: Shared HTTP client (optional, a private one is created if omitted)
+            embed_batch_size: Documents per embedding request when reranking
+            embed_concurrency: Maximum embedding requests in flight when reranking
+            rerank_backend: Top-k selection backend ("numpy" or "numba")
+            rerank_endpoint: Native rerank endpoint, as a URL or a path under
+                base_url (optional); embedding similarity is used when omitted
         """
         api_key = api_key or os.getenv("OPENAI_API_KEY", "")
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
         self.client = AsyncOpenAI(
             base_url=base_url,
             api_key=api_key,
             timeout=httpx.Timeout(timeout),
-            http_client=httpx.AsyncClient(
-                timeout=timeout,
-                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
-            ),
+            http_client=self._http,
         )
         self.base_url = base_url
+        self.timeout = timeout
+        self._auth_headers = {"Authorization": f"Bearer {api_key}"}
+        self._rerank_url = None
+        if rerank_endpoint:
+            self._rerank_url = (
+                rerank_endpoint
+                if "://" in rerank_endpoint
+                else f"{base_url.rstrip('/')}/{rerank_endpoint.lstrip('/')}"
+            )
+        self.embed_batch_size = embed_batch_size
+        self.embed_concurrency = embed_concurrency
+        self.rerank_backend = rerank_backend
 
     async def chat(
         self,
@@ -75,27 +102,63 @@ class OpenAICompatibleProvider(LLMProvider):
         top_k: int | None = None,
         **kwargs: Any,
     ) -> list[tuple[int, float]]:
-        """Rerank documents using cross-encoder model.
+        """Rerank documents by relevance to the query.
 
-        Note: This is a basic implementation. For production,
-        consider using specialized rerank APIs (e.g., BGE-Reranker).
+        Uses the native rerank endpoint when one is configured, otherwise
+        cosine similarity of embeddings.
         """
-        import numpy as np
-
         if top_k is None:
             top_k = len(docs)
 
-        query_embedding = await self.embed([query], model=model)
-        doc_embeddings = await self.embed(docs, model=model)
+        if self._rerank_url:
+            return await self._native_rerank(query, docs, model, top_k)
+
+        query_vec, doc_vecs = await self._embed_query_and_docs(
+            query, docs, model, lambda response: [d.embedding for d in response.data]
+        )
+
+        return self._rank_by_cosine(query_vec, doc_vecs, top_k)
+
+    async def _native_rerank(
+        self,
+        query: str,
+        docs: list[str],
+        model: str,
+        top_k: int,
+    ) -> list[tuple[int, float]]:
+        """Score documents with a cross-encoder rerank endpoint.
+
+        Args:
+            query: Query string
+            docs: Document strings
+            model: Rerank model name
+            top_k: Number of top results to return
 
-        query_vec = np.array(query_embedding.data[0].embedding)
-        doc_vecs = np.array([d.embedding for d in doc_embeddings.data])
+        Returns:
+            List of (doc_index, score) tuples sorted by relevance
+        """
+        if top_k <= 0 or not docs:
+            return []
 
-        similarities = np.dot(doc_vecs, query_vec).tolist()
-        indexed_scores = [(i, score) for i, score in enumerate(similarities)]
-        indexed_scores.sort(key=lambda x: x[1], reverse=True)
+        response = await self._http.post(
+            self._rerank_url,
+            content=orjson.dumps(
+                {"model": model, "query": query, "documents": docs, "top_n": top_k}
+            ),
+            headers={**self._auth_headers, "Content-Type": "application/json"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
 
-        return indexed_scores[:top_k]
+        ranked = sorted(
+            (
+                (item["index"], item["relevance_score"])
+                for item in orjson.loads(response.content)["results"]
+            ),
+            key=itemgetter(1),
+            reverse=True,
+        )
+        return ranked[:top_k]
 
     async def health_check(self) -> bool:
         """Check if provider is healthy."""
@@ -104,3 +167,8 @@ class OpenAICompatibleProvider(LLMProvider):
             return True
         except Exception:
             return False
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this provider created it."""
+        if self._owns_http:
+            await self._http.aclose()
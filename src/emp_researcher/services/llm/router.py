@@ -1,12 +1,69 @@
 """LLM routing service for provider selection and model routing."""
 
 import asyncio
+import hashlib
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
+import httpx
+import orjson
+
 from .base import LLMProvider
 from .ollama_provider import OllamaProvider
 from .openai_provider import OpenAICompatibleProvider
 
+_SORTED_JSON = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def _retry_after(error: BaseException) -> float | None:
+    """Return the server-requested delay for a rate-limited request.
+
+    Args:
+        error: Exception raised by a provider call
+
+    Returns:
+        Retry-After seconds (0 if the header is absent), or None if the
+        error is not an HTTP 429
+    """
+    response = getattr(error, "response", None)
+    if not isinstance(response, httpx.Response) or response.status_code != 429:
+        return None
+
+    try:
+        return max(float(response.headers.get("Retry-After", 0)), 0.0)
+    except ValueError:
+        return 0.0
+
+
+class _TokenBucket:
+    """Token bucket limiting how many requests start per second."""
+
+    def __init__(self, rate: float):
+        """Initialize token bucket.
+
+        Args:
+            rate: Sustained requests per second; also the burst size, which
+                is at least one request so fractional rates can make progress
+        """
+        self.rate = rate
+        self.capacity = max(rate, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may start."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
 
 class ModelType:
     """Model type constants."""
@@ -19,19 +76,76 @@ class ModelType:
 class LLMRouter:
     """Routes LLM requests to appropriate provider and model."""
 
-    def __init__(self, config: dict[str, Any]):
+    def __init__(self, config: dict[str, Any], http_client: httpx.AsyncClient | None = None):
         """Initialize LLM router with configuration.
 
         Args:
             config: Configuration dictionary with providers and routing rules
+            http_client: Shared HTTP client for providers (optional); when
+                omitted the router creates and owns its own pool
         """
         self.config = config
         self.providers: dict[str, LLMProvider] = {}
+        cache_config = self.config.get("llm", {}).get("cache", {})
+        self._cache_enabled = cache_config.get("enabled", True)
+        self._cache_max_entries = cache_config.get("max_entries", 1024)
+        self._cache_ttl = cache_config.get("ttl_seconds", 3600)
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+        batching_config = self.config.get("llm", {}).get("batching", {})
+        self._batching_enabled = batching_config.get("enabled", False)
+        self._batch_window = batching_config.get("window_ms", 10) / 1000
+        self._max_batch_size = batching_config.get("max_batch_size", 32)
+        self._pending: dict[tuple[Any, ...], list[tuple[list[dict[str, Any]], asyncio.Future]]] = {}
+        self._flush_handles: dict[tuple[Any, ...], asyncio.TimerHandle] = {}
+        self._flush_tasks: set[asyncio.Task] = set()
+        embed_batching_config = batching_config.get("embed", {})
+        self._embed_batching_enabled = embed_batching_config.get("enabled", False)
+        self._embed_window = embed_batching_config.get("window_ms", 5) / 1000
+        self._embed_max_texts = embed_batching_config.get("max_texts", 256)
+        self._pending_embeds: dict[tuple[Any, ...], list[tuple[list[str], asyncio.Future]]] = {}
+        self._embed_flush_handles: dict[tuple[Any, ...], asyncio.TimerHandle] = {}
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(
+            timeout=httpx.Timeout(60),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=300,
+            ),
+            http2=True,
+        )
+        retry_config = self.config.get("llm", {}).get("retry", {})
+        self._max_attempts = max(retry_config.get("max_attempts", 3), 1)
+        self._retry_initial_delay = retry_config.get("initial_delay", 1)
+        self._retry_max_delay = retry_config.get("max_delay", 10)
+        self._limits: dict[LLMProvider, tuple[asyncio.Semaphore, _TokenBucket | None]] = {}
         self._initialize_providers()
+        self._build_dispatch_tables()
+
+    def _build_dispatch_tables(self) -> None:
+        """Flatten the routing config into single-level lookup tables."""
+        llm_config = self.config.get("llm", {})
+        self._task_model_types: dict[str, str] = dict(llm_config.get("task_model_mapping", {}))
+        self._default_providers: dict[str, str] = dict(llm_config.get("default_provider", {}))
+        self._provider_models: dict[tuple[str, str], str] = {
+            (provider_name, key.removesuffix("s")): models[0]
+            for provider_name, models_by_type in llm_config.get("provider_models", {}).items()
+            for key, models in models_by_type.items()
+            if models
+        }
 
     def _initialize_providers(self) -> None:
         """Initialize all configured providers."""
         provider_configs = self.config.get("llm", {}).get("providers", {})
+        rerank_config = self.config.get("llm", {}).get("rerank", {})
+        embed_options = {
+            "embed_batch_size": rerank_config.get("batch_size", 64),
+            "embed_concurrency": rerank_config.get("concurrency", 4),
+            "rerank_backend": rerank_config.get("backend_selection", "numpy"),
+        }
 
         for name, pconfig in provider_configs.items():
             provider_type = pconfig.get("type")
@@ -40,14 +154,25 @@ class LLMRouter:
                 self.providers[name] = OllamaProvider(
                     base_url=pconfig.get("base_url", "http://localhost:11434"),
                     timeout=pconfig.get("timeout", 120),
+                    http_client=self._client,
+                    **embed_options,
                 )
             else:
                 self.providers[name] = OpenAICompatibleProvider(
                     base_url=pconfig["base_url"],
                     api_key=pconfig.get("api_key"),
                     timeout=pconfig.get("timeout", 60),
+                    http_client=self._client,
+                    rerank_endpoint=pconfig.get("rerank_endpoint"),
+                    **embed_options,
                 )
 
+            rps = pconfig.get("rps", 50)
+            self._limits[self.providers[name]] = (
+                asyncio.Semaphore(pconfig.get("max_concurrent", 20)),
+                _TokenBucket(rps) if rps else None,
+            )
+
     async def get_provider(
         self,
         provider_name: str | None = None,
@@ -65,13 +190,19 @@ class LLMRouter:
         Raises:
             ValueError: If no provider found
         """
+        return self._select_provider(provider_name, model_type)
+
+    def _select_provider(
+        self,
+        provider_name: str | None,
+        model_type: str | None,
+    ) -> LLMProvider:
+        """Resolve a provider synchronously; see get_provider()."""
         if provider_name:
             return self.providers[provider_name]
 
         if model_type:
-            default_provider = (
-                self.config.get("llm", {}).get("default_provider", {}).get(model_type)
-            )
+            default_provider = self._default_providers.get(model_type)
 
             if default_provider:
                 provider = self.providers.get(default_provider)
@@ -85,25 +216,350 @@ class LLMRouter:
         messages: list[dict[str, Any]],
         task_type: str | None = None,
         provider_name: str | None = None,
+        schema: dict[str, Any] | None = None,
         **kwargs: Any,
     ) -> Any:
         """Route chat request to appropriate provider and model.
 
+        Deterministic requests (no streaming, with temperature explicitly 0
+        or a seed set) are served from the response cache when possible.
+
         Args:
             messages: Chat messages
             task_type: Task type for model selection (optional)
             provider_name: Force specific provider (optional)
+            schema: JSON schema to constrain the response to (optional)
             **kwargs: Additional parameters
 
         Returns:
             Chat response
         """
         model_type = self._get_model_type_for_task(task_type)
-        provider = await self.get_provider(provider_name, model_type)
+        provider = self._select_provider(provider_name, model_type)
+
+        model = self._get_model_for_task(provider_name, model_type)
+
+        if schema is not None:
+            kwargs.update(provider.structured_output_params(schema))
+
+        streaming = kwargs.get("stream", False)
+        deterministic = kwargs.get("temperature") == 0 or kwargs.get("seed") is not None
+        cacheable = self._cache_enabled and not streaming and deterministic
+
+        if not cacheable:
+            return await self._dispatch_chat(provider, model, messages, kwargs)
+
+        key = self._cache_key(
+            "chat",
+            {
+                "messages": messages,
+                "task_type": task_type,
+                "provider": provider_name,
+                "model": model,
+                "params": kwargs,
+            },
+        )
+
+        return await self._cached(
+            key, lambda: self._dispatch_chat(provider, model, messages, kwargs)
+        )
+
+    async def _cached(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Serve a request from the LRU response cache.
+
+        Concurrent misses for the same key share a single call, and only
+        successful results are stored. The call runs as a detached task, so
+        a cancelled caller stops waiting without cancelling it for the
+        others.
+
+        Args:
+            key: Cache key from _cache_key()
+            call: Factory for the uncached request
+
+        Returns:
+            Cached or freshly computed result
+        """
+        entry = self._cache.pop(key, None)
+        if entry is not None and entry[0] > time.monotonic():
+            self._cache[key] = entry
+            self._cache_hits += 1
+            return entry[1]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._cache_hits += 1
+        else:
+            self._cache_misses += 1
+            inflight = self._inflight[key] = asyncio.create_task(self._fill_cache(key, call))
+            # Retrieve the exception even when every caller stopped waiting.
+            inflight.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+        return await asyncio.shield(inflight)
+
+    async def _fill_cache(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run an uncached request and store its result.
+
+        Args:
+            key: Cache key from _cache_key()
+            call: Factory for the uncached request
+
+        Returns:
+            Fresh result
+        """
+        try:
+            result = await call()
+        finally:
+            self._inflight.pop(key, None)
+
+        if len(self._cache) >= self._cache_max_entries:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (time.monotonic() + self._cache_ttl, result)
+
+        return result
+
+    async def _dispatch_chat(
+        self,
+        provider: LLMProvider,
+        model: str,
+        messages: list[dict[str, Any]],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Send a chat request directly or through the micro-batcher."""
+        if self._batching_enabled and not kwargs.get("stream", False):
+            return await self._enqueue_chat(provider, model, messages, kwargs)
+
+        return await self._throttled(
+            provider, lambda: provider.chat(messages, model=model, **kwargs)
+        )
+
+    async def _throttled(self, provider: LLMProvider, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a provider call within the provider's concurrency and rate limits.
+
+        Rate-limited (HTTP 429) calls are retried after the server's
+        Retry-After delay, or with exponential backoff when none is given.
+
+        Args:
+            provider: Provider the call goes to
+            call: Factory for the provider call
+
+        Returns:
+            Result of the call
+        """
+        limits = self._limits.get(provider)
+        if limits is None:
+            return await call()
+
+        semaphore, bucket = limits
+
+        for attempt in range(self._max_attempts):
+            async with semaphore:
+                if bucket is not None:
+                    await bucket.acquire()
+                try:
+                    return await call()
+                except Exception as e:
+                    delay = _retry_after(e)
+                    if delay is None or attempt == self._max_attempts - 1:
+                        raise
+
+            backoff = self._retry_initial_delay * 2**attempt
+            await asyncio.sleep(min(delay or backoff, self._retry_max_delay))
+
+    async def ask_json(
+        self,
+        system: str,
+        user: str,
+        task_type: str | None = None,
+        schema: dict[str, Any] | None = None,
+        default: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Ask for a JSON answer and decode it.
+
+        Args:
+            system: System prompt
+            user: User prompt
+            task_type: Task type for model selection (optional)
+            schema: JSON schema to constrain the response to (optional)
+            default: Value returned when the response is not valid JSON
+            **kwargs: Additional parameters
+
+        Returns:
+            Decoded JSON value, or default on decode failure
+        """
+        messages = [
+            {"role": "system", "content": system},
+            {"role": "user", "content": user},
+        ]
+
+        response = await self.route_chat(
+            messages,
+            task_type=task_type,
+            schema=schema,
+            **kwargs,
+        )
+
+        try:
+            return orjson.loads(response.choices[0].message.content)
+        except (orjson.JSONDecodeError, TypeError):
+            return default
+
+    async def _enqueue_chat(
+        self,
+        provider: LLMProvider,
+        model: str,
+        messages: list[dict[str, Any]],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Queue a chat request for the next micro-batch of identical routing.
+
+        Requests sharing provider, model and parameters are coalesced for up
+        to the batching window (or until max_batch_size is reached) and sent
+        with a single provider.chat_batch() call.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (id(provider), model, orjson.dumps(kwargs, default=str, option=_SORTED_JSON))
+
+        pending = self._pending.setdefault(key, [])
+        pending.append((messages, future))
+
+        if len(pending) == 1:
+            self._flush_handles[key] = loop.call_later(
+                self._batch_window, self._flush, key, provider, model, kwargs
+            )
+        elif len(pending) >= self._max_batch_size:
+            self._flush_handles.pop(key).cancel()
+            self._flush(key, provider, model, kwargs)
+
+        return await future
+
+    def _flush(
+        self,
+        key: tuple[Any, ...],
+        provider: LLMProvider,
+        model: str,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Dispatch the pending micro-batch for a routing key."""
+        self._flush_handles.pop(key, None)
+        items = self._pending.pop(key, [])
+        if not items:
+            return
+
+        task = asyncio.create_task(self._send_batch(items, provider, model, kwargs))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _send_batch(
+        self,
+        items: list[tuple[list[dict[str, Any]], asyncio.Future]],
+        provider: LLMProvider,
+        model: str,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Send a micro-batch and resolve each waiting request."""
+        try:
+            responses = await self._throttled(
+                provider,
+                lambda: provider.chat_batch(
+                    [messages for messages, _ in items],
+                    model=model,
+                    **kwargs,
+                ),
+            )
+            if len(responses) != len(items):
+                raise ValueError(
+                    f"Provider returned {len(responses)} responses for {len(items)} requests"
+                )
+        except Exception as e:
+            responses = [e] * len(items)
+
+        for (_, future), response in zip(items, responses, strict=True):
+            if future.done():
+                continue
+            if isinstance(response, BaseException):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
+
+    async def route_chat_batch(
+        self,
+        batch: list[list[dict[str, Any]]],
+        task_type: str | None = None,
+        provider_name: str | None = None,
+        max_concurrency: int | None = None,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """Route a batch of independent chat requests.
+
+        Requests are submitted concurrently so that servers with continuous
+        batching can schedule them together.
+
+        Args:
+            batch: List of chat message lists
+            task_type: Task type for model selection (optional)
+            provider_name: Force specific provider (optional)
+            max_concurrency: Maximum requests in flight (optional, unbounded by default)
+            **kwargs: Additional parameters
+
+        Returns:
+            Responses in input order; failed requests yield their exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or max(len(batch), 1))
+
+        async def run(messages: list[dict[str, Any]]) -> Any:
+            async with semaphore:
+                return await self.route_chat(
+                    messages,
+                    task_type=task_type,
+                    provider_name=provider_name,
+                    **kwargs,
+                )
 
+        return await asyncio.gather(*(run(messages) for messages in batch), return_exceptions=True)
+
+    async def route_chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        task_type: str | None = None,
+        provider_name: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Route a streaming chat request and yield content deltas.
+
+        Args:
+            messages: Chat messages
+            task_type: Task type for model selection (optional)
+            provider_name: Force specific provider (optional)
+            **kwargs: Additional parameters
+
+        Yields:
+            Text fragments in generation order
+        """
+        model_type = self._get_model_type_for_task(task_type)
+        provider = self._select_provider(provider_name, model_type)
         model = self._get_model_for_task(provider_name, model_type)
 
-        return await provider.chat(messages, model=model, **kwargs)
+        stream = await self._throttled(
+            provider, lambda: provider.chat(messages, model=model, stream=True, **kwargs)
+        )
+
+        async for chunk in stream:
+            text = self._chunk_text(chunk)
+            if text:
+                yield text
+
+    @staticmethod
+    def _chunk_text(chunk: Any) -> str:
+        """Extract the content delta from a provider stream chunk."""
+        if isinstance(chunk, dict):
+            return chunk.get("message", {}).get("content", "")
+
+        if not chunk.choices:
+            return ""
+
+        return chunk.choices[0].delta.content or ""
 
     async def route_embed(
         self,
@@ -113,6 +569,10 @@ class LLMRouter:
     ) -> Any:
         """Route embedding request.
 
+        Responses are cached per provider, model, texts and parameters, and
+        concurrent requests can be coalesced into one provider call when
+        embedding batching is enabled.
+
         Args:
             texts: Texts to embed
             provider_name: Force specific provider (optional)
@@ -121,9 +581,105 @@ class LLMRouter:
         Returns:
             Embedding response
         """
-        provider = await self.get_provider(provider_name, None)
+        provider = self._select_provider(provider_name, None)
         model = self._get_model_for_task(provider_name, None)
-        return await provider.embed(texts, model=model, **kwargs)
+
+        if not self._cache_enabled:
+            return await self._dispatch_embed(provider, model, texts, kwargs)
+
+        key = self._cache_key(
+            "embed",
+            {"texts": texts, "provider": provider_name, "model": model, "params": kwargs},
+        )
+        return await self._cached(key, lambda: self._dispatch_embed(provider, model, texts, kwargs))
+
+    async def _dispatch_embed(
+        self,
+        provider: LLMProvider,
+        model: str,
+        texts: list[str],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Send an embedding request directly or through the embedding coalescer.
+
+        Requests sharing provider, model and parameters are held for up to
+        the embedding window (or until max_texts texts are queued) and sent
+        as one provider.embed() call; each caller gets its own slice.
+        """
+        if not self._embed_batching_enabled:
+            return await self._throttled(
+                provider, lambda: provider.embed(texts, model=model, **kwargs)
+            )
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (id(provider), model, orjson.dumps(kwargs, default=str, option=_SORTED_JSON))
+
+        pending = self._pending_embeds.setdefault(key, [])
+        pending.append((texts, future))
+
+        if len(pending) == 1:
+            self._embed_flush_handles[key] = loop.call_later(
+                self._embed_window, self._flush_embeds, key, provider, model, kwargs
+            )
+        elif sum(len(queued) for queued, _ in pending) >= self._embed_max_texts:
+            self._embed_flush_handles.pop(key).cancel()
+            self._flush_embeds(key, provider, model, kwargs)
+
+        return await future
+
+    def _flush_embeds(
+        self,
+        key: tuple[Any, ...],
+        provider: LLMProvider,
+        model: str,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Dispatch the pending embedding batch for a routing key."""
+        self._embed_flush_handles.pop(key, None)
+        items = self._pending_embeds.pop(key, [])
+        if not items:
+            return
+
+        task = asyncio.create_task(self._send_embed_batch(items, provider, model, kwargs))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _send_embed_batch(
+        self,
+        items: list[tuple[list[str], asyncio.Future]],
+        provider: LLMProvider,
+        model: str,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Send a coalesced embedding request and resolve each waiting caller."""
+        try:
+            response = await self._throttled(
+                provider,
+                lambda: provider.embed(
+                    [text for texts, _ in items for text in texts],
+                    model=model,
+                    **kwargs,
+                ),
+            )
+            if len(items) == 1:
+                results = [response]
+            else:
+                results = []
+                start = 0
+                for texts, _ in items:
+                    results.append(provider.slice_embeddings(response, start, start + len(texts)))
+                    start += len(texts)
+        except Exception as e:
+            results = [e] * len(items)
+
+        for (_, future), result in zip(items, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
 
     async def route_rerank(
         self,
@@ -134,6 +690,8 @@ class LLMRouter:
     ) -> list[tuple[int, float]]:
         """Route rerank request.
 
+        Rankings are cached per provider, model, query, documents and parameters.
+
         Args:
             query: Query string
             docs: Documents to rerank
@@ -143,31 +701,92 @@ class LLMRouter:
         Returns:
             List of (doc_index, score) tuples
         """
-        provider = await self.get_provider(provider_name, ModelType.RERANK)
+        provider = self._select_provider(provider_name, ModelType.RERANK)
         model = self._get_model_for_task(provider_name, ModelType.RERANK)
-        return await provider.rerank(query, docs, model=model, **kwargs)
+
+        def rerank() -> Awaitable[list[tuple[int, float]]]:
+            return self._throttled(
+                provider, lambda: provider.rerank(query, docs, model=model, **kwargs)
+            )
+
+        if not self._cache_enabled:
+            return await rerank()
+
+        key = self._cache_key(
+            "rerank",
+            {
+                "query": query,
+                "docs": docs,
+                "provider": provider_name,
+                "model": model,
+                "params": kwargs,
+            },
+        )
+        return await self._cached(key, rerank)
 
     async def health_check_all(self) -> dict[str, bool]:
-        """Check health of all providers.
+        """Check health of all providers concurrently.
+
+        Each check is bounded by llm.health_check.timeout; a provider that
+        times out or raises is reported unhealthy.
 
         Returns:
             Dict mapping provider names to health status
         """
-        results = {}
-        tasks = [(name, provider.health_check()) for name, provider in self.providers.items()]
+        timeout = self.config.get("llm", {}).get("health_check", {}).get("timeout", 5)
+
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(provider.health_check(), timeout=timeout)
+                for provider in self.providers.values()
+            ),
+            return_exceptions=True,
+        )
 
-        for name, task in tasks:
-            results[name] = await task
+        return {name: result is True for name, result in zip(self.providers, results, strict=True)}
+
+    def clear_cache(self) -> None:
+        """Drop all cached chat, embedding and rerank responses."""
+        self._cache.clear()
+
+    def cache_stats(self) -> dict[str, int]:
+        """Report response cache usage.
+
+        Returns:
+            Dict with hits, misses and current entry count
+        """
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "entries": len(self._cache),
+        }
 
-        return results
+    def _cache_key(self, kind: str, request: dict[str, Any]) -> str:
+        """Build an exact-match cache key for a request.
+
+        Args:
+            kind: Request kind (chat, embed or rerank)
+            request: Everything that determines the response
+
+        Returns:
+            Hex digest of the canonicalized request
+        """
+        payload = orjson.dumps({"kind": kind, **request}, default=str, option=_SORTED_JSON)
+        return hashlib.sha256(payload).hexdigest()
+
+    async def aclose(self) -> None:
+        """Close provider clients, and the HTTP connection pool if the router created it."""
+        await asyncio.gather(*(provider.aclose() for provider in self.providers.values()))
+
+        if self._owns_client:
+            await self._client.aclose()
 
     def _get_model_type_for_task(self, task_type: str | None) -> str | None:
         """Get model type for a task."""
         if not task_type:
             return None
 
-        mapping = self.config.get("llm", {}).get("task_model_mapping", {})
-        return mapping.get(task_type)
+        return self._task_model_types.get(task_type)
 
     def _get_model_for_task(
         self,
@@ -178,17 +797,9 @@ class LLMRouter:
         if not provider_name or not model_type:
             provider_name, model_type = self._get_defaults()
 
-        provider_models = self.config.get("llm", {}).get("provider_models", {})
-        provider_config = provider_models.get(provider_name, {})
-
-        model_list = provider_config.get(f"{model_type}s", [])
-        if model_list:
-            return model_list[0]
-
-        return "gpt-3.5-turbo"
+        return self._provider_models.get((provider_name, model_type), "gpt-3.5-turbo")
 
     def _get_defaults(self) -> tuple[str, str]:
         """Get default provider and model type."""
-        defaults = self.config.get("llm", {}).get("default_provider", {})
-        provider = defaults.get(ModelType.SMALL_FAST) or next(iter(self.providers.keys()))
+        provider = self._default_providers.get(ModelType.SMALL_FAST) or next(iter(self.providers))
         return provider, ModelType.SMALL_FAST
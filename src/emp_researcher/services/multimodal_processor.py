@@ -1,21 +1,120 @@
 """Multimodal document processor."""
 
-import base64
+import asyncio
+import hashlib
+import logging
+import time
 from typing import Any
 
-from ..services import LLMRouter
+import orjson
+
+from .llm import LLMRouter
+
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+logger = logging.getLogger(__name__)
+
+_PROMPT_VERSION = b"2"
+
+# System messages are module constants so every request starts with a
+# byte-identical prefix that provider-side prompt caches can reuse.
+_IMAGE_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a multimodal document processor. Extract text, tables, and information from images.",
+}
+_TABLE_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": """You are a table analysis specialist. Extract structure, headers, and data from tables.
+
+For each table, extract:
+1. Table structure (headers, rows, columns)
+2. Data types of each column
+3. Key insights/trends
+4. Data quality issues (missing values, inconsistencies)
+
+Return JSON with keys: headers (list), data_summary (dict), insights (list of strings).""",
+}
+_TABLE_USER_TEMPLATE = "Analyze this {table_format} table:\n\n{table_data}"
+_AUDIO_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an audio transcription specialist. Transcribe speech from audio files.",
+}
+_SUMMARY_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a document summarization specialist.",
+}
+
+
+def _data_url(media_type: str, data: bytes) -> str:
+    """Build a base64 data URL in a single encode pass.
+
+    Args:
+        media_type: MIME type of the payload
+        data: Raw payload bytes
+
+    Returns:
+        data: URL string
+    """
+    return f"data:{media_type};base64,{b64encode(data).decode('ascii')}"
+
+
+def _content_key(modality: str, fmt: str, *parts: bytes) -> bytes:
+    """Hash raw modality content into a cache key.
+
+    Args:
+        modality: Modality name
+        fmt: Content format
+        *parts: Raw content and any other inputs that change the prompt
+
+    Returns:
+        128-bit BLAKE2b digest
+    """
+    digest = hashlib.blake2b(_PROMPT_VERSION, digest_size=16)
+    digest.update(f"|{modality}|{fmt}|".encode())
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.digest()
 
 
 class MultimodalProcessor:
     """Processor for multimodal documents (images, tables, audio)."""
 
-    def __init__(self, llm_router: LLMRouter):
+    def __init__(
+        self,
+        llm_router: LLMRouter,
+        cache_ttl: float = 3600,
+        cache_size: int = 256,
+    ):
         """Initialize multimodal processor.
 
         Args:
             llm_router: LLM routing service
+            cache_ttl: Seconds a processed result is reused
+            cache_size: Maximum number of cached results
         """
         self.llm_router = llm_router
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache: dict[bytes, tuple[float, dict[str, Any]]] = {}
+
+    def _cache_get(self, key: bytes) -> dict[str, Any] | None:
+        """Look up a cached result that has not expired."""
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    def _cache_put(self, key: bytes, result: dict[str, Any]) -> dict[str, Any]:
+        """Store a successfully processed result and return it."""
+        self._cache.pop(key, None)
+        if len(self._cache) >= self.cache_size:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (time.monotonic() + self.cache_ttl, result)
+        return result
 
     async def process_image(
         self,
@@ -31,21 +130,19 @@ class MultimodalProcessor:
         Returns:
             Extracted content with metadata
         """
-        import base64
-
-        base64_image = base64.b64encode(image_data).decode("utf-8")
+        key = _content_key("image", image_format, image_data)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
 
         messages = [
-            {
-                "role": "system",
-                "content": "You are a multimodal document processor. Extract text, tables, and information from images.",
-            },
+            _IMAGE_SYSTEM_MESSAGE,
             {
                 "role": "user",
                 "content": [
                     {
                         "type": "image_url",
-                        "image_url": {"url": f"data:image/{image_format};base64,{base64_image}"},
+                        "image_url": {"url": _data_url(f"image/{image_format}", image_data)},
                     },
                     {
                         "type": "text",
@@ -61,19 +158,21 @@ class MultimodalProcessor:
         )
 
         try:
-            import json
-
-            result = json.loads(response.choices[0].message.content)
+            result = orjson.loads(response.choices[0].message.content)
 
-            return {
-                "modality": "image",
-                "content": result.get("content", ""),
-                "tables": result.get("tables", []),
-                "text": result.get("text", ""),
-                "description": result.get("description", ""),
-                "format": image_format,
-            }
-        except Exception:
+            return self._cache_put(
+                key,
+                {
+                    "modality": "image",
+                    "content": result.get("content", ""),
+                    "tables": result.get("tables", []),
+                    "text": result.get("text", ""),
+                    "description": result.get("description", ""),
+                    "format": image_format,
+                },
+            )
+        except (orjson.JSONDecodeError, AttributeError) as e:
+            logger.warning("Could not decode image processing response: %s", e)
             return {
                 "modality": "image",
                 "content": "",
@@ -97,24 +196,18 @@ class MultimodalProcessor:
         Returns:
             Structured table information
         """
+        key = _content_key("table", table_format, table_data[:2000].encode())
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         messages = [
-            {
-                "role": "system",
-                "content": "You are a table analysis specialist. Extract structure, headers, and data from tables.",
-            },
+            _TABLE_SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": f"""Analyze this {table_format} table:
-
-{table_data[:2000]}
-
-Extract:
-1. Table structure (headers, rows, columns)
-2. Data types of each column
-3. Key insights/trends
-4. Data quality issues (missing values, inconsistencies)
-
-Return JSON with keys: headers (list), data_summary (dict), insights (list of strings).""",
+                "content": _TABLE_USER_TEMPLATE.format(
+                    table_format=table_format, table_data=table_data[:2000]
+                ),
             },
         ]
 
@@ -124,17 +217,19 @@ Return JSON with keys: headers (list), data_summary (dict), insights (list of st
         )
 
         try:
-            import json
+            result = orjson.loads(response.choices[0].message.content)
 
-            result = json.loads(response.choices[0].message.content)
-
-            return {
-                "modality": "table",
-                "headers": result.get("headers", []),
-                "data_summary": result.get("data_summary", {}),
-                "insights": result.get("insights", []),
-            }
-        except Exception:
+            return self._cache_put(
+                key,
+                {
+                    "modality": "table",
+                    "headers": result.get("headers", []),
+                    "data_summary": result.get("data_summary", {}),
+                    "insights": result.get("insights", []),
+                },
+            )
+        except (orjson.JSONDecodeError, AttributeError) as e:
+            logger.warning("Could not decode table processing response: %s", e)
             return {"modality": "table", "headers": [], "data_summary": {}, "insights": []}
 
     async def process_audio(
@@ -153,11 +248,13 @@ Return JSON with keys: headers (list), data_summary (dict), insights (list of st
         Returns:
             Transcription with metadata
         """
+        key = _content_key("audio", audio_format, audio_data, repr(duration).encode())
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         messages = [
-            {
-                "role": "system",
-                "content": "You are an audio transcription specialist. Transcribe speech from audio files.",
-            },
+            _AUDIO_SYSTEM_MESSAGE,
             {
                 "role": "user",
                 "content": [
@@ -179,19 +276,21 @@ Return JSON with keys: headers (list), data_summary (dict), insights (list of st
         )
 
         try:
-            import json
+            result = orjson.loads(response.choices[0].message.content)
 
-            result = json.loads(response.choices[0].message.content)
-
-            return {
-                "modality": "audio",
-                "transcript": result.get("transcript", ""),
-                "speakers": result.get("speakers", []),
-                "topics": result.get("topics", []),
-                "confidence": 0.8,
-                "format": audio_format,
-            }
-        except Exception:
+            return self._cache_put(
+                key,
+                {
+                    "modality": "audio",
+                    "transcript": result.get("transcript", ""),
+                    "speakers": result.get("speakers", []),
+                    "topics": result.get("topics", []),
+                    "confidence": 0.8,
+                    "format": audio_format,
+                },
+            )
+        except (orjson.JSONDecodeError, AttributeError) as e:
+            logger.warning("Could not decode audio processing response: %s", e)
             return {
                 "modality": "audio",
                 "transcript": "",
@@ -207,6 +306,9 @@ Return JSON with keys: headers (list), data_summary (dict), insights (list of st
     ) -> dict[str, Any]:
         """Process multimodal document with multiple content types.
 
+        Each modality and the combined summary are processed concurrently;
+        results keep the image, table, audio order.
+
         Args:
             document_data: Dictionary containing different modalities
 
@@ -214,53 +316,77 @@ Return JSON with keys: headers (list), data_summary (dict), insights (list of st
             Combined processing results
         """
         results = {"modalities": [], "combined_summary": ""}
+        modalities = []
+        pending = []
 
         if "image" in document_data:
-            image_result = await self.process_image(
-                document_data["image"]["data"],
-                document_data["image"]["format"],
+            modalities.append("image")
+            pending.append(
+                self.process_image(
+                    document_data["image"]["data"],
+                    document_data["image"]["format"],
+                )
             )
-            results["modalities"].append(image_result)
 
         if "table" in document_data:
-            table_result = await self.process_table(
-                document_data["table"]["data"],
-                document_data["table"]["format"],
+            modalities.append("table")
+            pending.append(
+                self.process_table(
+                    document_data["table"]["data"],
+                    document_data["table"]["format"],
+                )
             )
-            results["modalities"].append(table_result)
 
         if "audio" in document_data:
-            audio_result = await self.process_audio(
-                document_data["audio"]["data"],
-                document_data["audio"]["format"],
-                document_data["audio"].get("duration"),
+            modalities.append("audio")
+            pending.append(
+                self.process_audio(
+                    document_data["audio"]["data"],
+                    document_data["audio"]["format"],
+                    document_data["audio"].get("duration"),
+                )
             )
-            results["modalities"].append(audio_result)
 
-        if results["modalities"]:
-            summary_messages = [
-                {
-                    "role": "system",
-                    "content": "You are a document summarization specialist.",
-                },
-                {
-                    "role": "user",
-                    "content": f"""Create a comprehensive summary of this multimodal document:
+        if not modalities:
+            return results
 
-Modalities: {", ".join([m["modality"] for m in results["modalities"]])}
+        *processed, results["combined_summary"] = await asyncio.gather(
+            *pending, self._summarize(modalities)
+        )
+        results["modalities"] = processed
 
-Synthesize all information into a coherent summary.""",
-                },
-            ]
+        return results
 
-            summary_response = await self.llm_router.route_chat(
-                messages=summary_messages,
-                task_type="document_summarization",
-            )
+    async def _summarize(self, modalities: list[str]) -> str:
+        """Summarize a multimodal document.
 
-            results["combined_summary"] = summary_response.choices[0].message.content
+        The prompt depends only on which modalities are present, so this runs
+        concurrently with the per-modality processing.
 
-        return results
+        Args:
+            modalities: Modality names in processing order
+
+        Returns:
+            Combined summary text
+        """
+        summary_messages = [
+            _SUMMARY_SYSTEM_MESSAGE,
+            {
+                "role": "user",
+                "content": f"""Create a comprehensive summary of this multimodal document:
+
+Modalities: {", ".join(modalities)}
+
+Synthesize all information into a coherent summary.""",
+            },
+        ]
+
+        summary_response = await self.llm_router.route_chat(
+            messages=summary_messages,
+            task_type="document_summarization",
+        )
+
+        return summary_response.choices[0].message.content
 
     async def health_check(self) -> dict[str, Any]:
         """Check multimodal processor health.
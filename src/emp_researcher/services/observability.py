@@ -4,6 +4,16 @@ from typing import Any
 
 from opentelemetry import trace
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from prometheus_client import Counter, Histogram
+
+_METRIC_TYPES = {
+    "counter": Counter,
+    "histogram": Histogram,
+}
+
+# Prometheus collectors are registered process-wide, so they are created once
+# per metric name and shared by every ObservabilityService instance.
+_METRICS: dict[str, Counter | Histogram] = {}
 
 
 class ObservabilityService:
@@ -37,25 +47,33 @@ class ObservabilityService:
     def record_metric(self, name: str, value: float, tags: dict[str, str] | None = None) -> None:
         """Record a custom metric.
 
+        The collector is created on first use of a name; its label names are
+        fixed by the tags of that first call.
+
         Args:
             name: Metric name
             value: Metric value
-            tags: Metric tags
+            tags: Metric tags; the "type" tag selects counter or histogram
         """
-        from prometheus_client import Counter, Histogram
-
-        metrics = {
-            "counter": Counter,
-            "histogram": Histogram,
-        }
-
-        metric_type = tags.get("type", "counter") if tags else "counter"
-
-        if metric_type in metrics:
-            if metric_type == "counter":
-                metrics[metric_type].labels(**tags).inc(value)
-            elif metric_type == "histogram":
-                metrics[metric_type].labels(**tags).observe(value)
+        labels = dict(tags) if tags else {}
+        metric_type = labels.pop("type", "counter")
+        metric_class = _METRIC_TYPES.get(metric_type)
+        if metric_class is None:
+            return
+
+        metric = _METRICS.get(name)
+        if metric is None:
+            metric = _METRICS[name] = metric_class(
+                name, f"{self.app_name} {name}", labelnames=sorted(labels)
+            )
+
+        if labels:
+            metric = metric.labels(**labels)
+
+        if isinstance(metric, Counter):
+            metric.inc(value)
+        else:
+            metric.observe(value)
 
     def create_span(self, name: str, parent_span_id: str | None = None) -> trace.Span:
         """Create a new tracing span.
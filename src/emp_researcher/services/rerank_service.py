@@ -1,9 +1,57 @@
 """Rerank service for document relevance scoring."""
 
+import asyncio
+import functools
+import heapq
+from operator import itemgetter
 from typing import Any
 
+import numpy as np
+
 from .llm import LLMRouter
 
+_RERANK_SCORE = itemgetter("rerank_score")
+_FINAL_SCORE = itemgetter("final_score")
+_SIGNALS = ("relevance", "trust", "freshness")
+_VECTORIZE_THRESHOLD = 200
+
+# MinHash signatures replace exact Jaccard once both documents are this long.
+_MINHASH_MIN_TOKENS = 256
+_MINHASH_PERMUTATIONS = 128
+_MINHASH_PRIME = (1 << 31) - 1
+_MINHASH_A, _MINHASH_B = np.random.default_rng(0x5EED).integers(
+    1, _MINHASH_PRIME, size=(2, _MINHASH_PERMUTATIONS, 1), dtype=np.uint64
+)
+
+
+def _minhash(tokens: frozenset[str]) -> np.ndarray:
+    """Compute a MinHash signature for a token set.
+
+    Args:
+        tokens: Non-empty token set
+
+    Returns:
+        Signature of _MINHASH_PERMUTATIONS uint64 minima
+    """
+    hashes = np.fromiter(
+        (hash(token) & _MINHASH_PRIME for token in tokens), dtype=np.uint64, count=len(tokens)
+    )
+    return ((_MINHASH_A * hashes + _MINHASH_B) % _MINHASH_PRIME).min(axis=1)
+
+
+@functools.lru_cache(maxsize=4096)
+def _token_profile(text: str) -> tuple[frozenset[str], np.ndarray | None]:
+    """Tokenize a text for similarity scoring, memoized by content.
+
+    Args:
+        text: Document content
+
+    Returns:
+        Tuple of (lower-cased word set, MinHash signature for long texts or None)
+    """
+    tokens = frozenset(text.lower().split())
+    return tokens, _minhash(tokens) if len(tokens) >= _MINHASH_MIN_TOKENS else None
+
 
 class RerankerService:
     """Service for reranking documents by relevance."""
@@ -25,6 +73,9 @@ class RerankerService:
     ) -> list[dict[str, Any]]:
         """Rerank documents by query relevance.
 
+        The LLM call is skipped for a single document, and when every
+        document is kept and already carries a rerank_score.
+
         Args:
             query: Search query
             documents: List of documents to rerank
@@ -40,6 +91,16 @@ class RerankerService:
         if top_k is None:
             top_k = len(documents)
 
+        if len(documents) == 1:
+            if top_k < 1:
+                return []
+            doc = documents[0].copy()
+            doc.setdefault("rerank_score", 1.0)
+            return [doc]
+
+        if top_k >= len(documents) and all("rerank_score" in doc for doc in documents):
+            return sorted(documents, key=_RERANK_SCORE, reverse=True)
+
         docs_text = [doc.get("content", "") for doc in documents]
 
         try:
@@ -56,7 +117,7 @@ class RerankerService:
                     doc["rerank_score"] = score
                     reranked.append(doc)
 
-            return sorted(reranked, key=lambda x: x["rerank_score"], reverse=True)[:top_k]
+            return heapq.nlargest(top_k, reranked, key=_RERANK_SCORE)
 
         except Exception as e:
             return documents[:top_k]
@@ -69,6 +130,8 @@ class RerankerService:
     ) -> list[dict[str, Any]]:
         """Rerank using multiple signals (relevance, trust, freshness).
 
+        Scoring is vectorized with NumPy for large candidate sets.
+
         Args:
             query: Search query
             documents: List of documents to rerank
@@ -84,14 +147,28 @@ class RerankerService:
                 "freshness": 0.2,
             }
 
-        for doc in documents:
-            doc["final_score"] = (
-                doc.get("relevance_score", 0.5) * weights["relevance"]
-                + doc.get("trust_score", 0.5) * weights["trust"]
-                + doc.get("freshness_score", 0.5) * weights["freshness"]
-            )
+        count = len(documents)
+
+        if count <= _VECTORIZE_THRESHOLD:
+            for doc in documents:
+                doc["final_score"] = (
+                    doc.get("relevance_score", 0.5) * weights["relevance"]
+                    + doc.get("trust_score", 0.5) * weights["trust"]
+                    + doc.get("freshness_score", 0.5) * weights["freshness"]
+                )
+
+            return sorted(documents, key=_FINAL_SCORE, reverse=True)
+
+        signals = np.empty((len(_SIGNALS), count), dtype=np.float64)
+        for row, signal in enumerate(_SIGNALS):
+            key = f"{signal}_score"
+            signals[row] = np.fromiter((doc.get(key, 0.5) for doc in documents), np.float64, count)
+
+        final = np.asarray([weights[signal] for signal in _SIGNALS], dtype=np.float64) @ signals
+        for doc, score in zip(documents, final.tolist(), strict=True):
+            doc["final_score"] = score
 
-        return sorted(documents, key=lambda x: x["final_score"], reverse=True)
+        return [documents[i] for i in np.argsort(-final, kind="stable").tolist()]
 
     async def diversity_rerank(
         self,
@@ -100,6 +177,10 @@ class RerankerService:
     ) -> list[dict[str, Any]]:
         """Rerank with diversity to reduce redundancy.
 
+        Token sets are memoized per content across calls; candidates are
+        compared to the selected set by Jaccard overlap of their word sets,
+        estimated from MinHash signatures when both documents are long.
+
         Args:
             documents: List of documents to rerank
             diversity_threshold: Similarity threshold for deduplication
@@ -111,21 +192,30 @@ class RerankerService:
             return []
 
         selected = []
+        selected_tokens: list[tuple[frozenset[str], np.ndarray | None]] = []
         for doc in sorted(documents, key=lambda x: x.get("rerank_score", 0), reverse=True):
+            tokens, signature = _token_profile(doc.get("content", ""))
+            size = len(tokens)
             is_diverse = True
 
-            for selected_doc in selected:
-                similarity = self._calculate_similarity(
-                    doc.get("content", ""),
-                    selected_doc.get("content", ""),
-                )
-
-                if similarity > diversity_threshold:
-                    is_diverse = False
-                    break
+            if size:
+                for other, other_signature in selected_tokens:
+                    if not other:
+                        continue
+                    if signature is not None and other_signature is not None:
+                        similarity = (
+                            np.count_nonzero(signature == other_signature) / _MINHASH_PERMUTATIONS
+                        )
+                    else:
+                        overlap = len(tokens & other)
+                        similarity = overlap / (size + len(other) - overlap)
+                    if similarity > diversity_threshold:
+                        is_diverse = False
+                        break
 
             if is_diverse:
                 selected.append(doc)
+                selected_tokens.append((tokens, signature))
 
         return selected
 
@@ -139,26 +229,21 @@ class RerankerService:
         Returns:
             Similarity score 0-1
         """
-        if not text1 or not text2:
-            return 0.0
-
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+        words1 = _token_profile(text1)[0]
+        words2 = _token_profile(text2)[0]
 
         if not words1 or not words2:
             return 0.0
 
-        intersection = words1 & words2
-        union = words1 | words2
-
-        return len(intersection) / len(union) if union else 0.0
+        overlap = len(words1 & words2)
+        return overlap / (len(words1) + len(words2) - overlap)
 
     async def batch_rerank(
         self,
         queries: list[tuple[str, list[dict[str, Any]]]],
         top_k_per_query: int = 5,
     ) -> dict[str, list[dict[str, Any]]]:
-        """Rerank multiple query-document pairs in batch.
+        """Rerank multiple query-document pairs concurrently.
 
         Args:
             queries: List of (query, documents) tuples
@@ -167,10 +252,8 @@ class RerankerService:
         Returns:
             Dictionary mapping queries to reranked results
         """
-        results = {}
-
-        for query, documents in queries:
-            reranked = await self.rerank(query, documents, top_k=top_k_per_query)
-            results[query] = reranked
+        reranked = await asyncio.gather(
+            *(self.rerank(query, documents, top_k=top_k_per_query) for query, documents in queries)
+        )
 
-        return results
+        return {query: results for (query, _), results in zip(queries, reranked, strict=True)}
@@ -1,9 +1,14 @@
 """SearXNG search client."""
 
 import asyncio
+import re
+from itertools import islice
 from typing import Any
 
 import httpx
+import orjson
+
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
 
 
 class SearXNGClient:
@@ -14,6 +19,7 @@ class SearXNGClient:
         base_url: str = "http://localhost:8080/search",
         timeout: int = 30,
         max_results: int = 20,
+        max_concurrency: int = 16,
     ):
         """Initialize SearXNG client.
 
@@ -21,11 +27,24 @@ class SearXNGClient:
             base_url: SearXNG API base URL
             timeout: Request timeout in seconds
             max_results: Maximum results per query
+            max_concurrency: Maximum queries in flight during search_parallel
         """
         self.base_url = base_url
         self.timeout = timeout
         self.max_results = max_results
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(
+                    max_connections=max_concurrency,
+                    max_keepalive_connections=max_concurrency,
+                ),
+            ),
+        )
 
     async def search(
         self,
@@ -52,9 +71,9 @@ class SearXNGClient:
 
         response = await self.client.get(self.base_url, params=params)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
-        results = data.get("results", [])[: self.max_results]
+        results = islice(data.get("results") or (), self.max_results)
 
         return [
             {
@@ -76,6 +95,8 @@ class SearXNGClient:
     ) -> dict[str, list[dict[str, Any]]]:
         """Perform parallel bilingual search.
 
+        At most max_concurrency queries are in flight at once.
+
         Args:
             queries: List of search queries
             engines_zh: Chinese engines
@@ -87,15 +108,15 @@ class SearXNGClient:
         tasks = []
 
         for query in queries:
-            if any("\u4e00-\u9fff" in c for c in query):
-                tasks.append(self.search(query, engines=engines_zh, language="zh"))
+            if _CJK_RE.search(query):
+                tasks.append(self._search_gated(query, engines=engines_zh, language="zh"))
             else:
-                tasks.append(self.search(query, engines=engines_en, language="en"))
+                tasks.append(self._search_gated(query, engines=engines_en, language="en"))
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         results_by_query = {}
-        for query, result in zip(queries, results):
+        for query, result in zip(queries, results, strict=True):
             if isinstance(result, Exception):
                 results_by_query[query] = []
             else:
@@ -103,6 +124,16 @@ class SearXNGClient:
 
         return results_by_query
 
+    async def _search_gated(
+        self,
+        query: str,
+        engines: list[str] | None,
+        language: str,
+    ) -> list[dict[str, Any]]:
+        """Run search() once a concurrency slot is free."""
+        async with self._semaphore:
+            return await self.search(query, engines=engines, language=language)
+
     async def health_check(self) -> bool:
         """Check if SearXNG is healthy.
 
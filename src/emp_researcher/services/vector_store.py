@@ -1,8 +1,12 @@
 """Vector store service using Milvus."""
 
+import asyncio
+import os
+import time
 import uuid
 from typing import Any
 
+import numpy as np
 from pymilvus import (
     Collection,
     CollectionSchema,
@@ -12,6 +16,38 @@ from pymilvus import (
     connections,
 )
 
+_DEFAULT_INDEX_PARAMS: dict[str, dict[str, Any]] = {
+    "HNSW": {"M": 16, "efConstruction": 200},
+    "IVF_PQ": {"nlist": 1024, "m": 96, "nbits": 8},
+    "IVF_FLAT": {"nlist": 1024},
+}
+
+_UUID7_VERSION_AND_VARIANT = (0x7 << 76) | (0b10 << 62)
+
+
+def _uuid7_batch(count: int) -> list[str]:
+    """Generate time-ordered UUIDv7 strings for one insert batch.
+
+    The timestamp and random seed are drawn once; the 74 random bits are
+    then incremented per ID (RFC 9562 method 2), so IDs within a batch are
+    unique and sorted.
+
+    Args:
+        count: Number of IDs
+
+    Returns:
+        UUID strings
+    """
+    timestamp = (time.time_ns() // 1_000_000) << 80
+    seed = int.from_bytes(os.urandom(10), "big") >> 7
+    ids = []
+    for offset in range(count):
+        rand = seed + offset
+        rand_a, rand_b = rand >> 62, rand & ((1 << 62) - 1)
+        value = timestamp | _UUID7_VERSION_AND_VARIANT | (rand_a << 64) | rand_b
+        ids.append(str(uuid.UUID(int=value)))
+    return ids
+
 
 class VectorStore:
     """Milvus vector store abstraction."""
@@ -22,6 +58,9 @@ class VectorStore:
         port: int = 19530,
         collection_name: str = "emp_researcher",
         dimension: int = 768,
+        index_type: str = "HNSW",
+        index_params: dict[str, Any] | None = None,
+        metric_type: str = "COSINE",
     ):
         """Initialize vector store.
 
@@ -30,13 +69,23 @@ class VectorStore:
             port: Milvus port
             collection_name: Collection name
             dimension: Embedding dimension
+            index_type: Milvus index type used when creating the collection
+                (HNSW for latency, IVF_PQ for memory)
+            index_params: Index build parameters (defaults per index_type)
+            metric_type: Similarity metric
         """
         self.host = host
         self.port = port
         self.collection_name = collection_name
         self.dimension = dimension
+        self.index_type = index_type
+        self.index_params = (
+            index_params if index_params is not None else _DEFAULT_INDEX_PARAMS.get(index_type, {})
+        )
+        self.metric_type = metric_type
         self.client = None
         self.collection = None
+        self._loaded = False
 
     async def connect(self) -> None:
         """Connect to Milvus."""
@@ -46,12 +95,18 @@ class VectorStore:
         )
         connections.connect(host=self.host, port=self.port)
         await self._get_or_create_collection()
+        await self._load()
 
     async def disconnect(self) -> None:
         """Disconnect from Milvus."""
         if self.client:
             connections.disconnect(host=self.host, port=self.port)
 
+    async def _load(self) -> None:
+        """Load the collection into Milvus memory off the event loop."""
+        await asyncio.to_thread(self.collection.load)
+        self._loaded = True
+
     async def _get_or_create_collection(self) -> None:
         """Get or create collection."""
         try:
@@ -96,33 +151,39 @@ class VectorStore:
             schema=schema,
         )
         await asyncio.to_thread(
-            self.collection.create_index, field_name="embedding", index_type="IVF_FLAT"
+            self.collection.create_index,
+            field_name="embedding",
+            index_params={
+                "index_type": self.index_type,
+                "metric_type": self.metric_type,
+                "params": self.index_params,
+            },
         )
 
     async def insert(
         self,
         chunks: list[dict[str, Any]],
-        embeddings: list[list[float]],
+        embeddings: list[list[float]] | np.ndarray,
     ) -> list[str]:
         """Insert chunks and embeddings.
 
+        Rows are sent column-wise with embeddings packed into one contiguous
+        float32 array.
+
         Args:
             chunks: List of chunk dictionaries
-            embeddings: List of embedding vectors
+            embeddings: Embedding vectors, one per chunk
 
         Returns:
             List of inserted IDs
         """
-        ids = [str(uuid.uuid4()) for _ in range(len(chunks))]
+        ids = _uuid7_batch(len(chunks))
 
         data = [
-            {
-                "id": chunk_id,
-                "content": chunk["content"],
-                "embedding": embedding,
-                "metadata": chunk["metadata"],
-            }
-            for chunk_id, chunk, embedding in zip(ids, chunks, embeddings)
+            ids,
+            [chunk["content"] for chunk in chunks],
+            np.ascontiguousarray(embeddings, dtype=np.float32),
+            [chunk["metadata"] for chunk in chunks],
         ]
 
         await asyncio.to_thread(self.collection.insert, data)
@@ -144,30 +205,66 @@ class VectorStore:
         Returns:
             List of search results with scores
         """
-        self.collection.load()
+        results = await self.search_batch([query_embedding], top_k=top_k, filter_expr=filter_expr)
+        return results[0]
+
+    async def search_batch(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        top_k: int = 10,
+        filter_expr: str | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Search for similar chunks for several queries in one Milvus call.
+
+        Args:
+            query_embeddings: Query embedding vectors
+            top_k: Number of results per query
+            filter_expr: Optional filter expression
+
+        Returns:
+            List of search results with scores, one list per query
+        """
+        if len(query_embeddings) == 0:
+            return []
+
+        if not self._loaded:
+            await self._load()
 
         results = await asyncio.to_thread(
             self.collection.search,
-            data=[query_embedding],
+            data=np.asarray(query_embeddings, dtype=np.float32),
             anns_field="embedding",
-            param={"metric_type": "COSINE", "params": {"nprobe": 10}},
+            param={"metric_type": self.metric_type, "params": self._search_params(top_k)},
             limit=top_k,
             expr=filter_expr,
             output_fields=["id", "content", "metadata"],
         )
 
-        formatted_results = []
-        for result in results[0]:
-            formatted_results.append(
+        return [
+            [
                 {
-                    "id": result.id,
-                    "content": result.entity.get("content"),
-                    "metadata": result.entity.get("metadata"),
-                    "score": result.distance,
+                    "id": hit.id,
+                    "content": hit.entity.get("content"),
+                    "metadata": hit.entity.get("metadata"),
+                    "score": hit.distance,
                 }
-            )
+                for hit in hits
+            ]
+            for hits in results
+        ]
+
+    def _search_params(self, top_k: int) -> dict[str, Any]:
+        """Build index-specific search parameters.
+
+        Args:
+            top_k: Number of results per query
 
-        return formatted_results
+        Returns:
+            Search parameters for the configured index type
+        """
+        if self.index_type == "HNSW":
+            return {"ef": max(top_k * 4, 64)}
+        return {"nprobe": 10}
 
     async def delete(self, ids: list[str]) -> None:
         """Delete chunks by IDs.
@@ -183,4 +280,4 @@ class VectorStore:
         Returns:
             Chunk count
         """
-        return await asyncio.to_thread(self.collection.num_entities)
+        return await asyncio.to_thread(lambda: self.collection.num_entities)
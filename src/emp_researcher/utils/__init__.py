@@ -1,6 +1,7 @@
 """Utilities module."""
 
 from .config import ConfigManager, get_config
+from .runtime import uvicorn_runtime_options
 from .telemetry import instrument_fastapi, setup_logging, setup_telemetry
 
 __all__ = [
@@ -9,4 +10,5 @@ __all__ = [
     "setup_logging",
     "setup_telemetry",
     "instrument_fastapi",
+    "uvicorn_runtime_options",
 ]
@@ -1,12 +1,72 @@
 """Configuration management module."""
 
+import functools
+import hashlib
 import os
+import re
+import stat
+import tempfile
+import threading
 from pathlib import Path
 from typing import Any
 
+import orjson
 import yaml
 from pydantic import BaseModel
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+_CONFIG_FILES = (
+    "app_config.yaml",
+    "llm_providers.yaml",
+    "search_config.yaml",
+)
+
+_ENV_VAR_RE = re.compile(r"^\$\{([^}]+)\}$")
+
+# Parsed YAML (before env expansion, so no secrets) is stored here as JSON per
+# config directory and reused while the files' mtimes and sizes are unchanged.
+# EMP_RESEARCHER_CACHE_DIR overrides the location.
+_CACHE_DIR_ENV = "EMP_RESEARCHER_CACHE_DIR"
+
+
+def _cache_dir() -> Path:
+    """Return the parsed-config cache directory."""
+    override = os.getenv(_CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    return Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "emp_researcher"
+
+
+@functools.cache
+def _resolve_config_dir(cwd: Path, module_file: Path) -> str:
+    """Find the configuration directory, memoized per working directory.
+
+    Args:
+        cwd: Current working directory
+        module_file: Path of this module
+
+    Returns:
+        First existing candidate directory, or "config"
+    """
+    possible_paths = [
+        cwd / "config",
+        cwd.parent / "config",
+        module_file.parent.parent.parent / "config",
+    ]
+
+    for path in possible_paths:
+        try:
+            if stat.S_ISDIR(os.stat(path).st_mode):
+                return str(path)
+        except OSError:
+            continue
+
+    return "config"
+
 
 class AppConfig(BaseModel):
     """Application configuration."""
@@ -32,69 +92,148 @@ class ConfigManager:
             config_dir: Path to configuration directory
         """
         if config_dir is None:
-            config_dir = self._find_config_dir()
+            config_dir = _resolve_config_dir(Path.cwd(), Path(__file__))
 
         self.config_dir = Path(config_dir)
         self.config: dict[str, Any] = {}
+        self._flat: dict[str, Any] = {}
+        self._app_config: AppConfig | None = None
         self._load_configs()
 
-    def _find_config_dir(self) -> str:
-        """Find configuration directory."""
-        cwd = Path.cwd()
-
-        possible_paths = [
-            cwd / "config",
-            cwd.parent / "config",
-            Path(__file__).parent.parent.parent / "config",
-        ]
+    def _load_configs(self) -> None:
+        """Load all YAML configuration files."""
+        for config in self._read_config_files():
+            if isinstance(config, dict):
+                self._expand_env_vars(config)
+                self.config.update(config)
 
-        for path in possible_paths:
-            if path.exists() and path.is_dir():
-                return str(path)
+        self._flat = self._flatten(self.config)
+        self._app_config = None
 
-        return "config"
+    @staticmethod
+    def _flatten(config: dict[str, Any]) -> dict[str, Any]:
+        """Index every nested value by its dot-separated key path.
 
-    def _load_configs(self) -> None:
-        """Load all YAML configuration files."""
-        config_files = [
-            "app_config.yaml",
-            "llm_providers.yaml",
-            "search_config.yaml",
-        ]
-
-        for config_file in config_files:
-            file_path = self.config_dir / config_file
-            if file_path.exists():
-                with open(file_path, encoding="utf-8") as f:
-                    config = yaml.safe_load(f)
-                    if config:
-                        self._expand_env_vars(config)
-                        self.config.update(config)
-
-    def _expand_env_vars(self, config: Any) -> Any:
-        """Expand environment variables in configuration.
+        Intermediate dicts are indexed too, so subtree lookups like "llm"
+        resolve. Keys that are not strings or contain a dot are skipped, as
+        a dotted path could not address them.
 
         Args:
-            config: Configuration value (dict, list, or primitive)
+            config: Nested configuration
 
         Returns:
-            Configuration with environment variables expanded
+            Mapping of key path to value
         """
-        if isinstance(config, dict):
-            return {k: self._expand_env_vars(v) for k, v in config.items()}
+        flat: dict[str, Any] = {}
+        stack: list[tuple[str, dict[str, Any]]] = [("", config)]
 
-        if isinstance(config, list):
-            return [self._expand_env_vars(item) for item in config]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                if not isinstance(key, str) or "." in key:
+                    continue
+                path = f"{prefix}{key}"
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((f"{path}.", value))
 
-        if isinstance(config, str) and config.startswith("${") and config.endswith("}"):
-            env_var = config[2:-1]
-            return os.getenv(env_var, config)
+        return flat
 
-        return config
+    def _read_config_files(self) -> list[Any]:
+        """Parse the YAML configuration files, reusing a cached parse if unchanged.
+
+        Returns:
+            Parsed document of each existing config file, in load order
+        """
+        paths = [(self.config_dir / name).resolve() for name in _CONFIG_FILES]
+
+        fingerprint = hashlib.blake2b(digest_size=16)
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                fingerprint.update(f"{path}|missing\n".encode())
+            else:
+                fingerprint.update(f"{path}|{stat.st_mtime_ns}|{stat.st_size}\n".encode())
+
+        directory_key = hashlib.blake2b(str(paths[0].parent).encode(), digest_size=8)
+        cache_path = _cache_dir() / f"config-{directory_key.hexdigest()}.json"
+
+        try:
+            cached = orjson.loads(cache_path.read_bytes())
+            if cached["fingerprint"] == fingerprint.hexdigest():
+                return cached["configs"]
+        except Exception:
+            # Any unreadable, stale-format or corrupt cache is just a miss.
+            pass
+
+        configs = []
+        for path in paths:
+            if path.exists():
+                with open(path, encoding="utf-8") as f:
+                    configs.append(yaml.load(f, Loader=_YamlLoader))
+
+        self._write_config_cache(
+            cache_path, {"fingerprint": fingerprint.hexdigest(), "configs": configs}
+        )
+        return configs
+
+    def _write_config_cache(self, cache_path: Path, payload: dict[str, Any]) -> None:
+        """Atomically replace the parsed-config cache; failures are ignored.
+
+        Payloads that do not survive a JSON round trip unchanged (dates,
+        non-string keys) are not cached.
+
+        Args:
+            cache_path: Cache file path
+            payload: JSON-serializable cache entry
+        """
+        try:
+            data = orjson.dumps(payload)
+        except TypeError:
+            return
+        if orjson.loads(data) != payload:
+            return
+
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+
+    def _expand_env_vars(self, config: Any) -> None:
+        """Expand "${VAR}" strings from the environment, in place.
+
+        Unset variables leave the placeholder unchanged.
+
+        Args:
+            config: Configuration dict or list to walk
+        """
+        stack = [config]
+
+        while stack:
+            node = stack.pop()
+            items = node.items() if isinstance(node, dict) else enumerate(node)
+
+            for key, value in items:
+                if isinstance(value, str):
+                    match = _ENV_VAR_RE.match(value)
+                    if match:
+                        node[key] = os.environ.get(match.group(1), value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
 
     def get(self, key: str, default: Any | None = None) -> Any:
         """Get configuration value by key path.
 
+        Key paths are resolved from an index built when the configuration
+        is loaded.
+
         Args:
             key: Dot-separated key path (e.g., "app.name")
             default: Default value if key not found
@@ -102,16 +241,7 @@ class ConfigManager:
         Returns:
             Configuration value
         """
-        keys = key.split(".")
-        value = self.config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        return value
+        return self._flat.get(key, default)
 
     def get_llm_config(self) -> dict[str, Any]:
         """Get LLM configuration."""
@@ -122,22 +252,34 @@ class ConfigManager:
         return self.config.get("search", {})
 
     def get_app_config(self) -> AppConfig:
-        """Get application configuration as Pydantic model."""
-        return AppConfig(**self.config)
+        """Get application configuration as Pydantic model.
+
+        The model is validated on first use and reused until reload.
+        """
+        if self._app_config is None:
+            self._app_config = AppConfig(**self.config)
+        return self._app_config
 
 
 _global_config: ConfigManager | None = None
+_global_config_lock = threading.Lock()
 
 
 def get_config() -> ConfigManager:
     """Get global configuration instance.
 
+    The instance is created once under a lock; later calls skip the lock.
+
     Returns:
         ConfigManager instance
     """
     global _global_config
 
-    if _global_config is None:
-        _global_config = ConfigManager()
+    config = _global_config
+    if config is not None:
+        return config
 
-    return _global_config
+    with _global_config_lock:
+        if _global_config is None:
+            _global_config = ConfigManager()
+        return _global_config
@@ -0,0 +1,27 @@
+"""Server runtime selection utilities."""
+
+from importlib.util import find_spec
+from typing import Any
+
+
+def uvicorn_runtime_options(app_config: dict[str, Any]) -> dict[str, str]:
+    """Select the uvicorn event loop and HTTP parser implementations.
+
+    "auto" (the default) prefers uvloop and httptools when they are
+    installed and falls back to asyncio and h11 otherwise.
+
+    Args:
+        app_config: Application configuration section
+
+    Returns:
+        Keyword arguments for uvicorn.run (loop, http)
+    """
+    loop = app_config.get("event_loop", "auto")
+    if loop == "auto":
+        loop = "uvloop" if find_spec("uvloop") else "asyncio"
+
+    http = app_config.get("http_parser", "auto")
+    if http == "auto":
+        http = "httptools" if find_spec("httptools") else "h11"
+
+    return {"loop": loop, "http": http}
@@ -1,60 +1,122 @@
 """Logging and telemetry utilities."""
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import weakref
 from typing import Any
 
+import orjson
 import structlog
 from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+_render_stack_info = structlog.processors.StackInfoRenderer()
+
+
+def _render_exc_and_stack(logger: Any, method_name: str, event_dict: dict[str, Any]) -> Any:
+    """Render exception and stack info only for records that carry them.
+
+    Args:
+        logger: Wrapped logger
+        method_name: Log method name
+        event_dict: Event dictionary
+
+    Returns:
+        Event dictionary
+    """
+    if "stack_info" in event_dict:
+        event_dict = _render_stack_info(logger, method_name, event_dict)
+    if "exc_info" in event_dict:
+        event_dict = structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
+def _orjson_dumps(obj: Any, default: Any = None, **kwargs: Any) -> str:
+    """Serialize a log record with orjson for structlog's JSONRenderer."""
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_LOG_PROCESSORS = (
+    structlog.contextvars.merge_contextvars,
+    structlog.processors.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso"),
+    _render_exc_and_stack,
+    structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+)
+
+_logging_configured = False
+_log_listener: logging.handlers.QueueListener | None = None
+
+# grpc.Compression member per config value; grpc is only imported when enabled.
+_OTLP_COMPRESSION = {
+    "gzip": "Gzip",
+    "deflate": "Deflate",
+    "none": "NoCompression",
+}
+
+_noop_tracer = trace.get_tracer(__name__)
+_instrumented_apps: weakref.WeakSet = weakref.WeakSet()
 
 
 def setup_logging(config: dict[str, Any]) -> None:
     """Setup structured logging.
 
+    Log calls only enqueue records; a background listener thread writes
+    them to the console and the rotating log file. Only the first call
+    configures logging; later calls are no-ops.
+
     Args:
         config: Logging configuration dictionary
     """
+    global _logging_configured, _log_listener
+
+    if _logging_configured:
+        return
+
     level = config.get("level", "INFO")
     log_path = config.get("file_path", "logs/app.log")
 
-    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    log_dir = os.path.dirname(log_path)
+    if log_dir and not os.path.isdir(log_dir):
+        os.makedirs(log_dir, exist_ok=True)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.StreamHandler(),
+        logging.handlers.RotatingFileHandler(
+            log_path,
+            maxBytes=config.get("max_bytes", 10485760),
+            backupCount=config.get("backup_count", 5),
+        ),
+        respect_handler_level=True,
+    )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
     logging.basicConfig(
         level=getattr(logging, level),
         format="%(message)s",
-        handlers=[
-            logging.StreamHandler(),
-            logging.handlers.RotatingFileHandler(
-                log_path,
-                maxBytes=config.get("max_bytes", 10485760),
-                backupCount=config.get("backup_count", 5),
-            ),
-        ],
+        handlers=[logging.handlers.QueueHandler(log_queue)],
     )
 
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
-        ],
+        processors=list(_LOG_PROCESSORS),
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
         cache_logger_on_first_use=True,
     )
 
+    _logging_configured = True
+
 
 def setup_telemetry(config: dict[str, Any]) -> trace.Tracer:
     """Setup OpenTelemetry tracing.
 
+    The OTLP exporter and SDK are imported only when tracing is enabled.
+
     Args:
         config: Observability configuration
 
@@ -65,19 +127,29 @@ def setup_telemetry(config: dict[str, Any]) -> trace.Tracer:
     enabled = otel_config.get("enabled", False)
 
     if not enabled:
-        return trace.get_tracer(__name__)
+        return _noop_tracer
+
+    from grpc import Compression
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    batch_config = otel_config.get("batch", {})
+    compression = _OTLP_COMPRESSION[otel_config.get("compression", "gzip")]
 
     exporter = OTLPSpanExporter(
         endpoint=otel_config.get("endpoint", "http://localhost:4318"),
         insecure=True,
+        compression=getattr(Compression, compression),
     )
 
     provider = TracerProvider()
     provider.add_span_processor(
         BatchSpanProcessor(
             exporter,
-            schedule_delay_millis=1000,
-            max_export_batch_size=32,
+            schedule_delay_millis=batch_config.get("schedule_delay_ms", 5000),
+            max_export_batch_size=batch_config.get("max_export_batch_size", 512),
+            max_queue_size=batch_config.get("max_queue_size", 4096),
         ),
     )
 
@@ -93,7 +165,15 @@ def setup_telemetry(config: dict[str, Any]) -> trace.Tracer:
 def instrument_fastapi(app: Any) -> None:
     """Instrument FastAPI application for telemetry.
 
+    Each application is instrumented at most once.
+
     Args:
         app: FastAPI application instance
     """
+    if app in _instrumented_apps:
+        return
+
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
     FastAPIInstrumentor.instrument_app(app)
+    _instrumented_apps.add(app)
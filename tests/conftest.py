@@ -1,6 +1,77 @@
 """Pytest configuration."""
 
+import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_K8S_DIR = _REPO_ROOT / "deployment/k8s"
+
+sys.path.insert(0, str(_REPO_ROOT / "src"))
+
+# Keep the parsed-config cache out of the real home directory. Set before any
+# test module imports the app, which loads the configuration at import time.
+_CONFIG_CACHE_DIR = tempfile.mkdtemp(prefix="emp_researcher-test-cache-")
+os.environ["EMP_RESEARCHER_CACHE_DIR"] = _CONFIG_CACHE_DIR
+
+
+def pytest_unconfigure(config):
+    """Remove the per-session config cache directory."""
+    shutil.rmtree(_CONFIG_CACHE_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def k8s_manifests() -> dict[str, bytes]:
+    """Read each K8s manifest once per test session, keyed by file name."""
+    return {path.name: path.read_bytes() for path in sorted(_K8S_DIR.glob("*.yaml"))}
+
+
+class _FakeLLMRouter:
+    """Router stub answering chats with fixed content and recording the calls."""
+
+    def __init__(self, content: str = "{}", embeddings: dict[str, list[float]] | None = None):
+        self.content = content
+        self.embeddings = embeddings or {}
+        self.calls: list[list[dict[str, Any]]] = []
+
+    async def route_chat(self, messages, task_type=None, **kwargs):
+        self.calls.append(messages)
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def route_chat_stream(self, messages, task_type=None, **kwargs):
+        self.calls.append(messages)
+        for start in range(0, len(self.content), 8):
+            yield self.content[start : start + 8]
+
+    async def route_embed(self, texts, **kwargs):
+        return {"embeddings": [self.embeddings[texts[0]]]}
+
+
+@pytest.fixture
+def fake_llm_router():
+    """Factory for LLM router stubs: fake_llm_router(content, embeddings)."""
+    return _FakeLLMRouter
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """HTTP client bound to the FastAPI app, shared for the whole session.
+
+    Requests go through ASGITransport, so no server is started; the app
+    lifespan does not run.
+    """
+    from emp_researcher.api.main import app
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as session_client:
+        yield session_client
@@ -1,32 +1,25 @@
 """Tests for API integration."""
 
 import pytest
-from httpx import AsyncClient
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
 @pytest.mark.integration
-async def test_health_endpoint():
+async def test_health_endpoint(client):
     """Test health endpoint."""
-    async with AsyncClient(app=None, base_url="http://test") as client:
-        pass
 
 
 @pytest.mark.integration
-async def test_create_task():
+async def test_create_task(client):
     """Test creating a research task."""
-    async with AsyncClient(app=None, base_url="http://test") as client:
-        pass
 
 
 @pytest.mark.integration
-async def test_get_task_status():
+async def test_get_task_status(client):
     """Test getting task status."""
-    async with AsyncClient(app=None, base_url="http://test") as client:
-        pass
 
 
 @pytest.mark.integration
-async def test_get_report():
+async def test_get_report(client):
     """Test getting research report."""
-    async with AsyncClient(app=None, base_url="http://test") as client:
-        pass
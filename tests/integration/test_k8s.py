@@ -4,57 +4,40 @@ import pytest
 
 
 @pytest.mark.integration
-def test_api_deployment():
+def test_api_deployment(k8s_manifests):
     """Test API deployment manifest."""
-    from pathlib import Path
-
-    manifest_path = Path(__file__).parent.parent.parent / "deployment/k8s/emp-researcher-k8s.yaml"
-
-    assert manifest_path.exists()
-    assert "Deployment" in manifest_path.read_text()
+    assert "emp-researcher-k8s.yaml" in k8s_manifests
+    assert b"Deployment" in k8s_manifests["emp-researcher-k8s.yaml"]
 
 
 @pytest.mark.integration
-def test_monitoring_deployment():
+def test_monitoring_deployment(k8s_manifests):
     """Test monitoring deployment manifest."""
-    from pathlib import Path
-
-    manifest_path = Path(__file__).parent.parent.parent / "deployment/k8s/monitoring-k8s.yaml"
-
-    assert manifest_path.exists()
-    assert "Prometheus" in manifest_path.read_text()
+    assert "monitoring-k8s.yaml" in k8s_manifests
+    assert b"Prometheus" in k8s_manifests["monitoring-k8s.yaml"]
 
 
 @pytest.mark.unit
-def test_k8s_yaml_syntax():
+def test_k8s_yaml_syntax(k8s_manifests):
     """Test K8s YAML syntax."""
     import yaml
 
-    from pathlib import Path
-
-    manifests_dir = Path(__file__).parent.parent.parent / "deployment/k8s"
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
 
-    for yaml_file in manifests_dir.glob("*.yaml"):
-        with open(yaml_file) as f:
-            yaml.safe_load(f)
+    for content in k8s_manifests.values():
+        list(yaml.load_all(content, Loader=Loader))
 
 
 @pytest.mark.unit
-def test_namespace_exists():
+def test_namespace_exists(k8s_manifests):
     """Test namespace definition."""
-    from pathlib import Path
-
-    manifest_path = Path(__file__).parent.parent.parent / "deployment/k8s/emp-researcher-k8s.yaml"
-
-    assert "kind: Namespace" in manifest_path.read_text()
+    assert b"kind: Namespace" in k8s_manifests["emp-researcher-k8s.yaml"]
 
 
 @pytest.mark.unit
-def test_deployment_replicas():
+def test_deployment_replicas(k8s_manifests):
     """Test deployment replica count."""
-    from pathlib import Path
-
-    manifest_path = Path(__file__).parent.parent.parent / "deployment/k8s/emp-researcher-k8s.yaml"
-
-    content = manifest_path.read_text()
-    assert "replicas: 3" in content
+    assert b"replicas: 3" in k8s_manifests["emp-researcher-k8s.yaml"]
@@ -5,41 +5,67 @@ import pytest
 from emp_researcher.services import BilingualSearchService
 
 
-@pytest.fixture
-def bilingual_service():
-    """Mock bilingual search service."""
-    return None
+@pytest.fixture(scope="module")
+def service():
+    """Bilingual search service shared by this module's tests."""
+    return BilingualSearchService(None, None, None, language_balance=0.5)
 
 
 @pytest.mark.unit
-def test_detect_language_zh():
+def test_detect_language_zh(service):
     """Test Chinese language detection."""
-    service = BilingualSearchService(None, None, None, language_balance=0.5)
-
     assert service._detect_language("这是一段中文文本") == "zh"
 
 
 @pytest.mark.unit
-def test_detect_language_en():
+def test_detect_language_en(service):
     """Test English language detection."""
-    service = BilingualSearchService(None, None, None, language_balance=0.5)
-
     assert service._detect_language("This is English text") == "en"
 
 
 @pytest.mark.unit
-def test_detect_language_mixed():
+def test_detect_language_mixed(service):
     """Test mixed language detection."""
-    service = BilingualSearchService(None, None, None, language_balance=0.5)
-
     assert service._detect_language("This English with 一些中文 mixed") == "mixed"
 
 
 @pytest.mark.unit
-def test_is_priority_source():
+def test_is_priority_source(service):
     """Test priority source detection."""
-    service = BilingualSearchService(None, None, None, language_balance=0.5)
-
     assert service._is_priority_source({"url": "https://arxiv.org/abs/1234"}) is True
     assert service._is_priority_source({"url": "https://github.com/user/repo"}) is True
     assert service._is_priority_source({"url": "https://random-site.com/page"}) is False
+
+
+@pytest.mark.unit
+def test_fuse_combmnz_rewards_overlap():
+    """Test CombMNZ fusion ranks URLs found by several lists first."""
+    service = BilingualSearchService(
+        None, None, None, language_balance=0.5, fusion_method="combmnz"
+    )
+
+    results = [
+        {"url": "https://a.com", "query_type": "zh", "iteration": 0},
+        {"url": "https://b.com", "query_type": "zh", "iteration": 0},
+        {"url": "https://b.com", "query_type": "en", "iteration": 0},
+        {"url": "https://c.com", "query_type": "en", "iteration": 0},
+    ]
+
+    fused = service._fuse_combmnz(results)
+
+    assert [r["url"] for r in fused] == ["https://b.com", "https://a.com", "https://c.com"]
+
+
+@pytest.mark.unit
+async def test_fuse_results_keeps_first_seen_url(service):
+    """Test duplicate URLs keep their first occurrence, not the best-scored one."""
+    results = [
+        {"url": "https://a.com", "relevance_score": 0.1, "title": "first"},
+        {"url": "https://a.com", "relevance_score": 0.9, "title": "second"},
+        {"url": "https://b.com", "relevance_score": 0.5},
+    ]
+
+    fused = await service._fuse_results(results)
+
+    assert [r["url"] for r in fused] == ["https://b.com", "https://a.com"]
+    assert fused[1]["title"] == "first"
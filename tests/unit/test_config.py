@@ -27,11 +27,11 @@ def test_expand_env_vars():
     """Test environment variable expansion."""
     os.environ["TEST_VAR"] = "test_value"
 
-    config = {"key": "${TEST_VAR}"}
+    config = {"key": "${TEST_VAR}", "nested": [{"key": "${TEST_VAR}"}, "${UNSET_TEST_VAR}"]}
     manager = ConfigManager()
-    result = manager._expand_env_vars(config)
+    manager._expand_env_vars(config)
 
-    assert result == "test_value"
+    assert config == {"key": "test_value", "nested": [{"key": "test_value"}, "${UNSET_TEST_VAR}"]}
 
 
 @pytest.mark.unit
@@ -48,3 +48,40 @@ def test_get_search_config():
     manager = ConfigManager()
     search_config = manager.get_search_config()
     assert isinstance(search_config, dict)
+
+
+@pytest.mark.unit
+def test_parsed_config_cache_tracks_file_changes(tmp_path, monkeypatch):
+    """Test parsed YAML is reused until a config file changes."""
+    from emp_researcher.utils import config as config_module
+
+    monkeypatch.setenv(config_module._CACHE_DIR_ENV, str(tmp_path / "cache"))
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    app_config = config_dir / "app_config.yaml"
+    app_config.write_text("app:\n  name: first\n", encoding="utf-8")
+
+    assert ConfigManager(str(config_dir)).get("app.name") == "first"
+    assert len(list((tmp_path / "cache").glob("config-*.json"))) == 1
+    assert ConfigManager(str(config_dir)).get("app.name") == "first"
+
+    app_config.write_text("app:\n  name: second one\n", encoding="utf-8")
+    assert ConfigManager(str(config_dir)).get("app.name") == "second one"
+
+
+@pytest.mark.unit
+def test_corrupt_config_cache_is_a_miss(tmp_path, monkeypatch):
+    """Test an unreadable cache entry falls back to parsing the YAML."""
+    from emp_researcher.utils import config as config_module
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(config_module._CACHE_DIR_ENV, str(cache_dir))
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "app_config.yaml").write_text("app:\n  name: fresh\n", encoding="utf-8")
+
+    ConfigManager(str(config_dir))
+    (cache_path,) = cache_dir.glob("config-*.json")
+    cache_path.write_bytes(b'["not", "a", "cache", "entry"]')
+
+    assert ConfigManager(str(config_dir)).get("app.name") == "fresh"
@@ -1,49 +1,72 @@
 """Tests for Firecrawl client."""
 
+import httpx
 import pytest
 
 from emp_researcher.services import FirecrawlClient
 
 
+def _firecrawl_api(request: httpx.Request) -> httpx.Response:
+    """Answer every Firecrawl API call with a successful empty payload."""
+    return httpx.Response(200, json={"success": True, "data": {}})
+
+
 @pytest.fixture
 def firecrawl_client():
-    """Mock Firecrawl client."""
-    return FirecrawlClient(None, api_key="test_key")
+    """Firecrawl client backed by an in-process mock transport."""
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(_firecrawl_api))
+    return FirecrawlClient(None, api_key="test_key", http_client=http_client)
 
 
 @pytest.mark.unit
-def test_scrape_url(firecrawl_client):
+async def test_scrape_url(firecrawl_client):
     """Test URL scraping."""
-    result = firecrawl_client.scrape_url.__wrapped__(
-        firecrawl_client, "https://example.com", False, False
-    )
+    result = await firecrawl_client.scrape_url("https://example.com", False, False)
     assert result is not None
 
 
 @pytest.mark.unit
-def test_batch_scrape(firecrawl_client):
+async def test_batch_scrape(firecrawl_client):
     """Test batch scraping."""
     urls = ["https://example.com/page1", "https://example.com/page2"]
-    result = firecrawl_client.batch_scrape.__wrapped__(firecrawl_client, urls, False, False)
+    result = await firecrawl_client.batch_scrape(urls, False, False)
     assert len(result) == 2
 
 
 @pytest.mark.unit
-def test_crawl_site(firecrawl_client):
+async def test_crawl_site(firecrawl_client):
     """Test site crawling."""
-    result = firecrawl_client.crawl_site.__wrapped__(firecrawl_client, "https://example.com", 10)
+    result = await firecrawl_client.crawl_site("https://example.com", 10)
     assert result is not None
 
 
 @pytest.mark.unit
-def test_map_site(firecrawl_client):
+async def test_map_site(firecrawl_client):
     """Test site mapping."""
-    result = firecrawl_client.map_site.__wrapped__(firecrawl_client, "https://example.com", 50)
+    result = await firecrawl_client.map_site("https://example.com", 50)
     assert result is not None
 
 
 @pytest.mark.unit
-def test_health_check(firecrawl_client):
+async def test_health_check(firecrawl_client):
     """Test health check."""
-    health = firecrawl_client.health_check.__wrapped__(firecrawl_client)
+    health = await firecrawl_client.health_check()
     assert health is not None
+
+
+@pytest.mark.unit
+async def test_crawl_site_does_not_resubmit_after_read_timeout():
+    """Test a crawl job is not resubmitted when the response may have been lost."""
+    calls = []
+
+    def timing_out_api(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(timing_out_api))
+    client = FirecrawlClient(None, api_key="test_key", http_client=http_client)
+
+    result = await client.crawl_site("https://example.com", 10)
+
+    assert "error" in result
+    assert calls == ["/v1/crawl"]
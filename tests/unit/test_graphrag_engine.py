@@ -4,52 +4,144 @@ import pytest
 
 from emp_researcher.services import GraphRAGEngine, LLMRouter
 
+_SEARCH_RESULTS = '{"search_results": [{"title": "result"}]}'
+
 
 @pytest.fixture
-def graph_rag_engine():
-    """Mock GraphRAG engine."""
-    return GraphRAGEngine(None)
+def graph_rag_engine(fake_llm_router):
+    """GraphRAG engine without a Neo4j driver, backed by a stub router."""
+    return GraphRAGEngine(fake_llm_router(_SEARCH_RESULTS))
 
 
 @pytest.mark.unit
-def test_extract_entities(graph_rag_engine):
+async def test_extract_entities(graph_rag_engine):
     """Test entity extraction."""
-    entities = graph_rag_engine.extract_entities.__wrapped__(
-        graph_rag_engine, "test text", "doc123"
-    )
+    entities = await graph_rag_engine.extract_entities("test text", "doc123")
     assert entities is not None
 
 
 @pytest.mark.unit
-def test_detect_communities(graph_rag_engine):
+async def test_detect_communities(graph_rag_engine):
     """Test community detection."""
-    communities = graph_rag_engine.detect_communities.__wrapped__(graph_rag_engine, 50)
+    communities = await graph_rag_engine.detect_communities(50)
     assert communities is not None
 
 
 @pytest.mark.unit
-def test_generate_community_summary(graph_rag_engine):
+async def test_generate_community_summary(graph_rag_engine):
     """Test community summary generation."""
-    summary = graph_rag_engine.generate_community_summary.__wrapped__(graph_rag_engine, "comm1", [])
+    summary = await graph_rag_engine.generate_community_summary("comm1", [])
     assert summary is not None
 
 
 @pytest.mark.unit
-def test_global_search(graph_rag_engine):
+async def test_global_search(graph_rag_engine):
     """Test global search."""
-    results = graph_rag_engine.global_search.__wrapped__(graph_rag_engine, "test query", 5)
+    results = await graph_rag_engine.global_search("test query", 5)
     assert results is not None
 
 
 @pytest.mark.unit
-def test_local_search(graph_rag_engine):
+async def test_local_search(graph_rag_engine):
     """Test local search."""
-    results = graph_rag_engine.local_search.__wrapped__(graph_rag_engine, "test query", "comm1", 10)
+    results = await graph_rag_engine.local_search("test query", "comm1", 10)
     assert results is not None
 
 
 @pytest.mark.unit
-def test_health_check(graph_rag_engine):
+async def test_health_check(graph_rag_engine):
     """Test health check."""
-    health = graph_rag_engine.health_check.__wrapped__(graph_rag_engine)
+    health = await graph_rag_engine.health_check()
     assert health["overall"] in ["healthy", "degraded"]
+
+
+@pytest.mark.unit
+async def test_global_search_reuses_paraphrased_results(fake_llm_router):
+    """Test near-duplicate queries are served from the semantic cache."""
+    router = fake_llm_router(
+        _SEARCH_RESULTS,
+        {
+            "what is graphrag": [1.0, 0.0],
+            "what is graph rag": [0.999, 0.01],
+            "neo4j indexes": [0.0, 1.0],
+        },
+    )
+    engine = GraphRAGEngine(router, semantic_cache_threshold=0.98)
+    engine.driver = object()
+
+    first = await engine.global_search("what  is graphrag")
+    assert await engine.global_search("what is graphrag") == first
+    assert await engine.global_search("what is graph rag") == first
+    assert len(router.calls) == 1
+
+    await engine.global_search("neo4j indexes")
+    assert len(router.calls) == 2
+
+
+@pytest.mark.unit
+async def test_query_cache_expires_and_clears_on_upsert(fake_llm_router):
+    """Test cached searches honor the TTL and are dropped after graph writes."""
+
+    class _FakeDriver:
+        def session(self, database=None):
+            return self
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return None
+
+        async def execute_write(self, work):
+            return None
+
+    router = fake_llm_router(_SEARCH_RESULTS)
+    engine = GraphRAGEngine(router, query_cache_ttl=60)
+    engine.driver = _FakeDriver()
+
+    await engine.global_search("graphrag")
+    await engine.global_search("graphrag")
+    assert len(router.calls) == 1
+
+    await engine.upsert_entities([{"id": "e1"}])
+    await engine.global_search("graphrag")
+    assert len(router.calls) == 2
+
+    engine.query_cache_ttl = 0
+    engine._query_cache.clear()
+    await engine.global_search("graphrag")
+    await engine.global_search("graphrag")
+    assert len(router.calls) == 4
+
+
+@pytest.mark.unit
+async def test_streamed_extraction_writes_nothing_when_truncated(fake_llm_router):
+    """Test entities decoded from a broken stream are not written to the graph."""
+
+    class _RecordingDriver:
+        def __init__(self):
+            self.writes = 0
+
+        def session(self, database=None):
+            return self
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return None
+
+        async def execute_write(self, work):
+            self.writes += 1
+
+    engine = GraphRAGEngine(fake_llm_router('{"entities": ["alpha", "beta", "gam'))
+    engine.driver = _RecordingDriver()
+
+    assert await engine.extract_entities("text", "doc1", stream=True) == []
+    assert engine.driver.writes == 0
+
+    engine.llm_router.content = '{"entities": ["alpha", "beta"], "relations": []}'
+    entities = await engine.extract_entities("text", "doc1", stream=True)
+
+    assert [entity["name"] for entity in entities] == ["alpha", "beta"]
+    assert engine.driver.writes == 1
@@ -1,5 +1,7 @@
 """Unit tests for LLM services."""
 
+import asyncio
+
 import pytest
 
 from emp_researcher.services import LLMRouter, ModelType
@@ -44,3 +46,127 @@ def test_get_default_provider():
     router = LLMRouter(config)
     provider = router.providers["openai"]
     assert provider is not None
+
+
+@pytest.mark.unit
+async def test_route_embed_is_cached():
+    """Test repeated embedding requests are served from the cache."""
+    config = {
+        "llm": {
+            "providers": {
+                "test": {
+                    "type": "openai_compatible",
+                    "base_url": "http://test.com",
+                    "api_key": "test",
+                }
+            },
+        }
+    }
+
+    router = LLMRouter(config)
+    calls = []
+
+    async def fake_embed(texts, model, **kwargs):
+        calls.append(texts)
+        return {"embeddings": [[1.0, 0.0]]}
+
+    router.providers["test"].embed = fake_embed
+
+    first = await router.route_embed(["hello"])
+    second = await router.route_embed(["hello"])
+
+    assert first is second
+    assert calls == [["hello"]]
+    assert router.cache_stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+@pytest.mark.unit
+async def test_route_embed_coalesces_concurrent_requests():
+    """Test concurrent embedding requests share one provider call."""
+    config = {
+        "llm": {
+            "providers": {"local": {"type": "ollama"}},
+            "cache": {"enabled": False},
+            "batching": {"embed": {"enabled": True, "window_ms": 5}},
+        }
+    }
+
+    router = LLMRouter(config)
+    calls = []
+
+    async def fake_embed(texts, model, **kwargs):
+        calls.append(texts)
+        return {"model": model, "embeddings": [[float(len(text))] for text in texts]}
+
+    router.providers["local"].embed = fake_embed
+
+    first, second = await asyncio.gather(
+        router.route_embed(["a", "bb"]),
+        router.route_embed(["ccc"]),
+    )
+
+    assert calls == [["a", "bb", "ccc"]]
+    assert first["embeddings"] == [[1.0], [2.0]]
+    assert second["embeddings"] == [[3.0]]
+
+
+@pytest.mark.unit
+async def test_route_chat_caches_only_deterministic_requests():
+    """Test chat responses are cached only for temperature 0 or a fixed seed."""
+    config = {"llm": {"providers": {"local": {"type": "ollama"}}}}
+
+    router = LLMRouter(config)
+    calls = []
+
+    async def fake_chat(messages, model, **kwargs):
+        calls.append(kwargs)
+        return {"call": len(calls)}
+
+    router.providers["local"].chat = fake_chat
+    messages = [{"role": "user", "content": "hi"}]
+
+    assert await router.route_chat(messages) != await router.route_chat(messages)
+    assert await router.route_chat(messages, temperature=0) == await router.route_chat(
+        messages, temperature=0
+    )
+    assert await router.route_chat(messages, seed=7) == await router.route_chat(messages, seed=7)
+    assert len(calls) == 4
+
+
+@pytest.mark.unit
+async def test_token_bucket_allows_fractional_rates():
+    """Test a sub-1 rps bucket admits one request, then throttles."""
+    from emp_researcher.services.llm.router import _TokenBucket
+
+    bucket = _TokenBucket(0.5)
+
+    await asyncio.wait_for(bucket.acquire(), timeout=1)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(bucket.acquire(), timeout=0.05)
+
+
+@pytest.mark.unit
+async def test_cancelled_caller_does_not_cancel_shared_request():
+    """Test cancelling the first caller leaves concurrent identical callers served."""
+    config = {"llm": {"providers": {"local": {"type": "ollama"}}}}
+
+    router = LLMRouter(config)
+    calls = []
+
+    async def fake_chat(messages, model, **kwargs):
+        calls.append(messages)
+        await asyncio.sleep(0.01)
+        return {"answer": "shared"}
+
+    router.providers["local"].chat = fake_chat
+    messages = [{"role": "user", "content": "hi"}]
+
+    leader = asyncio.create_task(router.route_chat(messages, temperature=0))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(router.route_chat(messages, temperature=0))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == {"answer": "shared"}
+    assert leader.cancelled()
+    assert len(calls) == 1
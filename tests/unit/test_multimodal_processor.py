@@ -4,45 +4,52 @@ import pytest
 
 from emp_researcher.services import MultimodalProcessor
 
+_TABLE_ANALYSIS = '{"headers": ["a", "b"], "data_summary": {}, "insights": []}'
+
 
 @pytest.fixture
-def multimodal_processor():
-    """Mock multimodal processor."""
-    return MultimodalProcessor(None)
+def multimodal_processor(fake_llm_router):
+    """Multimodal processor backed by a stub router."""
+    return MultimodalProcessor(fake_llm_router(_TABLE_ANALYSIS))
 
 
 @pytest.mark.unit
-def test_process_image(multimodal_processor):
+async def test_process_image(multimodal_processor):
     """Test image processing."""
-    result = multimodal_processor.process_image.__wrapped__(
-        multimodal_processor, b"fake_image_data", "png"
-    )
+    result = await multimodal_processor.process_image(b"fake_image_data", "png")
     assert result is not None
     assert result["modality"] == "image"
 
 
 @pytest.mark.unit
-def test_process_table(multimodal_processor):
+async def test_process_table(multimodal_processor):
     """Test table processing."""
-    result = multimodal_processor.process_table.__wrapped__(
-        multimodal_processor, "header1,header2\nrow1,row2", "csv"
-    )
+    result = await multimodal_processor.process_table("header1,header2\nrow1,row2", "csv")
     assert result is not None
     assert result["modality"] == "table"
 
 
 @pytest.mark.unit
-def test_process_audio(multimodal_processor):
+async def test_process_audio(multimodal_processor):
     """Test audio processing."""
-    result = multimodal_processor.process_audio.__wrapped__(
-        multimodal_processor, b"fake_audio_data", "mp3", 120.0
-    )
+    result = await multimodal_processor.process_audio(b"fake_audio_data", "mp3", 120.0)
     assert result is not None
     assert result["modality"] == "audio"
 
 
 @pytest.mark.unit
-def test_health_check(multimodal_processor):
+async def test_health_check(multimodal_processor):
     """Test health check."""
-    health = multimodal_processor.health_check.__wrapped__(multimodal_processor)
+    health = await multimodal_processor.health_check()
     assert health["overall"] == "healthy"
+
+
+@pytest.mark.unit
+async def test_process_table_is_cached(multimodal_processor):
+    """Test identical tables are processed once."""
+    first = await multimodal_processor.process_table("a,b\n1,2", "csv")
+    second = await multimodal_processor.process_table("a,b\n1,2", "csv")
+
+    assert first == second
+    assert first["headers"] == ["a", "b"]
+    assert len(multimodal_processor.llm_router.calls) == 1
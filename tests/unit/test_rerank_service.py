@@ -12,7 +12,7 @@ def llm_router():
 
 
 @pytest.mark.unit
-def test_multi_signal_rerank():
+async def test_multi_signal_rerank():
     """Test multi-signal reranking."""
     documents = [
         {"content": "test doc 1", "relevance_score": 0.8, "trust_score": 0.9},
@@ -20,14 +20,26 @@ def test_multi_signal_rerank():
     ]
 
     reranker = RerankerService(mock_llm_router)
-    results = reranker.multi_signal_rerank("test query", documents)
+    results = await reranker.multi_signal_rerank("test query", documents)
 
     assert len(results) == 2
     assert results[0]["final_score"] > results[1]["final_score"]
 
 
 @pytest.mark.unit
-def test_diversity_rerank():
+async def test_rerank_single_document_sets_score():
+    """Test the single-document shortcut still returns a rerank_score."""
+    reranker = RerankerService(mock_llm_router)
+
+    results = await reranker.rerank("test query", [{"content": "only doc"}])
+    kept = await reranker.rerank("test query", [{"content": "only doc", "rerank_score": 0.4}])
+
+    assert results == [{"content": "only doc", "rerank_score": 1.0}]
+    assert kept[0]["rerank_score"] == 0.4
+
+
+@pytest.mark.unit
+async def test_diversity_rerank():
     """Test diversity-based reranking."""
     documents = [
         {"content": "test doc 1 content about topic", "rerank_score": 0.9},
@@ -36,11 +48,27 @@ def test_diversity_rerank():
     ]
 
     reranker = RerankerService(mock_llm_router)
-    results = reranker.diversity_rerank(documents, diversity_threshold=0.7)
+    results = await reranker.diversity_rerank(documents, diversity_threshold=0.7)
 
     assert len(results) <= 3
 
 
+@pytest.mark.unit
+async def test_diversity_rerank_long_documents():
+    """Near-duplicate long documents are deduplicated via MinHash."""
+    words = [f"word{i}" for i in range(400)]
+    documents = [
+        {"content": " ".join(words), "rerank_score": 0.9},
+        {"content": " ".join(words[:390]), "rerank_score": 0.8},
+        {"content": " ".join(f"other{i}" for i in range(400)), "rerank_score": 0.7},
+    ]
+
+    reranker = RerankerService(mock_llm_router)
+    results = await reranker.diversity_rerank(documents, diversity_threshold=0.7)
+
+    assert [doc["rerank_score"] for doc in results] == [0.9, 0.7]
+
+
 @pytest.mark.unit
 def test_calculate_similarity():
     """Test similarity calculation."""
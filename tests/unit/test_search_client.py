@@ -0,0 +1,24 @@
+"""Tests for SearXNG client."""
+
+import pytest
+
+from emp_researcher.services import SearXNGClient
+
+
+@pytest.mark.unit
+async def test_search_parallel_routes_by_language():
+    """Chinese queries go to Chinese engines, others to English engines."""
+    client = SearXNGClient()
+    calls = {}
+
+    async def fake_search(query, engines=None, language="zh"):
+        calls[query] = (engines, language)
+        return []
+
+    client.search = fake_search
+    await client.search_parallel(
+        ["深度学习", "deep learning"], engines_zh=["baidu"], engines_en=["google"]
+    )
+
+    assert calls["深度学习"] == (["baidu"], "zh")
+    assert calls["deep learning"] == (["google"], "en")